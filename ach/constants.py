@@ -120,6 +120,23 @@ class AutoDateInput(enum.Enum):
         return self.name
 
 
+class ValidationLevel(enum.Enum):
+    """
+    How thoroughly input values are checked when records are created.
+
+    STRICT corrects and validates every value against its FieldType.
+    FAST only runs a cheap character-class check on values of FieldTypes
+    with single character class regexes, falling back to STRICT
+    for values that fail it and for all other FieldTypes.
+    TRUSTED skips correction and validation and only pads or truncates values;
+    use it only for input known to be valid, like files generated by this package.
+    """
+
+    STRICT = "strict"
+    FAST = "fast"
+    TRUSTED = "trusted"
+
+
 RECORD_SIZE = 94
 
 FILE_HEADER_RECORD_TYPE_CODE = 1
@@ -1,5 +1,18 @@
 """Defines file structure along with ways to translate to and from a flat ACH file."""
 
+from .columnar import (
+    compute_batch_control_totals,
+    compute_file_control_totals,
+    read_entry_integer_columns,
+    read_entry_records,
+    read_records,
+)
 from .file_builder import ACHFileBuilder, NoBatchForTransactionError
-from .file_parser import ACHFileContentsParser
+from .file_parser import (
+    ACHFileContentsParser,
+    BatchControlWithoutBatchHeaderError,
+    MissingFileRecordError,
+)
 from .file_structure import ACHFileContents, ACHBatch, ACHTransactionEntry
+from .file_verifier import ControlTotalMismatch, verify_controls
+from .file_writer import ACHStreamWriter
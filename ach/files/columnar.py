@@ -0,0 +1,316 @@
+"""
+Defines columnar views of the records of an ACH file for analytics,
+and control totals computed from them.
+
+NumPy is optional; install it with `pip install ach-file[numpy]`.
+Without it, read_entry_integer_columns and compute_batch_control_totals
+fall back to reading lines one by one; the other functions need NumPy.
+"""
+
+from array import array
+from typing import Dict, List, Tuple, Type, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from ..constants import (
+    ADDENDA_RECORD_TYPE_CODE,
+    BATCH_HEADER_RECORD_TYPE_CODE,
+    ENTRY_DETAIL_RECORD_TYPE_CODE,
+    TransactionCode,
+)
+from ..record_types import EntryDetailRecordType, RecordType
+from ..record_types.record_layout import RAW_LINE_ENCODING
+from .file_structure import ControlTotals
+
+ENTRY_INTEGER_FIELD_NAMES = ("transaction_code", "rdfi_routing", "amount")
+ENTRY_DETAIL_RECORD_TYPE_CODE_BYTES = str(ENTRY_DETAIL_RECORD_TYPE_CODE).encode(
+    RAW_LINE_ENCODING
+)
+BATCH_HEADER_RECORD_TYPE_CODE_BYTES = str(BATCH_HEADER_RECORD_TYPE_CODE).encode(
+    RAW_LINE_ENCODING
+)
+ADDENDA_RECORD_TYPE_CODE_BYTES = str(ADDENDA_RECORD_TYPE_CODE).encode(RAW_LINE_ENCODING)
+ENTRY_HASH_DIGIT_COUNT = 8
+LINE_BREAK_BYTES = b"\r\n"
+DEBIT_TRANSACTION_CODES = frozenset(x.value for x in TransactionCode if x.is_debit())
+
+
+class NumpyNotInstalledError(ImportError):
+    """
+    Raise when a columnar reader that needs NumPy is used
+    and NumPy is not installed.
+    """
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise NumpyNotInstalledError(
+            "NumPy is required for structured array columns;"
+            " install it with pip install ach-file[numpy]"
+        )
+
+
+def _get_fixed_width_lines(
+    buffer: Union[bytes, bytearray, memoryview], line_break: str, record_size: int
+) -> Tuple[memoryview, int, int]:
+    """
+    Get a byte view of ACH file contents without trailing line breaks,
+    its number of lines and the distance between the starts of lines.
+    """
+    view = memoryview(buffer).cast("B")
+    end = len(view)
+    while end and view[end - 1] in LINE_BREAK_BYTES:
+        end -= 1
+    stride = record_size + len(line_break)
+    record_count = (end + len(line_break)) // stride
+    if end and record_count * stride - len(line_break) != end:
+        raise ValueError(
+            "ACH file contents of {} bytes do not consist of"
+            " {}-byte lines separated by {!r}".format(end, record_size, line_break)
+        )
+    return view[:end], record_count, stride
+
+
+def get_record_dtype(
+    record_type_class: Type[RecordType] = EntryDetailRecordType,
+) -> "np.dtype":
+    """
+    Get a NumPy structured dtype for records of record_type_class
+    with one S<n> sub-field per field at its fixed offset.
+    """
+    _require_numpy()
+    record_layout = record_type_class.get_record_layout()
+    return np.dtype(
+        {
+            "names": list(record_layout.field_names),
+            "formats": ["S{}".format(x.end - x.start) for x in record_layout],
+            "offsets": [x.start for x in record_layout],
+            "itemsize": record_layout.record_size,
+        }
+    )
+
+
+def read_records(
+    buffer: Union[bytes, bytearray, memoryview],
+    line_break: str = "\n",
+    record_type_class: Type[RecordType] = EntryDetailRecordType,
+) -> "np.ndarray":
+    """
+    Get a zero-copy structured array over every record line of ACH file
+    contents given as bytes, a bytearray, a memoryview or an mmap,
+    typed as record_type_class records (see get_record_dtype).
+    All record types start with record_type_code, so it can be used
+    to select records of any type.
+
+    Every line must be exactly as long as the record size and end with
+    line_break; the last line may end with any line break characters or none.
+    Raises ValueError if the contents do not have fixed-width lines.
+    """
+    _require_numpy()
+    record_size = record_type_class.get_record_layout().record_size
+    view, record_count, stride = _get_fixed_width_lines(buffer, line_break, record_size)
+    separator = line_break.encode(RAW_LINE_ENCODING)
+    if record_count > 1 and separator:
+        separators = np.ndarray(
+            (record_count - 1,),
+            dtype="S{}".format(len(separator)),
+            buffer=view,
+            offset=record_size,
+            strides=(stride,),
+        )
+        if (separators != separator).any():
+            raise ValueError(
+                "ACH file contents have lines not separated by {!r}".format(line_break)
+            )
+    return np.ndarray(
+        (record_count,),
+        dtype=get_record_dtype(record_type_class),
+        buffer=view,
+        strides=(stride,),
+    )
+
+
+def read_entry_records(
+    buffer: Union[bytes, bytearray, memoryview], line_break: str = "\n"
+) -> "np.ndarray":
+    """
+    Get a structured array of all entry detail records of ACH file contents
+    (see read_records).
+    Selecting entry records copies their bytes into a new array,
+    still without creating any Python objects per record.
+    """
+    records = read_records(buffer, line_break, EntryDetailRecordType)
+    return records[records["record_type_code"] == ENTRY_DETAIL_RECORD_TYPE_CODE_BYTES]
+
+
+def get_integer_column(records: "np.ndarray", field_name: str) -> "np.ndarray":
+    """
+    Convert a digits-only field of a structured array of records
+    into an int64 column, digit by digit with vectorized operations.
+    Raises ValueError if any value contains a character other than a digit.
+    """
+    _require_numpy()
+    column = records[field_name]
+    length = column.dtype.itemsize
+    digits = column.view((np.uint8, length)).astype(np.int64) - ord("0")
+    if ((digits < 0) | (digits > 9)).any():
+        raise ValueError("Field {} has non-digit values".format(field_name))
+    return digits @ (10 ** np.arange(length - 1, -1, -1, dtype=np.int64))
+
+
+def get_entry_integer_columns(entries: "np.ndarray") -> Dict[str, "np.ndarray"]:
+    """
+    Get int64 columns of the transaction_code, rdfi_routing and amount fields
+    of a structured array of entry detail records.
+    """
+    return {x: get_integer_column(entries, x) for x in ENTRY_INTEGER_FIELD_NAMES}
+
+
+def read_entry_integer_columns(
+    buffer: Union[bytes, bytearray, memoryview], line_break: str = "\n"
+) -> Dict[str, Union["np.ndarray", array]]:
+    """
+    Get integer columns of the transaction_code, rdfi_routing and amount fields
+    of all entry detail records of ACH file contents.
+
+    Returns NumPy int64 arrays if NumPy is installed; otherwise falls back
+    to reading each entry line's fields into array.array("q") columns.
+    Raises ValueError if the contents do not have fixed-width lines.
+    """
+    if np is not None:
+        return get_entry_integer_columns(read_entry_records(buffer, line_break))
+
+    record_layout = EntryDetailRecordType.get_record_layout()
+    slices = [record_layout[x].field_slice for x in ENTRY_INTEGER_FIELD_NAMES]
+    columns = [array("q") for _ in ENTRY_INTEGER_FIELD_NAMES]
+    view, record_count, stride = _get_fixed_width_lines(
+        buffer, line_break, record_layout.record_size
+    )
+    for start in range(0, record_count * stride, stride):
+        line = view[start : start + record_layout.record_size]
+        if line[:1] != ENTRY_DETAIL_RECORD_TYPE_CODE_BYTES:
+            continue
+        for field_name, column, field_slice in zip(
+            ENTRY_INTEGER_FIELD_NAMES, columns, slices
+        ):
+            value = bytes(line[field_slice])
+            if not value.isdigit():
+                raise ValueError("Field {} has non-digit values".format(field_name))
+            column.append(int(value))
+    return dict(zip(ENTRY_INTEGER_FIELD_NAMES, columns))
+
+
+def compute_batch_control_totals(
+    buffer: Union[bytes, bytearray, memoryview], line_break: str = "\n"
+) -> List[ControlTotals]:
+    """
+    Get the ControlTotals of every batch of ACH file contents, in batch order,
+    computed from entry detail and addenda lines with a few vectorized
+    NumPy operations, or line by line if NumPy is not installed.
+    Matches ACHBatch.get_control_totals of the parsed file.
+
+    Works on the contents of built files too, like ACHFileBuilder.render_bytes().
+    Raises ValueError if the contents do not have fixed-width lines,
+    if an entry or addenda comes before the first batch header
+    or if a transaction code is not a TransactionCode.
+    """
+    if np is None:
+        return _compute_batch_control_totals_by_line(buffer, line_break)
+
+    records = read_records(buffer, line_break)
+    record_type_codes = records["record_type_code"]
+    is_batch_header = record_type_codes == BATCH_HEADER_RECORD_TYPE_CODE_BYTES
+    is_entry = record_type_codes == ENTRY_DETAIL_RECORD_TYPE_CODE_BYTES
+    is_entry_or_addenda = is_entry | (
+        record_type_codes == ADDENDA_RECORD_TYPE_CODE_BYTES
+    )
+    batch_count = int(is_batch_header.sum())
+    batch_indexes = np.cumsum(is_batch_header) - 1
+    if (batch_indexes[is_entry_or_addenda] < 0).any():
+        raise ValueError("ACH file contents have entries outside of a batch")
+
+    entry_batch_indexes = batch_indexes[is_entry]
+    entry_hashes, amounts, is_debit = _get_entry_control_columns(records[is_entry])
+
+    counts = np.bincount(
+        batch_indexes[is_entry_or_addenda], minlength=batch_count
+    ).astype(np.int64)
+    sums = np.zeros((3, batch_count), dtype=np.int64)
+    np.add.at(sums[0], entry_batch_indexes, entry_hashes)
+    np.add.at(sums[1], entry_batch_indexes[is_debit], amounts[is_debit])
+    np.add.at(sums[2], entry_batch_indexes[~is_debit], amounts[~is_debit])
+    return [
+        ControlTotals(*x) for x in zip(counts.tolist(), *(y.tolist() for y in sums))
+    ]
+
+
+def _get_entry_control_columns(entries: "np.ndarray") -> Tuple["np.ndarray", ...]:
+    """
+    Get the entry hashes, amounts and debit flags of entry detail records
+    read by read_records, as integer and boolean arrays.
+    """
+    transaction_codes = get_integer_column(entries, "transaction_code")
+    if not np.isin(transaction_codes, [x.value for x in TransactionCode]).all():
+        raise ValueError("ACH file contents have invalid transaction codes")
+    routing_length = entries.dtype.fields["rdfi_routing"][0].itemsize
+    return (
+        get_integer_column(entries, "rdfi_routing")
+        // 10 ** max(routing_length - ENTRY_HASH_DIGIT_COUNT, 0),
+        get_integer_column(entries, "amount"),
+        np.isin(transaction_codes, list(DEBIT_TRANSACTION_CODES)),
+    )
+
+
+def compute_file_control_totals(
+    buffer: Union[bytes, bytearray, memoryview], line_break: str = "\n"
+) -> ControlTotals:
+    """
+    Get the ControlTotals of ACH file contents, the sum of the ControlTotals
+    of all batches (see compute_batch_control_totals).
+    Matches ACHFileContents.get_control_totals of the parsed file.
+    """
+    return sum(compute_batch_control_totals(buffer, line_break), ControlTotals())
+
+
+def _compute_batch_control_totals_by_line(
+    buffer: Union[bytes, bytearray, memoryview], line_break: str
+) -> List[ControlTotals]:
+    record_layout = EntryDetailRecordType.get_record_layout()
+    transaction_code_slice = record_layout["transaction_code"].field_slice
+    routing_slice = record_layout["rdfi_routing"].field_slice
+    entry_hash_slice = slice(
+        routing_slice.start, routing_slice.start + ENTRY_HASH_DIGIT_COUNT
+    )
+    amount_slice = record_layout["amount"].field_slice
+    view, record_count, stride = _get_fixed_width_lines(
+        buffer, line_break, record_layout.record_size
+    )
+
+    # Batch sums in ControlTotals order, as a flat array of 4 sums per batch.
+    sums = array("q")
+    for start in range(0, record_count * stride, stride):
+        line = view[start : start + record_layout.record_size]
+        record_type_code = line[:1]
+        if record_type_code == BATCH_HEADER_RECORD_TYPE_CODE_BYTES:
+            sums.extend((0, 0, 0, 0))
+            continue
+        if record_type_code not in (
+            ENTRY_DETAIL_RECORD_TYPE_CODE_BYTES,
+            ADDENDA_RECORD_TYPE_CODE_BYTES,
+        ):
+            continue
+        if not sums:
+            raise ValueError("ACH file contents have entries outside of a batch")
+        sums[-4] += 1
+        if record_type_code == ADDENDA_RECORD_TYPE_CODE_BYTES:
+            continue
+        sums[-3] += int(bytes(line[entry_hash_slice]))
+        amount = int(bytes(line[amount_slice]))
+        if TransactionCode(int(bytes(line[transaction_code_slice]))).is_debit():
+            sums[-2] += amount
+        else:
+            sums[-1] += amount
+    return [ControlTotals(*sums[i : i + 4]) for i in range(0, len(sums), 4)]
@@ -1,13 +1,18 @@
 """Defines an ACH file builder."""
 
-from typing import Any, Dict, List, Tuple
+from abc import ABC, abstractmethod
+from itertools import repeat
+from typing import IO, Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from ..constants import ValidationLevel
 from ..record_types import (
     AddendaRecordType,
     BatchHeaderRecordType,
     EntryDetailRecordType,
     FieldDefinition,
     FileHeaderRecordType,
+    InvalidRecordTypeParametersError,
+    RecordTypeAggregateFieldCreationError,
 )
 from .file_structure import ACHBatch, ACHFileContents, ACHTransactionEntry
 
@@ -19,22 +24,118 @@ class NoBatchForTransactionError(Exception):
     """
 
 
-class ACHFileBuilder:
-    """Builds an ACHFileContents object."""
+class ACHRecordKwargsMixin(ABC):
+    """
+    Fills in the default fields of batch header, entry detail
+    and addenda records from the batches and transactions added so far.
+    Shared by ACHFileBuilder and ACHStreamWriter, which count
+    the batches and transactions added so far.
+    """
 
-    ach_file_contents_class = ACHFileContents
-    ach_batch_class = ACHBatch
+    # pylint: disable=too-few-public-methods
     ach_transaction_entry_class = ACHTransactionEntry
-    file_header_record_type_class = FileHeaderRecordType
     batch_header_record_type_class = BatchHeaderRecordType
     entry_detail_record_type_class = EntryDetailRecordType
     addenda_record_type_class = AddendaRecordType
+    validation_level: ValidationLevel
+    default_odfi_identification: str
+
+    @staticmethod
+    def _get_default_odfi_identification(file_settings: Dict[str, Any]) -> str:
+        return file_settings.get("destination_routing", "").lstrip()[:8]
+
+    @abstractmethod
+    def _get_batch_count(self) -> int:
+        """Get the number of batches added so far."""
+
+    @abstractmethod
+    def _get_transaction_count(self) -> int:
+        """Get the number of transactions added so far."""
+
+    def _update_batch_settings(self, batch_settings: Dict[str, Any]) -> None:
+        update_batch_settings = {
+            "odfi_identification": self.default_odfi_identification,
+            "batch_number": self._get_batch_count() + 1,
+        }
+        for k, val in update_batch_settings.items():
+            if k not in batch_settings:
+                batch_settings[k] = val
+
+    def _convert_entry_detail_kwargs_to_ach_transaction_entry(
+        self, **entry_details
+    ) -> ACHTransactionEntry:
+        addenda_list_kwargs = self._update_entry_detail_kwargs(entry_details)
+
+        entry_record = self.entry_detail_record_type_class(
+            validation_level=self.validation_level, **entry_details
+        )
+        addenda_records = []
+
+        for i, addenda_kwargs in enumerate(addenda_list_kwargs):
+            self._update_addenda_record_kwargs(
+                addenda_kwargs,
+                entry_details.get("trace_sequence_number"),
+                addenda_sequence_num=i + 1,
+            )
+            addenda_records.append(
+                self.addenda_record_type_class(
+                    validation_level=self.validation_level, **addenda_kwargs
+                )
+            )
+
+        return self.ach_transaction_entry_class(entry_record, addenda_records)
+
+    def _update_entry_detail_kwargs(
+        self, entry_details: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        raw_addendas = []
+        if "addendas" in entry_details:
+            raw_addendas = entry_details.pop("addendas")
 
-    def __init__(self, **file_settings):
+        update_entry = {
+            "addenda_record_indicator": len(raw_addendas),
+            "trace_odfi_identifier": self.default_odfi_identification,
+            "trace_sequence_number": self._get_transaction_count() + 1,
+        }
+        for k, val in update_entry.items():
+            if k not in entry_details:
+                entry_details[k] = val
+        return raw_addendas
+
+    def _update_addenda_record_kwargs(
+        self,
+        addenda_kwargs: Dict[str, Any],
+        entry_detail_sequence_num: int,
+        addenda_sequence_num: int,
+    ) -> None:
+        update_entry = {
+            "entry_detail_sequence_number": entry_detail_sequence_num,
+            "addenda_sequence_number": addenda_sequence_num,
+        }
+        for k, val in update_entry.items():
+            if k not in addenda_kwargs:
+                addenda_kwargs[k] = val
+
+
+class ACHFileBuilder(ACHRecordKwargsMixin):
+    """Builds an ACHFileContents object."""
+
+    ach_file_contents_class = ACHFileContents
+    ach_batch_class = ACHBatch
+    file_header_record_type_class = FileHeaderRecordType
+
+    def __init__(
+        self,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+        **file_settings
+    ):
         """
         Accepts a dict of file settings.
         Run cls.get_file_setting_fields to see all key options.
 
+        validation_level sets how thoroughly the values of every record
+        the builder creates are checked; see ValidationLevel.
+
         Examples:
 
             settings_dict = {
@@ -53,12 +154,15 @@ class ACHFileBuilder:
                 origin_name='YOUR FINANCIAL INSTITUTION',
             )
         """
+        self.validation_level = validation_level
         self.ach_file_contents: ACHFileContents = self.ach_file_contents_class(
-            self.file_header_record_type_class(**file_settings)
+            self.file_header_record_type_class(
+                validation_level=validation_level, **file_settings
+            )
+        )
+        self.default_odfi_identification = self._get_default_odfi_identification(
+            file_settings
         )
-        self.default_odfi_identification: str = file_settings.get(
-            "destination_routing", ""
-        ).lstrip()[:8]
 
     def render(self, line_break: str = "\n", end: str = "\n") -> str:
         """Renders ACH flat file contents as a string."""
@@ -66,6 +170,22 @@ class ACHFileBuilder:
             line_break=line_break, end=end
         )
 
+    def render_to(
+        self,
+        fileobj: IO,
+        line_break: str = "\n",
+        end: str = "\n",
+        binary: Optional[bool] = None,
+    ) -> None:
+        """Renders ACH flat file contents to a text or binary file object."""
+        self.ach_file_contents.render_to(
+            fileobj, line_break=line_break, end=end, binary=binary
+        )
+
+    def render_bytes(self, line_break: str = "\n", end: str = "\n") -> memoryview:
+        """Renders ACH flat file contents into an exactly sized ASCII bytearray."""
+        return self.ach_file_contents.render_bytes(line_break=line_break, end=end)
+
     def add_batch(self, **batch_settings: Dict[str, Any]) -> "ACHFileBuilder":
         """
         Accepts a dict of batch settings.
@@ -82,7 +202,11 @@ class ACHFileBuilder:
         """
         self._update_batch_settings(batch_settings)
         self.ach_file_contents.add_batch(
-            self.ach_batch_class(self.batch_header_record_type_class(**batch_settings))
+            self.ach_batch_class(
+                self.batch_header_record_type_class(
+                    validation_level=self.validation_level, **batch_settings
+                )
+            )
         )
         return self
 
@@ -168,64 +292,193 @@ class ACHFileBuilder:
         self.ach_file_contents.batches[batch_index].add_transaction(ach_tx_entry)
         return self
 
-    def _update_batch_settings(self, batch_settings: Dict[str, Any]) -> None:
-        update_batch_settings = {
-            "odfi_identification": self.default_odfi_identification,
-            "batch_number": len(self.ach_file_contents.batches) + 1,
-        }
-        for k, val in update_batch_settings.items():
-            if k not in batch_settings:
-                batch_settings[k] = val
+    def add_entries_columnar(
+        self,
+        batch_index: int = -1,
+        addendas: Optional[Sequence[Optional[List[Dict[str, Any]]]]] = None,
+        **columns: Any
+    ) -> "ACHFileBuilder":
+        """
+        Adds entries given as columns of entry field values to a batch,
+        without creating a dict per entry.
+        Adds them to last added batch in file by default.
 
-    def _convert_entry_detail_kwargs_to_ach_transaction_entry(
-        self, **entry_details
-    ) -> ACHTransactionEntry:
-        addenda_list_kwargs = self._update_entry_detail_kwargs(entry_details)
+        Each column is a sequence (a list, tuple, range, NumPy array...)
+        with one value per entry; a single value (like a string or an int)
+        is used for every entry. All sequences must be of the same length.
+        addendas, if given, is a sequence of lists of addenda dicts (or None).
 
-        entry_record = self.entry_detail_record_type_class(**entry_details)
-        addenda_records = []
+        Every column is cleaned and validated as a whole before any entry is added;
+        raises RecordTypeAggregateFieldCreationError listing the failed fields.
+        trace_sequence_number defaults to a range continuing the file's transaction
+        count, and trace_odfi_identifier and addenda_record_indicator
+        are filled in as in add_entry_and_addenda.
 
-        for i, addenda_kwargs in enumerate(addenda_list_kwargs):
-            self._update_addenda_record_kwargs(
-                addenda_kwargs,
-                entry_details.get("trace_sequence_number"),
-                addenda_sequence_num=i + 1,
+        Example:
+            b.add_entries_columnar(
+                transaction_code=22,
+                rdfi_routing=['123456789', '023456789'],
+                rdfi_account_number=['65656565', '45656565'],
+                amount=[300, 7000],
+                individual_name=['Janey Test', 'Mackey Shawnderson'],
+                addendas=[None, [{'payment_related_information': 'Hi'}]],
+            )
+        """
+        if not self.ach_file_contents.batches:
+            raise NoBatchForTransactionError(
+                "Must add batch before adding transaction entries"
+            )
+        record_type_class = self.entry_detail_record_type_class
+        record_layout = record_type_class.get_record_layout()
+        invalid_keys = set(columns).difference(record_layout.field_name_set)
+        if invalid_keys:
+            raise InvalidRecordTypeParametersError(
+                record_type_class.__name__, list(invalid_keys)
             )
-            addenda_records.append(self.addenda_record_type_class(**addenda_kwargs))
 
-        return self.ach_transaction_entry_class(entry_record, addenda_records)
+        row_count = self._get_column_length(
+            [x for x in columns.values() if self._is_column(x)]
+            + ([] if addendas is None else [addendas])
+        )
+        first_sequence_number = self.ach_file_contents.transaction_count + 1
+        columns.setdefault("trace_odfi_identifier", self.default_odfi_identification)
+        columns.setdefault(
+            "trace_sequence_number",
+            range(first_sequence_number, first_sequence_number + row_count),
+        )
+        columns.setdefault(
+            "addenda_record_indicator",
+            0 if addendas is None else [len(x or ()) for x in addendas],
+        )
 
-    def _update_entry_detail_kwargs(
-        self, entry_details: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        raw_addendas = []
-        if "addendas" in entry_details:
-            raw_addendas = entry_details.pop("addendas")
+        entry_rows = list(
+            zip(*self._clean_columns(record_type_class, columns, row_count))
+        )
+        addenda_records_list: List[List[AddendaRecordType]] = [[] for _ in entry_rows]
+        if addendas is not None:
+            sequence_number_index = record_layout.field_indexes["trace_sequence_number"]
+            addenda_records_list = self._convert_addenda_dicts_to_records(
+                addendas, [x[sequence_number_index] for x in entry_rows]
+            )
 
-        update_entry = {
-            "addenda_record_indicator": len(raw_addendas),
-            "trace_odfi_identifier": self.default_odfi_identification,
-            "trace_sequence_number": len(self.ach_file_contents.get_all_transactions())
-            + 1,
-        }
-        for k, val in update_entry.items():
-            if k not in entry_details:
-                entry_details[k] = val
-        return raw_addendas
+        transactions = [
+            self.ach_transaction_entry_class(
+                record_type_class.from_cleaned_values(
+                    list(values), self.validation_level
+                ),
+                addenda_records,
+            )
+            for values, addenda_records in zip(entry_rows, addenda_records_list)
+        ]
+        self.ach_file_contents.batches[batch_index].add_transactions(transactions)
+        return self
 
-    def _update_addenda_record_kwargs(
+    def _convert_addenda_dicts_to_records(
         self,
-        addenda_kwargs: Dict[str, Any],
-        entry_detail_sequence_num: int,
-        addenda_sequence_num: int,
-    ) -> None:
-        update_entry = {
-            "entry_detail_sequence_number": entry_detail_sequence_num,
-            "addenda_sequence_number": addenda_sequence_num,
-        }
-        for k, val in update_entry.items():
-            if k not in addenda_kwargs:
-                addenda_kwargs[k] = val
+        addendas: Sequence[Optional[List[Dict[str, Any]]]],
+        sequence_numbers: List[str],
+    ) -> List[List[AddendaRecordType]]:
+        """
+        Converts the addenda dicts of every entry to addenda records,
+        cleaning each addenda field as one column.
+        sequence_numbers are the trace sequence numbers of the entries.
+        """
+        record_type_class = self.addenda_record_type_class
+        addenda_records_list: List[List[AddendaRecordType]] = [[] for _ in addendas]
+        entry_indexes = []
+        addenda_kwargs_list = []
+        for i, addenda_list in enumerate(addendas):
+            for j, addenda_kwargs in enumerate(addenda_list or ()):
+                entry_indexes.append(i)
+                addenda_kwargs_list.append(
+                    {
+                        "entry_detail_sequence_number": sequence_numbers[i],
+                        "addenda_sequence_number": j + 1,
+                        **addenda_kwargs,
+                    }
+                )
+        if not addenda_kwargs_list:
+            return addenda_records_list
+        keys = set().union(*addenda_kwargs_list)
+        invalid_keys = keys.difference(
+            record_type_class.get_record_layout().field_name_set
+        )
+        if invalid_keys:
+            raise InvalidRecordTypeParametersError(
+                record_type_class.__name__, list(invalid_keys)
+            )
+        columns = {key: [x.get(key) for x in addenda_kwargs_list] for key in keys}
+
+        for i, values in zip(
+            entry_indexes,
+            zip(*self._clean_columns(record_type_class, columns, len(entry_indexes))),
+        ):
+            addenda_records_list[i].append(
+                record_type_class.from_cleaned_values(
+                    list(values), self.validation_level
+                )
+            )
+        return addenda_records_list
+
+    def _clean_columns(
+        self, record_type_class: type, columns: Dict[str, Any], row_count: int
+    ) -> List[Iterable[str]]:
+        """
+        Cleans a column for every field of record_type_class,
+        raising RecordTypeAggregateFieldCreationError listing the failed fields.
+        """
+        cleaned_columns: List[Iterable[str]] = []
+        failed_keys, exceptions = [], []
+        for slot in record_type_class.get_record_layout():
+            try:
+                cleaned_columns.append(
+                    self._clean_column(
+                        slot.field_definition, columns.get(slot.name), row_count
+                    )
+                )
+            except Exception as exc:
+                failed_keys.append(slot.name)
+                exceptions.append(exc)
+        if exceptions:
+            raise RecordTypeAggregateFieldCreationError(
+                record_type_class.__name__, exceptions, failed_keys
+            ) from exceptions[0]
+        return cleaned_columns
+
+    @staticmethod
+    def _is_column(value: Any) -> bool:
+        return hasattr(value, "__len__") and not isinstance(value, (str, bytes))
+
+    @staticmethod
+    def _get_column_length(columns: List[Sequence[Any]]) -> int:
+        lengths = {len(x) for x in columns}
+        if len(lengths) != 1:
+            raise ValueError(
+                "Columns must be sequences of the same length, got lengths {}".format(
+                    sorted(lengths)
+                )
+            )
+        return lengths.pop()
+
+    def _clean_column(
+        self, field_definition: FieldDefinition, column: Any, row_count: int
+    ) -> Iterable[str]:
+        """
+        Cleans a column of values with FieldDefinition.clean_many,
+        or a single value once for every row.
+        """
+        if not self._is_column(column):
+            return repeat(
+                field_definition.get_cleaned_value(column, self.validation_level),
+                row_count,
+            )
+        return field_definition.clean_many(column, self.validation_level)
+
+    def _get_batch_count(self) -> int:
+        return len(self.ach_file_contents.batches)
+
+    def _get_transaction_count(self) -> int:
+        return self.ach_file_contents.transaction_count
 
     @classmethod
     def get_file_setting_fields(
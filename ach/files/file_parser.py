@@ -1,6 +1,11 @@
 """Defines an ACH file parser."""
 
-from typing import Dict, List, Optional, Union
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil
+from mmap import ACCESS_READ, mmap as MemoryMap
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from .file_structure import ACHBatch, ACHFileContents, ACHTransactionEntry
 from ..record_types import (
@@ -11,6 +16,7 @@ from ..record_types import (
     FileControlRecordType,
     FileHeaderRecordType,
 )
+from ..record_types.record_layout import RAW_LINE_ENCODING
 from ..record_types.record_type_base import RecordType
 from ..constants import (
     ADDENDA_RECORD_TYPE_CODE,
@@ -20,22 +26,197 @@ from ..constants import (
     FILE_CONTROL_RECORD_TYPE_CODE,
     FILE_HEADER_RECORD_TYPE_CODE,
     RECORD_SIZE,
+    ValidationLevel,
 )
 
+DEFAULT_READ_CHUNK_SIZE = 1024 * 1024
+BLOCK_FILLER_LINES = frozenset(["9" * RECORD_SIZE, b"9" * RECORD_SIZE])
+
+
+class BatchControlWithoutBatchHeaderError(Exception):
+    """
+    Raise when a batch control record is found
+    without a batch header record before it.
+    """
+
+
+class MissingFileRecordError(Exception):
+    """
+    Raise when an ACH file has no file header record,
+    or no file control record where one is needed.
+    """
+
 
 class ACHFileContentsParser:
     """
-    Accepts a raw ACH file as a string.
+    Accepts a raw ACH file as a string, or a path to an ACH file
+    by using ACHFileContentsParser.from_path.
     Can return a list of RecordType types
     and an ACHFileContents type.
     """
 
-    def __init__(self, ach_file_str: str):
+    record_type_map: Dict[int, RecordType] = {
+        ADDENDA_RECORD_TYPE_CODE: AddendaRecordType,
+        BATCH_CONTROL_RECORD_TYPE_CODE: BatchControlRecordType,
+        BATCH_HEADER_RECORD_TYPE_CODE: BatchHeaderRecordType,
+        ENTRY_DETAIL_RECORD_TYPE_CODE: EntryDetailRecordType,
+        FILE_CONTROL_RECORD_TYPE_CODE: FileControlRecordType,
+        FILE_HEADER_RECORD_TYPE_CODE: FileHeaderRecordType,
+    }
+
+    def __init__(
+        self,
+        ach_file_str: Union[str, bytes],
+        lazy: bool = False,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ):
+        """
+        Accepts file contents as a string or as ASCII bytes;
+        bytes are never decoded as a whole, only one record line at a time.
+        If lazy, records keep their raw lines and only process
+        each field when it is first accessed (see RecordType.from_raw_line).
+        validation_level sets how thoroughly field values are checked;
+        see ValidationLevel.
+        """
         self._raw_str = ach_file_str
+        self._lazy = lazy
+        self._validation_level = validation_level
+        self._path: Optional[Union[str, os.PathLike]] = None
+        self._use_mmap = False
+        self._encoding: Optional[str] = "ascii"
+
+    @classmethod
+    def from_path(
+        cls,
+        path: Union[str, os.PathLike],
+        mmap: bool = False,
+        encoding: Optional[str] = "ascii",
+        lazy: bool = False,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ) -> "ACHFileContentsParser":
+        """
+        Returns a parser that reads records from the file at path
+        instead of from a string held in memory.
+
+        If mmap, the file is memory-mapped and each record is sliced
+        directly out of the mapping when it is processed.
+        Otherwise, the file is read in chunks.
+        Both modes split records the same way, so newline-delimited files
+        (with or without carriage returns) and fixed-block files
+        without line breaks are supported in either.
+
+        If encoding is None, record lines are kept as bytes and each record
+        decodes its own line (as ASCII), or, if lazy,
+        each field value when it is first accessed.
+        """
+        parser = cls("", lazy=lazy, validation_level=validation_level)
+        parser._path = path
+        parser._use_mmap = mmap
+        parser._encoding = encoding
+        return parser
+
+    @staticmethod
+    def parse_parallel(
+        path: Union[str, os.PathLike],
+        workers: Optional[int] = None,
+        encoding: Optional[str] = "ascii",
+        lazy: bool = False,
+        recalc_control_records: bool = False,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ) -> ACHFileContents:
+        """
+        Parses the ACH file at path into an ACHFileContents
+        using a pool of worker processes (os.cpu_count() by default).
+
+        The file is scanned once for the byte offsets of its batches.
+        Contiguous runs of batches are parsed in the worker processes
+        and reassembled in their original order.
+
+        Raises MissingFileRecordError if the file has no file header record,
+        or no file control record unless recalc_control_records.
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        # pylint: disable=too-many-locals
+        (
+            file_header_line,
+            file_control_line,
+            batch_spans,
+        ) = ACHFileContentsParser._scan_batch_spans(path, encoding)
+        if not file_header_line:
+            raise MissingFileRecordError("{} has no file header record".format(path))
+        if not file_control_line and not recalc_control_records:
+            raise MissingFileRecordError("{} has no file control record".format(path))
+        workers = workers or os.cpu_count() or 1
+
+        tasks_per_worker = 4
+        batches_per_task = ceil(len(batch_spans) / (workers * tasks_per_worker)) or 1
+        task_spans = [
+            (spans[0][0], spans[-1][1])
+            for spans in (
+                batch_spans[i : i + batches_per_task]
+                for i in range(0, len(batch_spans), batches_per_task)
+            )
+        ]
+        task_args = [
+            [path] * len(task_spans),
+            [x[0] for x in task_spans],
+            [x[1] for x in task_spans],
+            [encoding] * len(task_spans),
+            [lazy] * len(task_spans),
+            [recalc_control_records] * len(task_spans),
+            [validation_level] * len(task_spans),
+        ]
+        if workers == 1 or len(task_spans) <= 1:
+            batch_lists = list(map(ACHFileContentsParser._parse_batch_span, *task_args))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                batch_lists = list(
+                    executor.map(ACHFileContentsParser._parse_batch_span, *task_args)
+                )
+
+        records_from_lines = ACHFileContentsParser.iter_records_from_lines
+        ach_file_contents = ACHFileContents(
+            next(
+                records_from_lines(
+                    [file_header_line], lazy=lazy, validation_level=validation_level
+                )
+            ),
+            [batch for batch_list in batch_lists for batch in batch_list],
+        )
+        if not recalc_control_records:
+            ach_file_contents.file_control_record = next(
+                records_from_lines(
+                    [file_control_line], lazy=lazy, validation_level=validation_level
+                )
+            )
+        return ach_file_contents
+
+    def process_records_iter(self) -> Iterator[RecordType]:
+        """Processes raw ACH file into RecordTypes in order, one at a time."""
+        if self._path is None:
+            return self.iter_records_from_lines(
+                self.split_file_string(self._raw_str),
+                lazy=self._lazy,
+                validation_level=self._validation_level,
+            )
+        if self._use_mmap:
+            return self.iter_mmap_records(
+                self._path,
+                encoding=self._encoding,
+                lazy=self._lazy,
+                validation_level=self._validation_level,
+            )
+        return self._iter_path_records(
+            self._path, self._encoding, self._lazy, self._validation_level
+        )
 
     def process_records_list(self) -> List[RecordType]:
         """Processes raw ACH file string into a list of RecordTypes in order."""
-        return self.convert_file_string_to_records_list(self._raw_str)
+        if self._path is None:
+            return self.convert_file_string_to_records_list(
+                self._raw_str, lazy=self._lazy, validation_level=self._validation_level
+            )
+        return list(self.process_records_iter())
 
     def process_ach_file_contents(
         self,
@@ -125,7 +306,7 @@ class ACHFileContentsParser:
         """
         dict_list = []
         for record in records_list:
-            dict_list.append({x: y.value for x, y in record.fields.items()})
+            dict_list.append(record.get_field_values())
         return dict_list
 
     @staticmethod
@@ -136,51 +317,300 @@ class ACHFileContentsParser:
         Given an integer or single character string,
         returns an associated RecordType Type or None.
         """
-        record_type_map = {
-            ADDENDA_RECORD_TYPE_CODE: AddendaRecordType,
-            BATCH_CONTROL_RECORD_TYPE_CODE: BatchControlRecordType,
-            BATCH_HEADER_RECORD_TYPE_CODE: BatchHeaderRecordType,
-            ENTRY_DETAIL_RECORD_TYPE_CODE: EntryDetailRecordType,
-            FILE_CONTROL_RECORD_TYPE_CODE: FileControlRecordType,
-            FILE_HEADER_RECORD_TYPE_CODE: FileHeaderRecordType,
-        }
-        return record_type_map.get(int(record_type_code))
+        return ACHFileContentsParser.record_type_map.get(int(record_type_code))
 
     @staticmethod
     def convert_line_to_record_type(
-        line_str: str, record_type_class: RecordType
+        line_str: str,
+        record_type_class: RecordType,
+        lazy: bool = False,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
     ) -> RecordType:
         """
         Converts a line in an ACH record to a RecordType according to its
         leading record type code.
+        If lazy, the RecordType only processes each field when it is first accessed.
+        Otherwise the whole line is validated with a single regex match
+        and only falls back to processing each field on its own if that fails.
         """
-        str_index = 0
-        kwargs = {}
-        for key, field_def in record_type_class.field_definition_dict.items():
-            kwargs[key] = line_str[str_index : str_index + field_def.length]
-            str_index += field_def.length
-        return record_type_class(**kwargs)
+        if lazy:
+            return record_type_class.from_raw_line(line_str, validation_level)
+        return record_type_class.from_record_line(line_str, validation_level)
 
     @staticmethod
     def convert_file_string_to_records_list(
-        file_str: str,
+        file_str: Union[str, bytes, bytearray, memoryview],
         line_break: str = "\n",
+        lazy: bool = False,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
     ) -> List[RecordType]:
         """
         Splits a file string along line breaks
         and initializes each line as a RecordType.
+        File contents given as bytes are never decoded as a whole;
+        each record decodes its own line, or, if lazy,
+        each field value when it is first accessed.
         Returns list of RecordTypes.
         """
-        lines = file_str.split(line_break)
-        records = []
+        return list(
+            ACHFileContentsParser.iter_records_from_lines(
+                ACHFileContentsParser.split_file_string(file_str, line_break),
+                lazy=lazy,
+                validation_level=validation_level,
+            )
+        )
+
+    @staticmethod
+    def split_file_string(
+        file_str: Union[str, bytes, bytearray, memoryview],
+        line_break: str = "\n",
+    ) -> List[Union[str, bytes]]:
+        """
+        Splits file contents given as a string or bytes along line breaks.
+        Memoryviews are sliced line by line and never copied as a whole.
+        """
+        if isinstance(file_str, str):
+            return file_str.split(line_break)
+        line_break_bytes = line_break.encode(RAW_LINE_ENCODING)
+        if not isinstance(file_str, memoryview):
+            return file_str.split(line_break_bytes)
+        view = file_str.cast("B")
+        lines, start = [], 0
+        for match in re.finditer(re.escape(line_break_bytes), view):
+            lines.append(view[start : match.start()].tobytes())
+            start = match.end()
+        lines.append(view[start:].tobytes())
+        return lines
+
+    @staticmethod
+    def iter_records(
+        fileobj: IO,
+        line_break: str = "\n",
+        chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+        encoding: Optional[str] = "ascii",
+        lazy: bool = False,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ) -> Iterator[RecordType]:
+        """
+        Reads a text or binary file object in chunks of chunk_size
+        and yields one RecordType per line, so memory use does not
+        grow with the size of the file.
+        Lines read from binary file objects are decoded with encoding,
+        or are kept as bytes and decoded by each record if encoding is None.
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        return ACHFileContentsParser.iter_records_from_lines(
+            ACHFileContentsParser.iter_lines(fileobj, line_break, chunk_size, encoding),
+            lazy=lazy,
+            validation_level=validation_level,
+        )
+
+    @staticmethod
+    def iter_mmap_records(
+        path: Union[str, os.PathLike],
+        encoding: Optional[str] = "ascii",
+        lazy: bool = False,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ) -> Iterator[RecordType]:
+        """
+        Memory-maps the file at path and yields one RecordType per record,
+        decoding each record straight out of the mapping.
+        """
+        return ACHFileContentsParser.iter_records_from_lines(
+            ACHFileContentsParser.iter_mmap_lines(path, encoding),
+            lazy=lazy,
+            validation_level=validation_level,
+        )
+
+    @staticmethod
+    def iter_records_from_lines(
+        lines: Iterable[Union[str, bytes]],
+        lazy: bool = False,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ) -> Iterator[RecordType]:
+        """
+        Initializes each line (a string or ASCII bytes) as a RecordType,
+        skipping empty lines and blocking filler lines.
+        """
         for line in lines:
-            if not line or line == "9" * RECORD_SIZE:
+            if not line or line in BLOCK_FILLER_LINES:
                 continue
             record_type_class = (
-                ACHFileContentsParser.get_record_type_from_record_type_code(line[0])
+                ACHFileContentsParser.get_record_type_from_record_type_code(line[:1])
             )
-            record_type = ACHFileContentsParser.convert_line_to_record_type(
-                line, record_type_class
+            yield ACHFileContentsParser.convert_line_to_record_type(
+                line, record_type_class, lazy=lazy, validation_level=validation_level
+            )
+
+    @staticmethod
+    def iter_lines(
+        fileobj: IO,
+        line_break: str = "\n",
+        chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+        encoding: Optional[str] = "ascii",
+    ) -> Iterator[str]:
+        """
+        Reads a text or binary file object in chunks of chunk_size
+        and yields its record lines without line breaks.
+        Lines end at line_break or after RECORD_SIZE characters,
+        so fixed-block files without line breaks are split into records;
+        carriage returns before line breaks and empty lines are left out.
+        Lines of binary file objects are kept as bytes if encoding is None.
+        """
+        remainder = None
+        line_pattern = None
+        while True:
+            chunk = fileobj.read(chunk_size)
+            if remainder is None:
+                buffer = chunk
+                line_pattern = ACHFileContentsParser._compile_line_pattern(
+                    line_break, not isinstance(chunk, str)
+                )
+            else:
+                buffer = remainder + chunk
+            # Lines starting after complete_end may continue in the next chunk.
+            complete_end = len(buffer)
+            if chunk:
+                complete_end -= RECORD_SIZE + len(line_break)
+            remainder = buffer[:0]
+            for match in line_pattern.finditer(buffer):
+                if match.start() > complete_end:
+                    remainder = buffer[match.start() :]
+                    break
+                if isinstance(buffer, str) or encoding is None:
+                    yield match[0]
+                else:
+                    yield match[0].decode(encoding)
+            if not chunk:
+                break
+
+    @staticmethod
+    def iter_mmap_lines(
+        path: Union[str, os.PathLike],
+        encoding: Optional[str] = "ascii",
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Memory-maps the file at path and yields each record as a string,
+        or as bytes if encoding is None.
+        Records are RECORD_SIZE characters long unless cut short by a line break,
+        so line breaks between records are optional.
+        If start or end are given, only records within that byte range are yielded.
+        """
+        with open(path, "rb") as fileobj:
+            if not os.fstat(fileobj.fileno()).st_size:
+                return
+            with MemoryMap(
+                fileobj.fileno(), 0, access=ACCESS_READ
+            ) as mapped, memoryview(mapped) as view:
+                for line_start, line_end in ACHFileContentsParser._iter_line_spans(
+                    mapped, start, end
+                ):
+                    if encoding is None:
+                        yield mapped[line_start:line_end]
+                    else:
+                        yield str(view[line_start:line_end], encoding)
+
+    @staticmethod
+    def _scan_batch_spans(
+        path: Union[str, os.PathLike], encoding: Optional[str]
+    ) -> Tuple[Union[str, bytes], Union[str, bytes], List[Tuple[int, int]]]:
+        file_header_code = ord(str(FILE_HEADER_RECORD_TYPE_CODE))
+        file_control_code = ord(str(FILE_CONTROL_RECORD_TYPE_CODE))
+        batch_header_code = ord(str(BATCH_HEADER_RECORD_TYPE_CODE))
+        batch_control_code = ord(str(BATCH_CONTROL_RECORD_TYPE_CODE))
+
+        file_header_line, file_control_line = b"", b""
+        batch_spans: List[Tuple[int, int]] = []
+        batch_start = None
+        if os.path.getsize(path) == 0:
+            return file_header_line, file_control_line, batch_spans
+        with open(path, "rb") as fileobj, MemoryMap(
+            fileobj.fileno(), 0, access=ACCESS_READ
+        ) as mapped:
+            for line_start, line_end in ACHFileContentsParser._iter_line_spans(mapped):
+                record_type_code = mapped[line_start]
+                if record_type_code == batch_header_code:
+                    batch_start = line_start
+                elif record_type_code == batch_control_code:
+                    if batch_start is None:
+                        raise BatchControlWithoutBatchHeaderError(
+                            "Batch control record at byte {} has no batch header "
+                            "record before it".format(line_start)
+                        )
+                    batch_spans.append((batch_start, line_end))
+                    batch_start = None
+                elif record_type_code == file_header_code:
+                    file_header_line = mapped[line_start:line_end]
+                elif (
+                    record_type_code == file_control_code
+                    and mapped[line_start:line_end] not in BLOCK_FILLER_LINES
+                ):
+                    file_control_line = mapped[line_start:line_end]
+        if encoding is not None:
+            file_header_line = file_header_line.decode(encoding)
+            file_control_line = file_control_line.decode(encoding)
+        return file_header_line, file_control_line, batch_spans
+
+    @staticmethod
+    def _compile_line_pattern(line_break: str, binary: bool) -> re.Pattern:
+        """
+        Compile the pattern matching each record line of a file,
+        shared by all ways of reading files.
+        Lines end at a line break character or after RECORD_SIZE characters,
+        whichever comes first, so line breaks between records are optional.
+        Carriage returns and empty lines are left out.
+        """
+        pattern = r"[^\r{}]{{1,{}}}".format(re.escape(line_break), RECORD_SIZE)
+        if binary:
+            return re.compile(pattern.encode(RAW_LINE_ENCODING))
+        return re.compile(pattern)
+
+    @staticmethod
+    def _iter_line_spans(
+        mapped: MemoryMap, start: int = 0, end: Optional[int] = None
+    ) -> Iterator[Tuple[int, int]]:
+        line_pattern = ACHFileContentsParser._compile_line_pattern("\n", True)
+        for match in line_pattern.finditer(
+            mapped, start, len(mapped) if end is None else end
+        ):
+            yield match.span()
+
+    @staticmethod
+    def _iter_path_records(
+        path: Union[str, os.PathLike],
+        encoding: Optional[str],
+        lazy: bool,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ) -> Iterator[RecordType]:
+        with open(path, "rb") as fileobj:
+            yield from ACHFileContentsParser.iter_records(
+                fileobj,
+                encoding=encoding,
+                lazy=lazy,
+                validation_level=validation_level,
             )
-            records.append(record_type)
-        return records
+
+    @staticmethod
+    def _parse_batch_span(
+        path: Union[str, os.PathLike],
+        start: int,
+        end: int,
+        encoding: Optional[str],
+        lazy: bool,
+        recalc_batch_control: bool,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ) -> List[ACHBatch]:
+        """Parses the batches in a byte range of an ACH file. Runs in worker processes."""
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        return ACHFileContentsParser._convert_sub_records_list_to_ach_batch_list(
+            list(
+                ACHFileContentsParser.iter_records_from_lines(
+                    ACHFileContentsParser.iter_mmap_lines(path, encoding, start, end),
+                    lazy=lazy,
+                    validation_level=validation_level,
+                )
+            ),
+            recalc_batch_control,
+        )
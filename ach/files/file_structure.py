@@ -1,7 +1,20 @@
 """Defines ACH file structure and how record types relate."""
 
+import codecs
+from io import BufferedIOBase, RawIOBase, TextIOBase
 from math import ceil
-from typing import Any, Dict, List, Optional, Tuple
+from operator import add, sub
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 from ..constants import FILE_HEADER_BLOCKING_FACTOR, RECORD_SIZE, TransactionCode
 from ..record_types import (
@@ -11,7 +24,246 @@ from ..record_types import (
     EntryDetailRecordType,
     FileControlRecordType,
     FileHeaderRecordType,
+    RecordType,
 )
+from ..record_types.record_layout import RAW_LINE_ENCODING
+
+ENTRY_CONTROL_FIELD_NAMES = frozenset(["amount", "rdfi_routing", "transaction_code"])
+
+
+class ControlTotals(NamedTuple):
+    """
+    Sums that control records are computed from.
+    Supports element-wise addition and subtraction.
+    """
+
+    entry_and_addenda_count: int = 0
+    entry_hash: int = 0
+    total_debit_amount: int = 0
+    total_credit_amount: int = 0
+
+    def __add__(self, other: "ControlTotals") -> "ControlTotals":
+        return ControlTotals(*map(add, self, other))
+
+    def __sub__(self, other: "ControlTotals") -> "ControlTotals":
+        return ControlTotals(*map(sub, self, other))
+
+    def get_batch_control_record(
+        self,
+        batch_header_record: BatchHeaderRecordType,
+        record_type_class: type = BatchControlRecordType,
+    ) -> BatchControlRecordType:
+        """
+        Creates the batch control record of a batch with these sums
+        from the fields of its batch header record.
+        """
+        return record_type_class(
+            entry_and_addenda_count=self.entry_and_addenda_count,
+            entry_hash=self.entry_hash,
+            total_debit_amount=self.total_debit_amount,
+            total_credit_amount=self.total_credit_amount,
+            service_class_code=batch_header_record.get_field_value(
+                "service_class_code"
+            ),
+            company_identification=batch_header_record.get_field_value(
+                "company_identification"
+            ),
+            odfi_identification=batch_header_record.get_field_value(
+                "odfi_identification"
+            ),
+            batch_number=batch_header_record.get_field_value("batch_number"),
+        )
+
+    def get_file_control_record(
+        self,
+        batch_count: int,
+        block_count: int,
+        record_type_class: type = FileControlRecordType,
+    ) -> FileControlRecordType:
+        """Creates the file control record of a file with these sums."""
+        return record_type_class(
+            batch_count=batch_count,
+            block_count=block_count,
+            entry_and_addenda_count=self.entry_and_addenda_count,
+            entry_hash=self.entry_hash,
+            total_credit_amount=self.total_credit_amount,
+            total_debit_amount=self.total_debit_amount,
+        )
+
+
+class ObservedList(list):
+    """
+    List reporting every change of its items to an observer,
+    so containers can keep their sums and rendered lines up to date
+    when the list is changed directly instead of through their methods.
+
+    The observer's on_items_added(items) and on_items_removed(items) methods
+    are called after items are added or removed, and on_items_reordered()
+    after the order of the items changes.
+    """
+
+    __slots__ = ("observer",)
+
+    def __init__(self, items: Iterable[Any] = (), observer: Optional[Any] = None):
+        super().__init__(items)
+        self.observer = observer
+
+    def __reduce__(self) -> Tuple[type, Tuple[List[Any], Optional[Any]]]:
+        # Copies and unpickled lists get their items before they are observed.
+        return type(self), (list(self), self.observer)
+
+    def append(self, item: Any) -> None:
+        super().append(item)
+        self._report_added([item])
+
+    def extend(self, items: Iterable[Any]) -> None:
+        items = list(items)
+        super().extend(items)
+        self._report_added(items)
+
+    def insert(self, index: int, item: Any) -> None:
+        super().insert(index, item)
+        self._report_added([item])
+
+    def pop(self, index: int = -1) -> Any:
+        item = super().pop(index)
+        self._report_removed([item])
+        return item
+
+    def remove(self, item: Any) -> None:
+        super().remove(item)
+        self._report_removed([item])
+
+    def clear(self) -> None:
+        items = list(self)
+        super().clear()
+        self._report_removed(items)
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            old_items = self[index]
+            value = list(value)
+            new_items = value
+        else:
+            old_items = [self[index]]
+            new_items = [value]
+        super().__setitem__(index, value)
+        self._report_removed(old_items)
+        self._report_added(new_items)
+
+    def __delitem__(self, index: Any) -> None:
+        old_items = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        self._report_removed(old_items)
+
+    def __iadd__(self, items: Iterable[Any]) -> "ObservedList":
+        self.extend(items)
+        return self
+
+    def __imul__(self, count: int) -> "ObservedList":
+        items = list(self)
+        super().__imul__(count)
+        if count < 1:
+            self._report_removed(items)
+        else:
+            self._report_added(items * (count - 1))
+        return self
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._report_reordered()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._report_reordered()
+
+    def _report_added(self, items: List[Any]) -> None:
+        if self.observer is not None and items:
+            self.observer.on_items_added(items)
+
+    def _report_removed(self, items: List[Any]) -> None:
+        if self.observer is not None and items:
+            self.observer.on_items_removed(items)
+
+    def _report_reordered(self) -> None:
+        if self.observer is not None:
+            self.observer.on_items_reordered()
+
+
+def _replace_observed_list(
+    observer: Any, old_list: Optional[ObservedList], items: Optional[Iterable[Any]]
+) -> ObservedList:
+    """
+    Creates the ObservedList of observer's items,
+    reporting the items of the list it replaces as removed.
+    """
+    if old_list is not None:
+        old_list.observer = None
+        if old_list:
+            observer.on_items_removed(list(old_list))
+    new_list = ObservedList(items or ())
+    new_list.observer = observer
+    if new_list:
+        observer.on_items_added(list(new_list))
+    return new_list
+
+
+def is_binary_file(fileobj: IO) -> bool:
+    """
+    Guess whether a file object is written bytes rather than text:
+    True for io raw and buffered binary streams, False for io text streams
+    and codecs stream writers; other file objects are binary
+    only if they have a mode containing "b".
+    """
+    if isinstance(fileobj, (RawIOBase, BufferedIOBase)):
+        return True
+    if isinstance(fileobj, (TextIOBase, codecs.StreamWriter)):
+        return False
+    mode = getattr(fileobj, "mode", "")
+    return isinstance(mode, str) and "b" in mode
+
+
+def write_line_blocks(  # pylint: disable=too-many-arguments
+    fileobj: IO,
+    lines: Iterable[str],
+    line_break: str = "\n",
+    end: str = "\n",
+    *,
+    fill_last_block: bool = False,
+    binary: Optional[bool] = None,
+) -> None:
+    """
+    Writes lines separated by line_break to a text or binary file object,
+    one FILE_HEADER_BLOCKING_FACTOR-line block per write, followed by end.
+    Lines are encoded as ASCII if binary, which is guessed
+    with is_binary_file if not given.
+    If fill_last_block, the last block is filled with "9" lines.
+    """
+    encode = is_binary_file(fileobj) if binary is None else binary
+    block: List[str] = []
+    separator = ""
+    line_count = 0
+    for line in lines:
+        block.append(line)
+        line_count += 1
+        if len(block) == FILE_HEADER_BLOCKING_FACTOR:
+            _write_block(fileobj, separator + line_break.join(block), encode)
+            block.clear()
+            separator = line_break
+
+    block_orphan_count = line_count % FILE_HEADER_BLOCKING_FACTOR
+    if fill_last_block and block_orphan_count:
+        block.extend(
+            ["9" * RECORD_SIZE] * (FILE_HEADER_BLOCKING_FACTOR - block_orphan_count)
+        )
+    if block:
+        _write_block(fileobj, separator + line_break.join(block) + end, encode)
+    else:
+        _write_block(fileobj, end, encode)
+
+
+def _write_block(fileobj: IO, block_str: str, encode: bool) -> None:
+    fileobj.write(block_str.encode(RAW_LINE_ENCODING) if encode else block_str)
 
 
 class ACHFileContents:
@@ -30,31 +282,95 @@ class ACHFileContents:
         batches: Optional[List["ACHBatch"]] = None,
     ):
         self._file_header_record = file_header_record
-        self.batches = batches or []
         self._file_control_record = None
         self._recalc_file_control = False
+        self._transaction_count = 0
+        self._control_totals: Optional[ControlTotals] = None
+        self._batches: Optional[ObservedList] = None
+        self.batches = batches
 
     def get_rendered_line_list(self) -> List[str]:
         """Get rendered lines of an ACH file as an unjoined list."""
-        record_types_list = [self.file_header_record.render_record_line()]
+        return list(self.iter_rendered_lines())
+
+    def iter_rendered_lines(self) -> Iterator[str]:
+        """Yield rendered lines of an ACH file one at a time."""
+        return (x.render_record_line() for x in self.iter_records())
+
+    def iter_records(self) -> Iterator[RecordType]:
+        """Yield all RecordTypes of an ACH file in file order."""
+        yield self.file_header_record
         for batch in self.batches:
-            record_types_list.extend(batch.get_rendered_line_list())
-        record_types_list.append(self.file_control_record.render_record_line())
-        return record_types_list
+            yield from batch.iter_records()
+        yield self.file_control_record
+
+    def render_to(
+        self,
+        fileobj: IO,
+        line_break: str = "\n",
+        end: str = "\n",
+        binary: Optional[bool] = None,
+    ) -> None:
+        """
+        Render all records in ACHFileContents to a text or binary file object,
+        writing one block at a time instead of building the whole file string.
+        Writes the same contents as render_file_contents.
+        Pass binary to override whether fileobj is written bytes
+        (guessed with is_binary_file by default).
+        """
+        write_line_blocks(
+            fileobj,
+            self.iter_rendered_lines(),
+            line_break,
+            end,
+            fill_last_block=True,
+            binary=binary,
+        )
+
+    def render_bytes(self, line_break: str = "\n", end: str = "\n") -> memoryview:
+        """
+        Render all records in ACHFileContents as ASCII into a bytearray
+        allocated once at the exact size of the file,
+        copying each record straight into its slot.
+        Returns a memoryview of the bytearray with the same contents as
+        render_file_contents(line_break, end).encode("ascii").
+        """
+        line_count = self._compute_line_count()
+        block_orphan_count = line_count % FILE_HEADER_BLOCKING_FACTOR
+        if block_orphan_count:
+            line_count += FILE_HEADER_BLOCKING_FACTOR - block_orphan_count
+        line_break_bytes = line_break.encode(RAW_LINE_ENCODING)
+        end_bytes = end.encode(RAW_LINE_ENCODING)
+        slot_size = RECORD_SIZE + len(line_break_bytes)
+        file_size = line_count * slot_size - len(line_break_bytes) + len(end_bytes)
+        buffer = bytearray(file_size)
+
+        offset = 0
+        for record in self.iter_records():
+            record.render_record_into(buffer, offset)
+            buffer[offset + RECORD_SIZE : offset + slot_size] = line_break_bytes
+            offset += slot_size
+        filler_bytes = b"9" * RECORD_SIZE + line_break_bytes
+        while offset < file_size - len(end_bytes):
+            buffer[offset : offset + slot_size] = filler_bytes
+            offset += slot_size
+        # The last line has end instead of a line break after it.
+        buffer[file_size - len(end_bytes) :] = end_bytes
+        return memoryview(buffer)
 
     def render_file_contents(self, line_break: str = "\n", end: str = "\n") -> str:
         """
         Render all records in ACHFileContents as a single flat-file string.
         """
         rendered_line_list = self.get_rendered_line_list()
-        file_contents = line_break.join(rendered_line_list)
 
         block_orphan_count = len(rendered_line_list) % FILE_HEADER_BLOCKING_FACTOR
         if block_orphan_count:
-            for _ in range(FILE_HEADER_BLOCKING_FACTOR - block_orphan_count):
-                file_contents += line_break + ("9" * RECORD_SIZE)
+            rendered_line_list.extend(
+                ["9" * RECORD_SIZE] * (FILE_HEADER_BLOCKING_FACTOR - block_orphan_count)
+            )
 
-        return file_contents + end
+        return line_break.join(rendered_line_list) + end
 
     def render_json_dict(self) -> Dict[str, Any]:
         """
@@ -82,24 +398,68 @@ class ACHFileContents:
         if self._file_control_record:
             self._recalc_file_control = True
 
+    @property
+    def batches(self) -> List["ACHBatch"]:
+        """
+        Get the list of ACHBatch objects.
+        Changes to the list are reported to this ACHFileContents.
+        """
+        return self._batches
+
+    @batches.setter
+    def batches(self, batches: Optional[List["ACHBatch"]]) -> None:
+        """Replace all batches."""
+        self._batches = _replace_observed_list(self, self._batches, batches)
+
     def add_batch(self, batch: "ACHBatch") -> None:
         """
         Add an ACHBatch to ACHFileContents.
         If file control has already been calculated, recalculate.
         """
         self.batches.append(batch)
-        if self._file_control_record:
-            self._recalc_file_control = True
 
     def remove_batch_by_index(self, index: int) -> "ACHBatch":
         """
         Remove an ACHBatch from ACHFileContents.
         If file control has already been calculated, recalculate.
         """
-        batch = self.batches.pop(index)
+        return self.batches.pop(index)
+
+    def on_items_added(self, batches: List["ACHBatch"]) -> None:
+        """Called by the batches list when batches are added."""
+        for batch in batches:
+            self._attach_batch(batch)
         if self._file_control_record:
             self._recalc_file_control = True
-        return batch
+
+    def on_items_removed(self, batches: List["ACHBatch"]) -> None:
+        """Called by the batches list when batches are removed."""
+        for batch in batches:
+            self._detach_batch(batch)
+        if self._file_control_record:
+            self._recalc_file_control = True
+
+    def on_items_reordered(self) -> None:
+        """Called by the batches list when batches are reordered."""
+
+    @property
+    def transaction_count(self) -> int:
+        """
+        Get count of ACHTransactionEntry objects across all batches.
+        Kept as a running count, so this does not iterate over batches.
+        """
+        return self._transaction_count
+
+    def get_control_totals(self) -> ControlTotals:
+        """
+        Get sums of all batches in ACHFileContents.
+        Computed once, then kept up to date from the changes reported by batches.
+        """
+        if self._control_totals is None:
+            self._control_totals = sum(
+                (x.get_control_totals() for x in self.batches), ControlTotals()
+            )
+        return self._control_totals
 
     def get_all_transactions(self) -> List["ACHTransactionEntry"]:
         """
@@ -129,29 +489,45 @@ class ACHFileContents:
         """For use by file parser."""
         self._file_control_record = file_control_record
 
+    def _attach_batch(self, batch: "ACHBatch") -> None:
+        batch.file_contents = self
+        self._transaction_count += batch.transaction_count
+        if self._control_totals is not None:
+            self._control_totals += batch.get_control_totals()
+
+    def _detach_batch(self, batch: "ACHBatch") -> None:
+        batch.file_contents = None
+        self._transaction_count -= batch.transaction_count
+        if self._control_totals is not None:
+            self._control_totals -= batch.get_control_totals()
+
+    def on_transaction_count_change(self, delta: int) -> None:
+        """Called by a contained ACHBatch when transactions are added or removed."""
+        self._transaction_count += delta
+
+    def on_control_totals_change(self, delta: Optional[ControlTotals]) -> None:
+        """
+        Called by a contained ACHBatch when its sums change.
+        If file control has been computed, set to recalculate.
+        """
+        # A batch only reports no delta while its own sums are not computed,
+        # which means these sums are not computed either.
+        if self._control_totals is not None:
+            self._control_totals += delta
+        if self._file_control_record:
+            self._recalc_file_control = True
+
     def _compute_file_control_record(self) -> FileControlRecordType:
-        debit_total, credit_total = self._compute_debit_and_credit_totals()
-        ent_add_count = self._compute_entry_and_addenda_count()
-        return FileControlRecordType(
-            batch_count=len(self.batches),
-            block_count=self._compute_block_count(entry_addenda_count=ent_add_count),
-            entry_and_addenda_count=ent_add_count,
-            entry_hash=self._compute_entry_hash(),
-            total_credit_amount=credit_total,
-            total_debit_amount=debit_total,
+        control_totals = self.get_control_totals()
+        return control_totals.get_file_control_record(
+            len(self.batches),
+            self._compute_block_count(
+                entry_addenda_count=control_totals.entry_and_addenda_count
+            ),
         )
 
     def _compute_entry_and_addenda_count(self) -> int:
-        return sum(
-            int(x.batch_control_record.get_field_value("entry_and_addenda_count"))
-            for x in self.batches
-        )
-
-    def _compute_entry_hash(self) -> int:
-        return sum(
-            int(x.batch_control_record.get_field_value("entry_hash"))
-            for x in self.batches
-        )
+        return self.get_control_totals().entry_and_addenda_count
 
     def _compute_line_count(self, entry_addenda_count: Optional[int] = None) -> int:
         if entry_addenda_count is None:
@@ -170,38 +546,36 @@ class ACHFileContents:
             / float(self.file_header_record.get_field_value("blocking_factor"))
         )
 
-    def _compute_debit_and_credit_totals(self) -> Tuple[int, int]:
-        debit_sum, credit_sum = 0, 0
-        debit_sum = sum(
-            int(x.batch_control_record.get_field_value("total_debit_amount"))
-            for x in self.batches
-        )
-        credit_sum = sum(
-            int(x.batch_control_record.get_field_value("total_credit_amount"))
-            for x in self.batches
-        )
-        return debit_sum, credit_sum
-
 
 class ACHBatch:
     """
     Contains 1 BatchHeaderRecordType, 1 BatchControlRecordType, and n ACHTransactionEntry.
 
+    Rendered lines are cached until the transactions list or an addendas list
+    changes, the batch header is replaced, or a field of a contained record is set.
+
     Attributes:
         batch_header_record: BatchHeaderRecordType
         transactions: List[ACHTransactionEntry]
+        file_contents: ACHFileContents the batch was added to, if any
         [computed + cached property] batch_control_record: BatchControlRecordType
     """
 
+    # pylint: disable=too-many-instance-attributes
     def __init__(
         self,
         batch_header_record: BatchHeaderRecordType,
         transactions: Optional[List["ACHTransactionEntry"]] = None,
     ):
         self._batch_header_record = batch_header_record
-        self.transactions = transactions or []
         self._batch_control_record: BatchControlRecordType = None
         self._recalc_batch_control = False
+        self.file_contents: Optional[ACHFileContents] = None
+        self._control_totals: Optional[ControlTotals] = None
+        self._rendered_line_list: Optional[List[str]] = None
+        self._transactions: Optional[ObservedList] = None
+        batch_header_record.change_observer = self
+        self.transactions = transactions
 
     @property
     def batch_header_record(self) -> BatchHeaderRecordType:
@@ -215,34 +589,88 @@ class ACHBatch:
         If batch control has been computed, set to recalculate.
         """
         self._batch_header_record = batch_header_record
+        batch_header_record.change_observer = self
+        self._rendered_line_list = None
         if self._batch_control_record:
             self._recalc_batch_control = True
 
+    @property
+    def transactions(self) -> List["ACHTransactionEntry"]:
+        """
+        Get the list of ACHTransactionEntry objects.
+        Changes to the list are reported to this ACHBatch.
+        """
+        return self._transactions
+
+    @transactions.setter
+    def transactions(self, transactions: Optional[List["ACHTransactionEntry"]]) -> None:
+        """Replace all transactions."""
+        self._transactions = _replace_observed_list(
+            self, self._transactions, transactions
+        )
+
     def add_transaction(self, transaction: "ACHTransactionEntry") -> None:
         """
         Adds an ACHTransactionEntry to this ACHBatch.
         If batch control has been computed, set to recalculate.
         """
         self.transactions.append(transaction)
-        if self._batch_control_record:
-            self._recalc_batch_control = True
+
+    def add_transactions(self, transactions: List["ACHTransactionEntry"]) -> None:
+        """
+        Adds multiple ACHTransactionEntry objects to this ACHBatch,
+        updating transaction counts and control totals once for all of them.
+        """
+        self.transactions.extend(transactions)
 
     def remove_transaction_by_index(self, index: int) -> "ACHTransactionEntry":
         """
         Removes an ACHTransactionEntry by index.
         If batch control has been computed, set to recalculate.
         """
-        transaction = self.transactions.pop(index)
-        if self._batch_control_record:
-            self._recalc_batch_control = True
-        return transaction
+        return self.transactions.pop(index)
+
+    def on_items_added(self, transactions: List["ACHTransactionEntry"]) -> None:
+        """Called by the transactions list when transactions are added."""
+        for transaction in transactions:
+            transaction.batch = self
+        if self.file_contents is not None:
+            self.file_contents.on_transaction_count_change(len(transactions))
+        self._on_control_totals_change(
+            sum((x.get_control_totals() for x in transactions), ControlTotals())
+            if self._control_totals is not None
+            else None
+        )
+
+    def on_items_removed(self, transactions: List["ACHTransactionEntry"]) -> None:
+        """Called by the transactions list when transactions are removed."""
+        for transaction in transactions:
+            transaction.batch = None
+        if self.file_contents is not None:
+            self.file_contents.on_transaction_count_change(-len(transactions))
+        self._on_control_totals_change(
+            ControlTotals()
+            - sum((x.get_control_totals() for x in transactions), ControlTotals())
+            if self._control_totals is not None
+            else None
+        )
+
+    def on_items_reordered(self) -> None:
+        """Called by the transactions list when transactions are reordered."""
+        self._rendered_line_list = None
+
+    @property
+    def transaction_count(self) -> int:
+        """Get count of ACHTransactionEntry objects in this ACHBatch."""
+        return len(self.transactions)
 
     @property
     def batch_control_record(self) -> BatchControlRecordType:
         """Get batch control record."""
         if self._batch_control_record and not self._recalc_batch_control:
             return self._batch_control_record
-        self._batch_control_record = self._compute_batch_control_record()
+        self.batch_control_record = self._compute_batch_control_record()
+        self._recalc_batch_control = False
         return self._batch_control_record
 
     @batch_control_record.setter
@@ -251,17 +679,61 @@ class ACHBatch:
     ) -> None:
         """For use by file parser."""
         self._batch_control_record = batch_control_record
+        batch_control_record.change_observer = self
+        self._rendered_line_list = None
+
+    def on_record_change(self, record: RecordType, field_name: str) -> None:
+        """
+        Called when a field of a contained record is set.
+        If a batch header field is set after batch control has been computed,
+        set to recalculate.
+        """
+        # pylint: disable=unused-argument
+        self._rendered_line_list = None
+        if record is self._batch_header_record and self._batch_control_record:
+            self._recalc_batch_control = True
 
     def get_rendered_line_list(self) -> List[str]:
         """
         Get list of rendered RecordTypes as single-line strings
         contained in this ACHBatch.
         """
-        record_types_list = [self._batch_header_record.render_record_line()]
+        return list(self.iter_rendered_lines())
+
+    def iter_rendered_lines(self) -> Iterator[str]:
+        """
+        Yield rendered RecordTypes in this ACHBatch one at a time.
+        Lines are cached until a contained record changes.
+        """
+        if self._rendered_line_list is None:
+            self._rendered_line_list = [
+                x.render_record_line() for x in self.iter_records()
+            ]
+        return iter(self._rendered_line_list)
+
+    def iter_records(self) -> Iterator[RecordType]:
+        """Yield all RecordTypes in this ACHBatch in file order."""
+        yield self._batch_header_record
         for trx in self.transactions:
-            record_types_list.extend(trx.get_rendered_line_list())
-        record_types_list.append(self.batch_control_record.render_record_line())
-        return record_types_list
+            yield trx.entry
+            yield from trx.addendas
+        yield self.batch_control_record
+
+    def render_to(
+        self,
+        fileobj: IO,
+        line_break: str = "\n",
+        end: str = "\n",
+        binary: Optional[bool] = None,
+    ) -> None:
+        """
+        Render all records in this ACHBatch to a text or binary file object,
+        writing one block at a time.
+        Pass binary to override whether fileobj is written bytes.
+        """
+        write_line_blocks(
+            fileobj, self.iter_rendered_lines(), line_break, end, binary=binary
+        )
 
     def get_json_dict(self) -> Dict[str, Any]:
         """
@@ -275,35 +747,53 @@ class ACHBatch:
         }
         return batch_dict
 
-    def _compute_batch_control_record(self) -> BatchControlRecordType:
-        debit_total, credit_total = self._compute_debit_and_credit_totals()
-        return BatchControlRecordType(
-            entry_and_addenda_count=self._compute_entry_and_addenda_count(),
-            entry_hash=self._compute_entry_hash(),
-            total_debit_amount=debit_total,
-            total_credit_amount=credit_total,
-            service_class_code=self._batch_header_record.get_field_value(
-                "service_class_code"
-            ),
-            company_identification=self._batch_header_record.get_field_value(
-                "company_identification"
-            ),
-            odfi_identification=self._batch_header_record.get_field_value(
-                "odfi_identification"
-            ),
-            batch_number=self._batch_header_record.get_field_value("batch_number"),
-        )
+    def get_control_totals(self) -> ControlTotals:
+        """
+        Get sums of all transactions in this ACHBatch.
+        Computed once, then kept up to date as transactions are added or removed
+        and as their amounts, routing numbers or transaction codes change.
+        """
+        if self._control_totals is None:
+            self._control_totals = sum(
+                (x.get_control_totals() for x in self.transactions), ControlTotals()
+            )
+        return self._control_totals
 
-    def _compute_entry_hash(self) -> int:
-        return sum(x.get_entry_hash_int() for x in self.transactions)
+    def on_transaction_change(
+        self,
+        transaction: "ACHTransactionEntry",
+        old_totals: Optional[ControlTotals],
+    ) -> None:
+        """
+        Called by a contained ACHTransactionEntry when its sums may have changed,
+        with the sums it had before, or None if they were not computed.
+        """
+        self._on_control_totals_change(
+            transaction.get_control_totals() - old_totals
+            if self._control_totals is not None
+            else None
+        )
 
-    def _compute_entry_and_addenda_count(self) -> int:
-        return sum(x.get_entry_and_addenda_count() for x in self.transactions)
+    def _on_control_totals_change(self, delta: Optional[ControlTotals]) -> None:
+        """
+        Applies a change of sums, or only marks control records for recalculation
+        if no delta is given because the sums have not been computed yet.
+        Forwards the change to the containing ACHFileContents.
+        """
+        if self._control_totals is not None:
+            self._control_totals += delta
+        else:
+            delta = None
+        self._rendered_line_list = None
+        if self._batch_control_record:
+            self._recalc_batch_control = True
+        if self.file_contents is not None:
+            self.file_contents.on_control_totals_change(delta)
 
-    def _compute_debit_and_credit_totals(self) -> Tuple[int, int]:
-        debit_total = sum(x.get_debit_amount() for x in self.transactions)
-        credit_total = sum(x.get_credit_amount() for x in self.transactions)
-        return debit_total, credit_total
+    def _compute_batch_control_record(self) -> BatchControlRecordType:
+        return self.get_control_totals().get_batch_control_record(
+            self._batch_header_record
+        )
 
 
 class ACHTransactionEntry:
@@ -313,21 +803,41 @@ class ACHTransactionEntry:
     Attributes:
         entry: EntryDetailRecordType
         addendas: List[AddendaRecordType]
+        batch: ACHBatch the transaction was added to, if any
     """
 
+    __slots__ = ("_entry", "_addendas", "batch", "_control_totals")
+
     def __init__(
         self,
         entry: EntryDetailRecordType,
         addendas: Optional[List[AddendaRecordType]] = None,
     ):
         self._entry = entry
-        self.addendas = addendas or []
+        self.batch: Optional[ACHBatch] = None
+        self._control_totals: Optional[ControlTotals] = None
+        self._addendas: Optional[ObservedList] = None
+        entry.change_observer = self
+        self.addendas = addendas
 
     @property
     def entry(self) -> EntryDetailRecordType:
         """Get EntryDetailRecordType."""
         return self._entry
 
+    @property
+    def addendas(self) -> List[AddendaRecordType]:
+        """
+        Get the list of addenda records.
+        Changes to the list are reported to this transaction entry.
+        """
+        return self._addendas
+
+    @addendas.setter
+    def addendas(self, addendas: Optional[List[AddendaRecordType]]) -> None:
+        """Replace all addendas."""
+        self._addendas = _replace_observed_list(self, self._addendas, addendas)
+
     def add_addenda(self, addenda: AddendaRecordType) -> None:
         """Add an addenda to this transaction entry."""
         self.addendas.append(addenda)
@@ -336,6 +846,55 @@ class ACHTransactionEntry:
         """Remove an addenda from this transaction entry."""
         return self.addendas.pop(index)
 
+    def on_items_added(self, addendas: List[AddendaRecordType]) -> None:
+        """Called by the addendas list when addendas are added."""
+        for addenda in addendas:
+            addenda.change_observer = self
+        self._on_control_totals_change()
+
+    def on_items_removed(self, addendas: List[AddendaRecordType]) -> None:
+        """Called by the addendas list when addendas are removed."""
+        for addenda in addendas:
+            addenda.change_observer = None
+        self._on_control_totals_change()
+
+    def on_items_reordered(self) -> None:
+        """Called by the addendas list when addendas are reordered."""
+        if self.batch is not None:
+            self.batch.on_items_reordered()
+
+    def on_record_change(self, record: RecordType, field_name: str) -> None:
+        """
+        Called when a field of the entry or an addenda is set.
+        Updates containing ACHBatch sums if a summed field changed.
+        """
+        if record is self._entry and field_name in ENTRY_CONTROL_FIELD_NAMES:
+            self._on_control_totals_change()
+        elif self.batch is not None:
+            self.batch.on_record_change(record, field_name)
+
+    def get_control_totals(self) -> ControlTotals:
+        """Get this transaction's share of its batch's control record sums."""
+        if self._control_totals is None:
+            debit_amount, credit_amount = 0, 0
+            if self.get_transaction_code_enum().is_debit():
+                debit_amount = self.get_amount()
+            else:
+                credit_amount = self.get_amount()
+            self._control_totals = ControlTotals(
+                self.get_entry_and_addenda_count(),
+                self.get_entry_hash_int(),
+                debit_amount,
+                credit_amount,
+            )
+        return self._control_totals
+
+    def _on_control_totals_change(self) -> None:
+        old_totals = self._control_totals
+        self._control_totals = None
+        if self.batch is not None:
+            self.batch.on_transaction_change(self, old_totals)
+
     def get_entry_and_addenda_count(self) -> int:
         """
         Get integer count of all RecordTypes contained in this ACHTransactionEntry.
@@ -0,0 +1,208 @@
+"""Defines a single-pass verifier of ACH batch and file control totals."""
+
+from math import ceil
+from typing import IO, List, NamedTuple, Optional, Union
+
+from .file_parser import BLOCK_FILLER_LINES, ACHFileContentsParser
+from ..constants import (
+    ADDENDA_RECORD_TYPE_CODE,
+    BATCH_CONTROL_RECORD_TYPE_CODE,
+    BATCH_HEADER_RECORD_TYPE_CODE,
+    ENTRY_DETAIL_RECORD_TYPE_CODE,
+    FILE_CONTROL_RECORD_TYPE_CODE,
+    FILE_HEADER_RECORD_TYPE_CODE,
+    TransactionCode,
+)
+from ..record_types import (
+    BatchControlRecordType,
+    EntryDetailRecordType,
+    FileControlRecordType,
+    FileHeaderRecordType,
+    RecordLayout,
+)
+
+CONTROL_TOTAL_FIELD_NAMES = (
+    "entry_and_addenda_count",
+    "entry_hash",
+    "total_debit_amount",
+    "total_credit_amount",
+)
+
+
+class ControlTotalMismatch(NamedTuple):
+    """
+    A control record value that does not match the records it controls.
+
+    Attributes:
+        batch_index: Optional[int] -- index of the batch in the file,
+            or None if the mismatch is in the file control record
+        field_name: str -- name of the mismatched control record field
+        expected: int -- value computed from the controlled records
+        actual: Optional[int] -- value found in the control record,
+            or None if the control record is missing
+    """
+
+    batch_index: Optional[int]
+    field_name: str
+    expected: int
+    actual: Optional[int]
+
+
+class _RunningTotals:
+    """Running sums of the fields shared by batch and file control records."""
+
+    def __init__(self):
+        self.entry_and_addenda_count = 0
+        self.entry_hash = 0
+        self.total_debit_amount = 0
+        self.total_credit_amount = 0
+
+    def add_entry(self, entry_hash: int, amount: int, is_debit: bool) -> None:
+        """Adds the values of an entry detail record."""
+        self.entry_and_addenda_count += 1
+        self.entry_hash += entry_hash
+        if is_debit:
+            self.total_debit_amount += amount
+        else:
+            self.total_credit_amount += amount
+
+    def add_control_totals(
+        self, control_line: Union[str, bytes], control_layout: RecordLayout
+    ) -> None:
+        """Adds the values of the fields of a control record line."""
+        for field_name in CONTROL_TOTAL_FIELD_NAMES:
+            value = int(control_line[control_layout[field_name].field_slice])
+            setattr(self, field_name, getattr(self, field_name) + value)
+
+    def get_mismatches(
+        self,
+        control_line: Optional[Union[str, bytes]],
+        control_layout: RecordLayout,
+        batch_index: Optional[int],
+    ) -> List[ControlTotalMismatch]:
+        """
+        Compares running sums with the fields of a control record line.
+        If control_line is None (the control record is missing),
+        every field is a mismatch.
+        """
+        mismatches = []
+        for field_name in CONTROL_TOTAL_FIELD_NAMES:
+            slot = control_layout[field_name]
+            expected = getattr(self, field_name) % (10 ** (slot.end - slot.start))
+            actual = None
+            if control_line is not None:
+                actual = int(control_line[slot.field_slice])
+            if expected != actual:
+                mismatches.append(
+                    ControlTotalMismatch(batch_index, field_name, expected, actual)
+                )
+        return mismatches
+
+
+def verify_controls(stream: IO, line_break: str = "\n") -> List[ControlTotalMismatch]:
+    """
+    Reads an ACH file from a text or binary file object in a single pass
+    and checks every batch control record against its entries and addendas,
+    and the file control record against the batches.
+
+    Field values are read straight from their fixed offsets into running sums,
+    without creating any RecordTypes or Fields.
+    Returns all mismatches found; an empty list means the controls are consistent.
+    A batch with no batch control record, or a file with no file control record,
+    is reported as a mismatch of every control field, with an actual value of None.
+    """
+    # pylint: disable=too-many-locals
+    entry_layout = EntryDetailRecordType.get_record_layout()
+    batch_control_layout = BatchControlRecordType.get_record_layout()
+    transaction_code_slice = entry_layout["transaction_code"].field_slice
+    amount_slice = entry_layout["amount"].field_slice
+    routing_slice = entry_layout["rdfi_routing"].field_slice
+    entry_hash_slice = slice(routing_slice.start, routing_slice.start + 8)
+    blocking_factor_slice = FileHeaderRecordType.get_record_layout()[
+        "blocking_factor"
+    ].field_slice
+
+    mismatches: List[ControlTotalMismatch] = []
+    file_totals = _RunningTotals()
+    batch_totals = _RunningTotals()
+    batch_count = 0
+    batch_index = 0
+    batch_is_open = False
+    file_control_line = None
+    line_count = 0
+    blocking_factor = None
+    for line in ACHFileContentsParser.iter_lines(stream, line_break, encoding=None):
+        if not line or line in BLOCK_FILLER_LINES:
+            continue
+        line_count += 1
+        record_type_code = int(line[:1])
+
+        if record_type_code == ENTRY_DETAIL_RECORD_TYPE_CODE:
+            batch_is_open = True
+            batch_totals.add_entry(
+                int(line[entry_hash_slice]),
+                int(line[amount_slice]),
+                TransactionCode(int(line[transaction_code_slice])).is_debit(),
+            )
+        elif record_type_code == ADDENDA_RECORD_TYPE_CODE:
+            batch_is_open = True
+            batch_totals.entry_and_addenda_count += 1
+        elif record_type_code == BATCH_HEADER_RECORD_TYPE_CODE:
+            if batch_is_open:
+                mismatches.extend(
+                    batch_totals.get_mismatches(None, batch_control_layout, batch_index)
+                )
+                batch_index += 1
+            batch_totals = _RunningTotals()
+            batch_is_open = True
+        elif record_type_code == BATCH_CONTROL_RECORD_TYPE_CODE:
+            mismatches.extend(
+                batch_totals.get_mismatches(line, batch_control_layout, batch_index)
+            )
+            batch_index += 1
+            batch_is_open = False
+            file_totals.add_control_totals(line, batch_control_layout)
+            batch_count += 1
+        elif record_type_code == FILE_HEADER_RECORD_TYPE_CODE:
+            blocking_factor = int(line[blocking_factor_slice])
+        elif record_type_code == FILE_CONTROL_RECORD_TYPE_CODE:
+            file_control_line = line
+            break
+
+    if batch_is_open:
+        mismatches.extend(
+            batch_totals.get_mismatches(None, batch_control_layout, batch_index)
+        )
+    if file_control_line is None:
+        line_count += 1
+    mismatches.extend(
+        _get_file_control_mismatches(
+            file_control_line,
+            file_totals,
+            batch_count,
+            ceil(line_count / (blocking_factor or 1)),
+        )
+    )
+    return mismatches
+
+
+def _get_file_control_mismatches(
+    file_control_line: Optional[Union[str, bytes]],
+    file_totals: _RunningTotals,
+    batch_count: int,
+    block_count: int,
+) -> List[ControlTotalMismatch]:
+    file_control_layout = FileControlRecordType.get_record_layout()
+    mismatches = file_totals.get_mismatches(
+        file_control_line, file_control_layout, None
+    )
+    for field_name, expected in (
+        ("batch_count", batch_count),
+        ("block_count", block_count),
+    ):
+        actual = None
+        if file_control_line is not None:
+            actual = int(file_control_line[file_control_layout[field_name].field_slice])
+        if expected != actual:
+            mismatches.append(ControlTotalMismatch(None, field_name, expected, actual))
+    return mismatches
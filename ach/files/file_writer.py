@@ -0,0 +1,208 @@
+"""Defines an ACH file writer that streams records to a file object."""
+
+from math import ceil
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+from ..constants import FILE_HEADER_BLOCKING_FACTOR, RECORD_SIZE, ValidationLevel
+from ..record_types import (
+    BatchControlRecordType,
+    BatchHeaderRecordType,
+    FileControlRecordType,
+    FileHeaderRecordType,
+    RecordType,
+)
+from .file_builder import ACHRecordKwargsMixin, NoBatchForTransactionError
+from .file_structure import ControlTotals
+
+
+class ACHStreamWriterClosedError(Exception):
+    """
+    Raise when records are added to an ACHStreamWriter
+    after its file control record has been written.
+    """
+
+
+class ACHStreamWriter(ACHRecordKwargsMixin):
+    """
+    Writes an ACH file to a text file object one record at a time.
+
+    Takes the same settings as ACHFileBuilder, but writes every record as soon
+    as it is added and keeps only running batch and file control totals,
+    so memory use does not grow with the number of entries.
+    Batch control records are written when a batch is closed,
+    and the file control record and block filler lines when the file is closed.
+
+    Example:
+        with open('out.ach', 'w') as f:
+            with ACHStreamWriter(f, **settings_dict) as w:
+                w.add_batch(**batch_settings)
+                for entry_dict in cursor:
+                    w.add_entry_and_addenda(**entry_dict)
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    file_header_record_type_class = FileHeaderRecordType
+    batch_control_record_type_class = BatchControlRecordType
+    file_control_record_type_class = FileControlRecordType
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        fileobj: IO[str],
+        line_break: str = "\n",
+        end: str = "\n",
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+        **file_settings
+    ):
+        """
+        Accepts a writable text file object, line break and end of file strings
+        like ACHFileContents.render_file_contents, a ValidationLevel
+        for the records it creates like ACHFileBuilder, and a dict of file settings.
+        Writes the file header record immediately.
+        Run ACHFileBuilder.get_file_setting_fields to see all file setting options.
+        """
+        self.fileobj = fileobj
+        self.line_break = line_break
+        self.end = end
+        self.validation_level = validation_level
+        self.default_odfi_identification = self._get_default_odfi_identification(
+            file_settings
+        )
+        self.closed = False
+        self.batch_count = 0
+        self.transaction_count = 0
+        self.line_count = 0
+        self.file_control_totals = ControlTotals()
+        self._batch_header_record: Optional[BatchHeaderRecordType] = None
+        self._batch_control_totals = ControlTotals()
+
+        file_header_record = self.file_header_record_type_class(
+            validation_level=validation_level, **file_settings
+        )
+        self.blocking_factor = int(
+            file_header_record.get_field_value("blocking_factor")
+        )
+        self._write_record(file_header_record)
+
+    def __enter__(self) -> "ACHStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+
+    def add_batch(self, **batch_settings: Dict[str, Any]) -> "ACHStreamWriter":
+        """
+        Closes the open batch, if any, and writes a new batch header record.
+        See ACHFileBuilder.get_batch_fields to see all options.
+        """
+        self._raise_if_closed()
+        self.close_batch()
+        self._update_batch_settings(batch_settings)
+        batch_header_record = self.batch_header_record_type_class(
+            validation_level=self.validation_level, **batch_settings
+        )
+        self._write_record(batch_header_record)
+        self._batch_header_record = batch_header_record
+        self._batch_control_totals = ControlTotals()
+        return self
+
+    def add_entries_and_addendas(
+        self, entry_dict_list: List[Dict[str, Any]], raise_exc: bool = True
+    ) -> List[Tuple[Dict[str, Any], Exception]]:
+        """
+        Iterates over entries and their addendas, writing them to the open batch.
+
+        If not raise_exc, catches exceptions and returns
+        failed entry_dicts along with exceptions inside a list.
+        """
+        failed_entry_dicts_and_excs = []
+        for entry_dict in entry_dict_list:
+            try:
+                self.add_entry_and_addenda(**entry_dict)
+            except Exception as exc:
+                if raise_exc:
+                    raise exc from exc
+                failed_entry_dicts_and_excs.append((entry_dict, exc))
+        return failed_entry_dicts_and_excs
+
+    def add_entry_and_addenda(self, **entry_details) -> "ACHStreamWriter":
+        """
+        Writes single entry and its addenda(s) to the open batch.
+        Raises NoBatchForTransactionError if no batch is open.
+        See ACHFileBuilder.add_entry_and_addenda for an example.
+        """
+        self._raise_if_closed()
+        if self._batch_header_record is None:
+            raise NoBatchForTransactionError(
+                "Must add batch before adding transaction entries"
+            )
+
+        ach_tx_entry = self._convert_entry_detail_kwargs_to_ach_transaction_entry(
+            **entry_details
+        )
+        self._write_record(ach_tx_entry.entry)
+        for addenda in ach_tx_entry.addendas:
+            self._write_record(addenda)
+        self._batch_control_totals += ach_tx_entry.get_control_totals()
+        self.transaction_count += 1
+        return self
+
+    def close_batch(self) -> None:
+        """Writes the batch control record of the open batch, if any."""
+        if self._batch_header_record is None:
+            return
+        self._write_record(self._get_batch_control_record())
+        self.file_control_totals += self._batch_control_totals
+        self.batch_count += 1
+        self._batch_header_record = None
+
+    def close(self) -> None:
+        """
+        Closes the open batch, if any, then writes the file control record
+        followed by block filler lines and the end of file string.
+        Does not close the underlying file object.
+        """
+        if self.closed:
+            return
+        self.close_batch()
+        self._write_record(self._get_file_control_record())
+        block_orphan_count = self.line_count % FILE_HEADER_BLOCKING_FACTOR
+        if block_orphan_count:
+            filler_line = self.line_break + ("9" * RECORD_SIZE)
+            self.fileobj.write(
+                filler_line * (FILE_HEADER_BLOCKING_FACTOR - block_orphan_count)
+            )
+        self.fileobj.write(self.end)
+        self.closed = True
+
+    def _write_record(self, record: RecordType) -> None:
+        if self.line_count:
+            self.fileobj.write(self.line_break)
+        self.fileobj.write(record.render_record_line())
+        self.line_count += 1
+
+    def _raise_if_closed(self) -> None:
+        if self.closed:
+            raise ACHStreamWriterClosedError(
+                "Cannot add records after the file control record is written"
+            )
+
+    def _get_batch_count(self) -> int:
+        return self.batch_count
+
+    def _get_transaction_count(self) -> int:
+        return self.transaction_count
+
+    def _get_batch_control_record(self) -> BatchControlRecordType:
+        return self._batch_control_totals.get_batch_control_record(
+            self._batch_header_record, self.batch_control_record_type_class
+        )
+
+    def _get_file_control_record(self) -> FileControlRecordType:
+        # The file control record itself is the last line of the last block.
+        return self.file_control_totals.get_file_control_record(
+            self.batch_count,
+            ceil((self.line_count + 1) / float(self.blocking_factor)),
+            self.file_control_record_type_class,
+        )
@@ -6,10 +6,12 @@ from .batch_header import BatchHeaderRecordType
 from .entry_detail import EntryDetailRecordType
 from .file_control import FileControlRecordType
 from .file_header import FileHeaderRecordType
+from .record_codegen import make_record_type_class, specialize_record_type
 from .record_fields import (
     Alignment,
     AlphaNumFieldType,
     BlankPaddedRoutingNumberFieldType,
+    CleanedValueCache,
     DateFieldType,
     EmptyRequiredFieldError,
     Field,
@@ -19,9 +21,16 @@ from .record_fields import (
     TimeFieldType,
     ValueMismatchesFieldTypeError,
 )
+from .record_layout import (
+    FieldSlot,
+    RecordLayout,
+    RecordLinePattern,
+    get_record_layout,
+)
 from .record_type_base import (
     InvalidRecordSizeError,
     InvalidRecordTypeParametersError,
+    RecordField,
     RecordTypeAggregateFieldCreationError,
     RecordType,
 )
@@ -7,14 +7,18 @@ from ..constants import (
     ADDENDA_RECORD_TYPE_CODE,
     ADDENDA_TYPE_CODE,
 )
+from .record_codegen import specialize_record_type
 from .record_fields import AlphaNumFieldType, FieldDefinition, IntegerFieldType
 from .record_type_base import RecordType
 
 
 # pylint: disable=line-too-long
+@specialize_record_type
 class AddendaRecordType(RecordType):
     """Define all fields of an addenda record line of an ACH file."""
 
+    __slots__ = ()
+
     field_definition_dict: Dict[str, FieldDefinition] = {
         "record_type_code": FieldDefinition(
             "Record Type Code",
@@ -3,14 +3,18 @@
 from typing import Dict
 
 from ..constants import BATCH_CONTROL_RECORD_TYPE_CODE, BATCH_DEFAULT_SERVICE_CLASS_CODE
+from .record_codegen import specialize_record_type
 from .record_fields import AlphaNumFieldType, FieldDefinition, IntegerFieldType
 from .record_type_base import RecordType
 
 
 # pylint: disable=line-too-long
+@specialize_record_type
 class BatchControlRecordType(RecordType):
     """Define all fields of a batch control record line of an ACH file."""
 
+    __slots__ = ()
+
     field_definition_dict: Dict[str, FieldDefinition] = {
         "record_type_code": FieldDefinition(
             "Record Type Code",
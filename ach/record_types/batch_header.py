@@ -9,6 +9,7 @@ from ..constants import (
     BATCH_HEADER_DEFAULT_STANDARD_ENTRY_CLASS_CODE,
     BATCH_HEADER_RECORD_TYPE_CODE,
 )
+from .record_codegen import specialize_record_type
 from .record_fields import (
     AlphaNumFieldType,
     DateFieldType,
@@ -20,9 +21,12 @@ from .record_type_base import RecordType
 
 
 # pylint: disable=line-too-long
+@specialize_record_type
 class BatchHeaderRecordType(RecordType):
     """Define all fields in a batch header record line of an ACH file."""
 
+    __slots__ = ()
+
     field_definition_dict: Dict[str, FieldDefinition] = {
         "record_type_code": FieldDefinition(
             "Record Type Code",
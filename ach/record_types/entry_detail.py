@@ -6,14 +6,18 @@ from ..constants import (
     ENTRY_DETAIL_DEFAULT_ADDENDA_RECORD_INDICATOR,
     ENTRY_DETAIL_RECORD_TYPE_CODE,
 )
+from .record_codegen import specialize_record_type
 from .record_fields import AlphaNumFieldType, FieldDefinition, IntegerFieldType
 from .record_type_base import RecordType
 
 
 # pylint: disable=line-too-long
+@specialize_record_type
 class EntryDetailRecordType(RecordType):
     """Define all fields in an entry detail record line of an ACH file."""
 
+    __slots__ = ()
+
     field_definition_dict: Dict[str, FieldDefinition] = {
         "record_type_code": FieldDefinition(
             "Record Type Code",
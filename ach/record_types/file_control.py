@@ -3,14 +3,18 @@
 from typing import Dict
 
 from ..constants import FILE_CONTROL_RECORD_TYPE_CODE
+from .record_codegen import specialize_record_type
 from .record_fields import AlphaNumFieldType, FieldDefinition, IntegerFieldType
 from .record_type_base import RecordType
 
 
 # pylint: disable=line-too-long
+@specialize_record_type
 class FileControlRecordType(RecordType):
     """Defines all fields of the file control record line in an ACH file."""
 
+    __slots__ = ()
+
     field_definition_dict: Dict[str, FieldDefinition] = {
         "record_type_code": FieldDefinition(
             "Record Type Code",
@@ -11,6 +11,7 @@ from ..constants import (
     FILE_HEADER_RECORD_TYPE_CODE,
     RECORD_SIZE,
 )
+from .record_codegen import specialize_record_type
 from .record_fields import (
     AlphaNumFieldType,
     BlankPaddedRoutingNumberFieldType,
@@ -24,9 +25,12 @@ from .record_type_base import RecordType
 
 
 # pylint: disable=line-too-long
+@specialize_record_type
 class FileHeaderRecordType(RecordType):
     """Defines all fields of a file header record line of an ACH file."""
 
+    __slots__ = ()
+
     field_definition_dict: Dict[str, FieldDefinition] = {
         "record_type_code": FieldDefinition(
             "Record Type Code",
@@ -97,7 +101,6 @@ class FileHeaderRecordType(RecordType):
             origin_name: str,
             **kwargs
     ):
-        self.field_definition_dict = self.field_definition_dict
         kwargs["destination_routing"] = destination_routing
         kwargs["origin_id"] = origin_id
         kwargs["destination_name"] = destination_name
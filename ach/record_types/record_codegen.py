@@ -0,0 +1,188 @@
+"""
+Generates RecordType subclasses specialised for a single field definition dict.
+"""
+
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from .record_fields import FieldDefinition
+from .record_layout import get_record_layout
+from .record_type_base import RecordType, RecordTypeAggregateFieldCreationError
+
+
+def _create_function(
+    name: str, args: str, body: List[str], local_values: Dict[str, Any]
+) -> Callable:
+    """
+    Compiles a function from lines of source code with exec,
+    the way dataclasses generates __init__.
+    Names in local_values are bound in a closure instead of looked up as globals.
+    """
+    source = (
+        "def __create_fn__({local_names}):\n"
+        " def {name}({args}):\n"
+        "{body}\n"
+        " return {name}"
+    ).format(
+        local_names=", ".join(local_values),
+        name=name,
+        args=args,
+        body="\n".join("  " + x for x in body),
+    )
+    namespace: Dict[str, Any] = {}
+    # pylint: disable=exec-used
+    exec(source, {}, namespace)
+    return namespace["__create_fn__"](**local_values)
+
+
+def _create_generate_values_list(
+    field_definition_dict: Dict[str, FieldDefinition], base_class: Type[RecordType]
+) -> Callable:
+    local_values: Dict[str, Any] = {
+        "_field_definition_dict": field_definition_dict,
+        "_base_generate_values_list": base_class.generate_values_list,
+        "_error_class": RecordTypeAggregateFieldCreationError,
+    }
+    keys = tuple(field_definition_dict)
+    field_def_names = ["field_def_{}".format(i) for i in range(len(keys))]
+    # Definitions are looked up on every call, so replacing one takes effect.
+    if len(keys) > 1:
+        local_values["_get_field_defs"] = itemgetter(*keys)
+        get_field_defs = [
+            "{} = _get_field_defs(field_def_dict)".format(", ".join(field_def_names))
+        ]
+    else:
+        get_field_defs = [
+            "{} = field_def_dict[{!r}]".format(name, key)
+            for name, key in zip(field_def_names, keys)
+        ]
+    body = [
+        "if (",
+        "    field_def_dict is not _field_definition_dict",
+        "    or len(field_def_dict) != {}".format(len(keys)),
+        "):",
+        "    return _base_generate_values_list(self, field_def_dict, kwargs)",
+    ]
+    if get_field_defs:
+        body += [
+            "try:",
+            *("    " + x for x in get_field_defs),
+            "except KeyError:",
+            "    return _base_generate_values_list(self, field_def_dict, kwargs)",
+        ]
+    body += [
+        "validation_level = self.validation_level",
+        "kwargs_get = kwargs.get",
+        "failed_keys, exceptions = [], []",
+    ]
+    for i, key in enumerate(keys):
+        body += [
+            "try:",
+            "    value_{0} = field_def_{0}.get_cleaned_value(".format(i),
+            "        kwargs_get({!r}), validation_level".format(key),
+            "    )",
+            "except Exception as exc:",
+            "    value_{} = None".format(i),
+            "    failed_keys.append({!r})".format(key),
+            "    exceptions.append(exc)",
+        ]
+    body += [
+        "if exceptions:",
+        "    raise _error_class(",
+        "        type(self).__name__, exceptions, failed_keys",
+        "    ) from exceptions[0]",
+        "return [{}]".format(", ".join("value_{}".format(i) for i in range(len(keys)))),
+    ]
+    return _create_function(
+        "generate_values_list", "self, field_def_dict, kwargs", body, local_values
+    )
+
+
+def _create_field_property(
+    key: str, index: int, field_definition_dict: Dict[str, FieldDefinition]
+) -> property:
+    local_values = {
+        "_record_layout": get_record_layout(field_definition_dict, refresh=True)
+    }
+    getter = _create_function(
+        "getter",
+        "self",
+        [
+            "if self.record_layout is _record_layout:",
+            "    value = self._values[{}]".format(index),
+            "    if value is not None:",
+            "        return value",
+            "return self.get_field_value({!r})".format(key),
+        ],
+        local_values,
+    )
+    setter = _create_function(
+        "setter",
+        "self, value",
+        ["self.set_field_value({!r}, value)".format(key)],
+        local_values,
+    )
+    return property(getter, setter, doc="Cleaned value of field {!r}.".format(key))
+
+
+def make_record_type_class(
+    field_definition_dict: Optional[Dict[str, FieldDefinition]] = None,
+    base_class: Type[RecordType] = RecordType,
+    class_name: Optional[str] = None,
+) -> Type[RecordType]:
+    """
+    Generates a subclass of base_class specialised for field_definition_dict
+    (base_class.field_definition_dict by default).
+
+    The generated class cleans the values passed in on instantiation with
+    a single generated, unrolled function instead of looping over the field
+    definitions, and has a property for every field whose key is an identifier
+    not already used by base_class (record.amount, record.amount = 300).
+    Records with any other field definition dict fall back to base_class methods.
+
+    Field definitions are looked up in the dict on every instantiation,
+    so changing their attributes or replacing one under the same key
+    later still takes effect. Once keys are added or removed,
+    records fall back to base_class methods.
+
+    Examples:
+
+        BankEntryRecordType = make_record_type_class(
+            bank_field_definition_dict, class_name="BankEntryRecordType"
+        )
+
+        FastEntryDetailRecordType = make_record_type_class(
+            base_class=EntryDetailRecordType
+        )
+    """
+    if field_definition_dict is None:
+        field_definition_dict = base_class.field_definition_dict
+    class_dict: Dict[str, Any] = {
+        "__slots__": (),
+        "__doc__": base_class.__doc__,
+        "field_definition_dict": field_definition_dict,
+        "generate_values_list": _create_generate_values_list(
+            field_definition_dict, base_class
+        ),
+    }
+    for i, key in enumerate(field_definition_dict):
+        if key.isidentifier() and not hasattr(base_class, key):
+            class_dict.setdefault(
+                key, _create_field_property(key, i, field_definition_dict)
+            )
+    record_type_class = type(
+        class_name or base_class.__name__, (base_class,), class_dict
+    )
+    if class_name is None:
+        record_type_class.__module__ = base_class.__module__
+        record_type_class.__qualname__ = base_class.__qualname__
+    return record_type_class
+
+
+def specialize_record_type(base_class: Type[RecordType]) -> Type[RecordType]:
+    """
+    Class decorator replacing a RecordType subclass with a class generated
+    by make_record_type_class from its own field definition dict.
+    The generated class takes the name, module and docstring of the decorated class.
+    """
+    return make_record_type_class(base_class=base_class)
@@ -4,11 +4,12 @@ Fields and FieldType classes.
 
 import datetime
 import re
+from collections import OrderedDict
 from contextlib import suppress
 from enum import Enum
-from typing import Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
-from ..constants import AutoDateInput
+from ..constants import AutoDateInput, ValidationLevel
 
 
 class ValueMismatchesFieldTypeError(Exception):
@@ -80,6 +81,37 @@ class Alignment(Enum):
         return input_string[-length:]
 
 
+FIXED_WIDTH_PATTERN_SOURCE_REGEX = re.compile(r"^\^(\\d|\[(?:\\.|[^\]\\])+\])\+\$$")
+
+_character_class_regex_cache: Dict[Tuple[type, Any], Optional[re.Pattern]] = {}
+
+
+class DeletionTable(dict):
+    """
+    str.translate table deleting every character matched by a regex.
+
+    ASCII characters are looked up when the table is created;
+    any other character is looked up the first time it is translated,
+    then kept in the table.
+    """
+
+    __slots__ = ("regex",)
+
+    def __init__(self, regex: re.Pattern):
+        super().__init__()
+        self.regex = regex
+        for i in range(128):
+            self.__missing__(i)
+
+    def __missing__(self, key: int) -> Optional[int]:
+        value = None if self.regex.match(chr(key)) else key
+        self[key] = value
+        return value
+
+
+_deletion_table_cache: Dict[re.Pattern, DeletionTable] = {}
+
+
 class FieldType:
     """
     Base class for FieldType.
@@ -90,12 +122,18 @@ class FieldType:
             either left or right in fixed-width string
         regex: Optional[re.Pattern] -- pattern against which original string
             should be validated
+        accepts_auto_date_input: bool -- whether AutoDateInput strings
+            are converted to values by correct_input
+        invalid_character_regex: Optional[re.Pattern] -- pattern matching
+            single characters that correct_input removes
     """
 
     padding: str
     alignment: Alignment
     regex: Optional[re.Pattern]
     auto_correct: bool
+    accepts_auto_date_input: bool = False
+    invalid_character_regex: Optional[re.Pattern] = None
 
     @classmethod
     def apply_fixed_length(cls, input_string: str, length: int) -> str:
@@ -103,6 +141,18 @@ class FieldType:
         input_string = cls.alignment.align(input_string, length, cls.padding)
         return cls.alignment.truncate(input_string, length)
 
+    @classmethod
+    def apply_fixed_length_many(
+        cls, input_strings: List[str], length: int
+    ) -> List[str]:
+        """Pads and truncates every string like apply_fixed_length, in one pass."""
+        if cls.apply_fixed_length.__func__ is not FieldType.apply_fixed_length.__func__:
+            return [cls.apply_fixed_length(x, length) for x in input_strings]
+        padding = cls.padding
+        if cls.alignment == Alignment.LEFT:
+            return [x.ljust(length, padding)[:length] for x in input_strings]
+        return [x.rjust(length, padding)[-length:] for x in input_strings]
+
     @classmethod
     def should_correct_input(cls, auto_correct_override: Optional[bool]) -> bool:
         """Return True if auto_correct is True, else False if input is not to be changed."""
@@ -120,6 +170,35 @@ class FieldType:
         """Correct input to only contain characters that would pass regex check."""
         return input_string
 
+    @classmethod
+    def correct_many(
+        cls, input_strings: List[str], auto_correct_override: Optional[bool] = None
+    ) -> List[str]:
+        """Corrects every string like correct_input, each distinct string once."""
+        if cls.correct_input.__func__ is FieldType.correct_input.__func__:
+            return list(input_strings)
+        corrected_strings: Dict[str, str] = {}
+        for input_string in input_strings:
+            if input_string not in corrected_strings:
+                corrected_strings[input_string] = cls.correct_input(
+                    input_string, auto_correct_override
+                )
+        return [corrected_strings[x] for x in input_strings]
+
+    @classmethod
+    def get_deletion_table(cls) -> Optional[DeletionTable]:
+        """
+        Get the str.translate table deleting characters matched by
+        invalid_character_regex, or None if the FieldType has none.
+        """
+        regex = cls.invalid_character_regex
+        if regex is None:
+            return None
+        try:
+            return _deletion_table_cache[regex]
+        except KeyError:
+            return _deletion_table_cache.setdefault(regex, DeletionTable(regex))
+
     @classmethod
     def is_valid(
         cls, input_string: str, *args, raise_exc: bool = False, **kwargs
@@ -140,6 +219,120 @@ class FieldType:
             return False
         raise exc
 
+    @classmethod
+    def is_auto_date_input(cls, input_string: str) -> bool:
+        """Return True if input is an AutoDateInput string this FieldType converts."""
+        return cls.accepts_auto_date_input and input_string.upper() in (
+            AutoDateInput.NOW.value,
+            AutoDateInput.TOMORROW.value,
+        )
+
+    @classmethod
+    def get_character_class_pattern(cls) -> Optional[str]:
+        """
+        Get the character class of single character class regexes
+        like ^[A-Z]+$ or ^\\d+$, where every string of matching characters
+        is valid and left unchanged by correct_input.
+        Returns None for any other regex, if do_validation or apply_fixed_length
+        is overridden, or if correct_input is overridden by anything but
+        a correction only removing characters outside the regex.
+        """
+        if cls.do_validation.__func__ is not FieldType.do_validation.__func__:
+            return None
+        if cls.apply_fixed_length.__func__ is not FieldType.apply_fixed_length.__func__:
+            return None
+        if cls.correct_input.__func__ not in _character_class_preserving_corrections:
+            return None
+        regex = getattr(cls, "regex", None)
+        if not regex:
+            return None
+        match = FIXED_WIDTH_PATTERN_SOURCE_REGEX.match(regex.pattern)
+        if not match:
+            return None
+        return match.group(1)
+
+    @classmethod
+    def get_fixed_width_pattern(cls, length: int) -> Optional[str]:
+        """
+        Get a regex pattern matching only fixed-width values of the given length
+        that are valid and left unchanged by correct_input and apply_fixed_length.
+        Returns None if the FieldType has no character class pattern.
+        """
+        character_class = cls.get_character_class_pattern()
+        if character_class is None:
+            return None
+        return "{}{{{}}}".format(character_class, length)
+
+    @classmethod
+    def get_character_class_regex(cls) -> Optional[re.Pattern]:
+        """
+        Get the compiled regex matching any string (including an empty one)
+        of characters in the FieldType's character class pattern,
+        or None if the FieldType has no character class pattern.
+        """
+        key = (cls, getattr(cls, "regex", None))
+        try:
+            return _character_class_regex_cache[key]
+        except KeyError:
+            character_class = cls.get_character_class_pattern()
+            regex = None
+            if character_class is not None:
+                regex = re.compile("{}*".format(character_class))
+            _character_class_regex_cache[key] = regex
+            return regex
+
+    @classmethod
+    def is_character_class_match(cls, input_string: str) -> bool:
+        """
+        Cheap check used by ValidationLevel.FAST: return True if every character
+        of input is in the FieldType's character class pattern.
+        Always returns False if the FieldType has no character class pattern.
+        """
+        regex = cls.get_character_class_regex()
+        return regex is not None and regex.fullmatch(input_string) is not None
+
+    @classmethod
+    def validate_many(cls, input_strings: List[str]) -> None:
+        """
+        Validates every string like do_validation, raising the exception
+        of the first invalid one.
+        If the FieldType has a character class pattern, one match over the joined
+        strings validates them all; otherwise each distinct string is validated once.
+        """
+        regex = cls.get_character_class_regex()
+        if regex is not None and regex.fullmatch("".join(input_strings)) is not None:
+            return
+        for input_string in dict.fromkeys(input_strings):
+            cls.is_valid(input_string, raise_exc=True)
+
+    @classmethod
+    def clean_many(
+        cls,
+        input_strings: List[str],
+        length: int,
+        auto_correct_override: Optional[bool] = None,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ) -> List[str]:
+        """
+        Corrects, validates and converts to fixed length a column of strings,
+        returning the same values as cleaning each of them one by one.
+        See ValidationLevel for how validation_level changes the checks made.
+        """
+        if validation_level is ValidationLevel.TRUSTED:
+            if cls.accepts_auto_date_input:
+                input_strings = [
+                    (
+                        cls.correct_input(x, auto_correct_override)
+                        if cls.is_auto_date_input(x)
+                        else x
+                    )
+                    for x in input_strings
+                ]
+            return cls.apply_fixed_length_many(input_strings, length)
+        input_strings = cls.correct_many(input_strings, auto_correct_override)
+        cls.validate_many(input_strings)
+        return cls.apply_fixed_length_many(input_strings, length)
+
     @classmethod
     def do_validation(cls, input_string: str, *args, **kwargs) -> None:
         """
@@ -172,6 +365,7 @@ class AlphaNumFieldType(FieldType):
     alignment: Alignment = Alignment.LEFT
     regex: re.Pattern = re.compile(r"^[A-Za-z0-9./()&\'\s-]+$")
     auto_correct: bool = True
+    invalid_character_regex: re.Pattern = re.compile(r"[^A-Za-z0-9./()&\'\s-]")
 
     @classmethod
     def correct_input(
@@ -182,7 +376,26 @@ class AlphaNumFieldType(FieldType):
         """
         if not cls.should_correct_input(auto_correct_override):
             return input_string
-        return re.sub(re.compile(r"[^A-Za-z0-9./()&\'\s-]"), "", input_string)
+        return input_string.translate(cls.get_deletion_table())
+
+    @classmethod
+    def correct_many(
+        cls, input_strings: List[str], auto_correct_override: Optional[bool] = None
+    ) -> List[str]:
+        if cls.correct_input.__func__ is not AlphaNumFieldType.correct_input.__func__:
+            return super().correct_many(input_strings, auto_correct_override)
+        if not cls.should_correct_input(auto_correct_override):
+            return list(input_strings)
+        deletion_table = cls.get_deletion_table()
+        return [x.translate(deletion_table) for x in input_strings]
+
+
+# correct_input implementations leaving strings of regex characters unchanged
+_character_class_preserving_corrections = (
+    FieldType.correct_input.__func__,
+    AlphaNumFieldType.correct_input.__func__,
+)
+
 
 class IntegerFieldSpacePaddingType(FieldType):
     """Represents an integer field type. Pads number strings with leading 0s."""
@@ -209,13 +422,16 @@ class BlankPaddedRoutingNumberFieldType(IntegerFieldType):
             return input_string
         if not cls.auto_correct:
             return input_string
-        if not input_string:
-            return ""
-        if cls.is_valid(input_string):
+        stripped_string = input_string.lstrip()
+        if not stripped_string.isdigit():
             return input_string
-        if input_string.lstrip().isdigit():
-            return Alignment.RIGHT.align(input_string, 9, "0")
-        return input_string
+        if (
+            len(stripped_string) == 9
+            and len(input_string) <= 10
+            and stripped_string.isdecimal()
+        ):
+            return input_string
+        return Alignment.RIGHT.align(input_string, 9, "0")
 
 
 class DateFieldType(AlphaNumFieldType):
@@ -227,6 +443,7 @@ class DateFieldType(AlphaNumFieldType):
 
     regex: re.Pattern = re.compile(r"^\d{6}$")
     auto_correct: bool = True
+    accepts_auto_date_input: bool = True
 
     @classmethod
     def correct_input(
@@ -274,6 +491,7 @@ class TimeFieldType(AlphaNumFieldType):
 
     regex: re.Pattern = re.compile(r"^\d{4}$")
     auto_correct: bool = True
+    accepts_auto_date_input: bool = True
 
     @classmethod
     def correct_input(
@@ -326,6 +544,15 @@ class FieldDefinition:
             defines what is automatically set as the Field's value
     """
 
+    __slots__ = (
+        "field_name",
+        "field_type",
+        "length",
+        "required",
+        "default",
+        "auto_correct_input",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -368,6 +595,176 @@ class FieldDefinition:
         """Convert input string to fixed length according to its FieldType."""
         return self.field_type.apply_fixed_length(input_string, self.length)
 
+    def get_cleaned_value(
+        self,
+        value: Optional[Any] = None,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ) -> str:
+        """
+        Get the cleaned, fixed-width value a Field with this definition
+        would have for the given input value.
+        See ValidationLevel for how validation_level changes the checks made.
+        """
+        cleaned_value_cache = Field.cleaned_value_cache
+        if cleaned_value_cache is not None:
+            return cleaned_value_cache.get_cleaned_value(self, value, validation_level)
+        return self.get_uncached_cleaned_value(value, validation_level)
+
+    def get_uncached_cleaned_value(
+        self,
+        value: Optional[Any] = None,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ) -> str:
+        """
+        Clean the given input value like get_cleaned_value,
+        bypassing Field.cleaned_value_cache.
+        """
+        self.validate_required_value(value)
+
+        ret_value: str = ""
+        if isinstance(value, (datetime.date, datetime.datetime)):
+            ret_value = value.isoformat()
+        ret_value = str(self.default or "") if value is None else str(value)
+
+        if validation_level is ValidationLevel.TRUSTED:
+            if self.field_type.is_auto_date_input(ret_value):
+                ret_value = self.correct_input(ret_value)
+            return self.get_fixed_width_value(ret_value)
+        if (
+            validation_level is ValidationLevel.FAST
+            and self.field_type.is_character_class_match(ret_value)
+        ):
+            return self.get_fixed_width_value(ret_value)
+
+        ret_value = self.correct_input(ret_value)
+
+        self.is_valid(ret_value, raise_exc=True)
+        return self.get_fixed_width_value(ret_value)
+
+    def validate_required_value(self, value: Optional[Any]) -> None:
+        """Raise EmptyRequiredFieldError if value is missing for a required field."""
+        if value is None and self.required and self.default is None:
+            raise EmptyRequiredFieldError(self.field_name)
+
+    def clean_many(
+        self,
+        values: Iterable[Optional[Any]],
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ) -> List[str]:
+        """
+        Get the cleaned, fixed-width values Fields with this definition
+        would have for a column of input values,
+        cleaning the column as a whole with FieldType.clean_many.
+        """
+        input_strings = []
+        for value in values:
+            if value is None:
+                self.validate_required_value(value)
+                input_strings.append(self.default or "")
+            else:
+                input_strings.append(str(value))
+        return self.field_type.clean_many(
+            input_strings, self.length, self.auto_correct_input, validation_level
+        )
+
+
+class CleanedValueCache:
+    """
+    Bounded least recently used cache of cleaned field values,
+    keyed by FieldDefinition and raw input value.
+
+    Opt in by setting it on Field:
+
+        Field.cleaned_value_cache = CleanedValueCache(maxsize=4096)
+
+    Keys include the FieldDefinition's current attributes, its FieldType's
+    regex and auto_correct setting, the validation level and the type of the input,
+    so changing a definition after caching does not return stale values.
+    AutoDateInput strings (like "NOW"), unhashable inputs and inputs that fail
+    validation are never cached.
+
+    Attributes:
+        maxsize: int -- maximum number of cleaned values kept
+        hits: int -- number of values returned from the cache
+        misses: int -- number of values cleaned
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1, got {}".format(maxsize))
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cleaned_values: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cleaned_values)
+
+    def clear(self) -> None:
+        """Removes all cleaned values and resets the hit and miss counters."""
+        self._cleaned_values.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_cleaned_value(
+        self,
+        field_definition: FieldDefinition,
+        value: Optional[Any] = None,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ) -> str:
+        """
+        Get the cleaned value of FieldDefinition.get_cleaned_value from the cache,
+        cleaning and caching it if missing.
+        """
+        cleaned_values = self._cleaned_values
+        key = self._get_key(field_definition, value, validation_level)
+        if key is not None:
+            try:
+                cleaned_value = cleaned_values[key]
+            except KeyError:
+                pass
+            except TypeError:
+                key = None
+            else:
+                cleaned_values.move_to_end(key)
+                self.hits += 1
+                return cleaned_value
+
+        self.misses += 1
+        cleaned_value = field_definition.get_uncached_cleaned_value(
+            value, validation_level
+        )
+        if key is not None:
+            cleaned_values[key] = cleaned_value
+            if len(cleaned_values) > self.maxsize:
+                cleaned_values.popitem(last=False)
+        return cleaned_value
+
+    @staticmethod
+    def _get_key(
+        field_definition: FieldDefinition,
+        value: Optional[Any],
+        validation_level: ValidationLevel,
+    ) -> Optional[Tuple[Any, ...]]:
+        field_type = field_definition.field_type
+        if field_type.accepts_auto_date_input:
+            raw_value = field_definition.default if value is None else value
+            if raw_value is not None and field_type.is_auto_date_input(str(raw_value)):
+                return None
+        return (
+            field_definition,
+            field_type,
+            getattr(field_type, "regex", None),
+            getattr(field_type, "auto_correct", None),
+            field_definition.length,
+            field_definition.required,
+            field_definition.default,
+            field_definition.auto_correct_input,
+            validation_level,
+            type(value),
+            value,
+        )
+
 
 class Field:
     """
@@ -381,12 +778,23 @@ class Field:
             alignments and corrections
         cleaned_value: str: Setting this attribute interrupts initialization
             if raw input value is invalid
+
+    Set retain_original_value to False on Field (or a subclass) to keep
+    original_value as None and let raw input values be garbage collected.
+
+    Set cleaned_value_cache on Field to a CleanedValueCache to reuse
+    the cleaned values of repeated inputs.
     """
 
     # pylint: disable=too-few-public-methods
+    __slots__ = ("field_definition", "original_value", "cleaned_value")
+
+    retain_original_value: bool = True
+    cleaned_value_cache: Optional[CleanedValueCache] = None
+
     def __init__(self, field_definition: FieldDefinition, value: Optional[str] = None):
         self.field_definition = field_definition
-        self.original_value = value
+        self.original_value = value if self.retain_original_value else None
         self.value = value
 
     @property
@@ -397,33 +805,4 @@ class Field:
     @value.setter
     def value(self, raw_value: str) -> None:
         """Set a new cleaned value on this Field."""
-        self.cleaned_value = Field._create_cleaned_value(
-            self.field_definition, raw_value
-        )
-
-    @staticmethod
-    def _create_cleaned_value(
-        field_definition: FieldDefinition, value: Optional[str] = None
-    ):
-        Field._validate_required_value_not_empty(field_definition, value)
-
-        ret_value: str = ""
-        if isinstance(value, (datetime.date, datetime.datetime)):
-            ret_value = value.isoformat()
-        ret_value = str(field_definition.default or "") if value is None else str(value)
-
-        ret_value = field_definition.correct_input(ret_value)
-
-        field_definition.is_valid(ret_value, raise_exc=True)
-        return field_definition.get_fixed_width_value(ret_value)
-
-    @staticmethod
-    def _validate_required_value_not_empty(
-        field_definition: FieldDefinition, value: Optional[str]
-    ) -> None:
-        if (
-            value is None
-            and field_definition.required
-            and field_definition.default is None
-        ):
-            raise EmptyRequiredFieldError(field_definition.field_name)
+        self.cleaned_value = self.field_definition.get_cleaned_value(raw_value)
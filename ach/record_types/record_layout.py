@@ -0,0 +1,221 @@
+"""
+Defines precomputed field layouts (offset tables) for record types.
+"""
+
+import re
+from operator import attrgetter
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple, Union
+from weakref import WeakValueDictionary
+
+from .record_fields import FieldDefinition, FieldType
+
+RAW_LINE_ENCODING = "ascii"
+
+_get_length = attrgetter("length")
+
+
+class FieldSlot(NamedTuple):
+    """
+    Position of a single field within a record line.
+
+    Attributes:
+        name: str -- key of the field in its field definition dict
+        start: int -- index of the first character of the field in a record line
+        end: int -- index after the last character of the field in a record line
+        field_definition: FieldDefinition -- definition of the field
+        field_slice: slice -- slice of the field in a record line
+    """
+
+    name: str
+    start: int
+    end: int
+    field_definition: FieldDefinition
+    field_slice: slice
+
+    @property
+    def field_type(self) -> FieldType:
+        """Get FieldType of the field's current definition."""
+        return self.field_definition.field_type
+
+    def read(self, line: Union[str, bytes]) -> str:
+        """Get the field's raw value out of a record line, decoding bytes as ASCII."""
+        value = line[self.field_slice]
+        if isinstance(value, str):
+            return value
+        return value.decode(RAW_LINE_ENCODING)
+
+
+class RecordLinePattern(NamedTuple):
+    """
+    Compiled regex validating all fields of a record line in one match.
+
+    Attributes:
+        regex: re.Pattern -- matches a whole record line, with one named group
+            per field in record line order
+        group_names: Tuple[str] -- group name of each field in record line order
+        unchecked_indexes: Tuple[int] -- positions of fields whose FieldType
+            has no fixed-width pattern; these groups match any characters
+            and still need to be cleaned field by field
+    """
+
+    regex: re.Pattern
+    group_names: Tuple[str, ...]
+    unchecked_indexes: Tuple[int, ...]
+
+
+class RecordLayout:
+    """
+    Immutable table of field positions computed from a field definition dict.
+    Use get_record_layout to get a cached instance.
+
+    Attributes:
+        slots: Tuple[FieldSlot] -- FieldSlots in record line order
+        field_names: Tuple[str] -- field names in record line order
+        field_name_set: FrozenSet[str] -- field names, for checking keyword arguments
+        slices: Tuple[slice] -- field slices in record line order
+        record_size: int -- sum of all field lengths
+        field_definition_dict: Dict[str, FieldDefinition] -- the dict
+            the layout was computed from
+        field_indexes: Dict[str, int] -- field names mapped to their positions
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    __slots__ = (
+        "slots",
+        "field_names",
+        "field_name_set",
+        "slices",
+        "record_size",
+        "field_definition_dict",
+        "field_indexes",
+        "_slots_by_name",
+        "_line_pattern",
+        "_signature",
+        "__weakref__",
+    )
+
+    def __init__(self, field_definition_dict: Dict[str, FieldDefinition]):
+        slots = []
+        start = 0
+        for name, field_def in field_definition_dict.items():
+            end = start + field_def.length
+            slots.append(FieldSlot(name, start, end, field_def, slice(start, end)))
+            start = end
+        self.slots: Tuple[FieldSlot, ...] = tuple(slots)
+        self.field_names: Tuple[str, ...] = tuple(x.name for x in slots)
+        self.field_name_set: FrozenSet[str] = frozenset(self.field_names)
+        self.slices: Tuple[slice, ...] = tuple(x.field_slice for x in slots)
+        self.record_size: int = start
+        self.field_definition_dict = field_definition_dict
+        self.field_indexes: Dict[str, int] = {x.name: i for i, x in enumerate(slots)}
+        self._slots_by_name: Dict[str, FieldSlot] = {x.name: x for x in slots}
+        self._line_pattern: Optional[Tuple[tuple, RecordLinePattern]] = None
+        self._signature = self._get_signature(field_definition_dict)
+
+    @staticmethod
+    def _get_signature(
+        field_definition_dict: Dict[str, FieldDefinition],
+    ) -> Tuple[Tuple[Tuple[str, FieldDefinition], ...], Tuple[int, ...]]:
+        return (
+            tuple(field_definition_dict.items()),
+            tuple(map(_get_length, field_definition_dict.values())),
+        )
+
+    def is_up_to_date(self, field_definition_dict: Dict[str, FieldDefinition]) -> bool:
+        """
+        Return True if the layout was computed from field_definition_dict
+        and its keys, field definitions and their lengths have not changed since.
+        """
+        return (
+            self.field_definition_dict is field_definition_dict
+            and self._signature == self._get_signature(field_definition_dict)
+        )
+
+    def __getitem__(self, field_name: str) -> FieldSlot:
+        return self._slots_by_name[field_name]
+
+    def __contains__(self, field_name: str) -> bool:
+        return field_name in self._slots_by_name
+
+    def __iter__(self) -> Iterator[FieldSlot]:
+        return iter(self.slots)
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def get_line_pattern(self) -> RecordLinePattern:
+        """
+        Get a RecordLinePattern built from each field's fixed-width pattern.
+        Rebuilt only when a field definition's FieldType has changed.
+        """
+        field_types = tuple(x.field_type for x in self.slots)
+        if self._line_pattern is None or self._line_pattern[0] != field_types:
+            self._line_pattern = (field_types, self._compile_line_pattern())
+        return self._line_pattern[1]
+
+    def _compile_line_pattern(self) -> RecordLinePattern:
+        patterns, group_names, unchecked_indexes = [], [], []
+        for i, slot in enumerate(self.slots):
+            group_name = re.sub(r"\W", "_", slot.name)
+            if not group_name.isidentifier() or group_name in group_names:
+                group_name = "field_{}".format(i)
+            field_pattern = slot.field_type.get_fixed_width_pattern(
+                slot.end - slot.start
+            )
+            if field_pattern is None:
+                field_pattern = ".{{{}}}".format(slot.end - slot.start)
+                unchecked_indexes.append(i)
+            patterns.append("(?P<{}>{})".format(group_name, field_pattern))
+            group_names.append(group_name)
+        return RecordLinePattern(
+            re.compile("".join(patterns), re.DOTALL),
+            tuple(group_names),
+            tuple(unchecked_indexes),
+        )
+
+    def split_line(self, line: Union[str, bytes]) -> List[str]:
+        """
+        Slices a record line into its field values in record line order.
+        Only the field values of bytes lines are decoded (as ASCII).
+        """
+        if isinstance(line, str):
+            return [line[x] for x in self.slices]
+        return [line[x].decode(RAW_LINE_ENCODING) for x in self.slices]
+
+
+_record_layout_cache: "WeakValueDictionary[int, RecordLayout]" = WeakValueDictionary()
+_kept_record_layouts: Dict[int, RecordLayout] = {}
+
+
+def get_record_layout(
+    field_definition_dict: Dict[str, FieldDefinition],
+    keep: bool = False,
+    refresh: bool = False,
+) -> RecordLayout:
+    """
+    Get the cached RecordLayout of a field definition dict,
+    computing it when the dict has no layout yet.
+
+    Cached layouts are returned as they are. If refresh, the layout is first
+    checked against the dict's keys, field definitions and field lengths,
+    and computed again if they have changed.
+
+    Layouts are cached for as long as they are in use (by records, for example).
+    If keep, the dict's layout stays cached for good, as it does for
+    the field definition dicts of RecordType subclasses.
+    """
+    key = id(field_definition_dict)
+    record_layout = _kept_record_layouts.get(key)
+    if record_layout is None:
+        record_layout = _record_layout_cache.get(key)
+    if record_layout is None or (
+        refresh and not record_layout.is_up_to_date(field_definition_dict)
+    ):
+        record_layout = RecordLayout(field_definition_dict)
+        _record_layout_cache[key] = record_layout
+        if key in _kept_record_layouts:
+            _kept_record_layouts[key] = record_layout
+    if keep:
+        # The layout references the dict, which keeps its id from being reused.
+        _kept_record_layouts[key] = record_layout
+    return record_layout
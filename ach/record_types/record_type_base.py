@@ -2,10 +2,11 @@
 Defines base RecordType class. Validates FieldDefinition arrays and instantiates Fields.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
-from ..constants import RECORD_SIZE
+from ..constants import RECORD_SIZE, ValidationLevel
 from .record_fields import Field, FieldDefinition
+from .record_layout import RAW_LINE_ENCODING, RecordLayout, get_record_layout
 
 
 class InvalidRecordSizeError(Exception):
@@ -77,38 +78,369 @@ class RecordTypeAggregateFieldCreationError(Exception):
         super().__init__(self.message)
 
 
+class RecordField(Field):
+    """
+    Field bound to a single value of a RecordType.
+    Getting or setting its cleaned value gets or sets the value on the record.
+    Records keep only cleaned values, so original_value is always None.
+
+    Attributes:
+        record: RecordType -- record the value belongs to
+        index: int -- position of the field in the record's layout
+    """
+
+    __slots__ = ("record", "index")
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, record: "RecordType", index: int):
+        self.record = record
+        self.index = index
+
+    @property
+    def field_definition(self) -> FieldDefinition:
+        """Get FieldDefinition of the bound field."""
+        return self.record.record_layout.slots[self.index].field_definition
+
+    @property
+    def original_value(self) -> None:
+        """Records do not keep original values."""
+        return None
+
+    @property
+    def cleaned_value(self) -> str:
+        """Get cleaned value from the record."""
+        return self.record.get_field_value(
+            self.record.record_layout.field_names[self.index]
+        )
+
+    @cleaned_value.setter
+    def cleaned_value(self, cleaned_value: str) -> None:
+        """Set cleaned value on the record as-is."""
+        self.record.set_cleaned_value(self.index, cleaned_value)
+
+
+class _FieldDefinitionDictAttribute:
+    """
+    Read-only field_definition_dict attribute of RecordTypes.
+    Gets the class's field definition dict on classes,
+    and the dict a record's layout was computed from on records.
+    """
+
+    __slots__ = ("class_field_definition_dict",)
+
+    def __init__(self, class_field_definition_dict: Dict[str, FieldDefinition]):
+        self.class_field_definition_dict = class_field_definition_dict
+
+    def __get__(
+        self, record: Optional["RecordType"], owner: type
+    ) -> Dict[str, FieldDefinition]:
+        if record is not None:
+            try:
+                return record.record_layout.field_definition_dict
+            except AttributeError:
+                pass
+        return self.class_field_definition_dict
+
+    def __set__(self, record: "RecordType", value: Any) -> None:
+        raise AttributeError("field_definition_dict of a record is read-only")
+
+
 class RecordType:
     """
     Base class for record types.
     Renders Fields as a record line by validating FieldDefinitions and generating Fields from them.
+
+    Cleaned values are stored in a single list in record line order,
+    indexed through the record's RecordLayout; Fields returned by the fields
+    property are RecordFields that read and write that list.
+
+    Records created with RecordType.from_raw_line keep their raw line
+    and only clean values when they are first accessed.
+
+    The rendered record line is cached until a value is set.
+
+    validation_level sets how thoroughly values are checked when they are set
+    or lazily cleaned; see ValidationLevel.
+
+    If change_observer is set, its on_record_change(record, field_name) method
+    is called whenever a field is set, with set_field_value, set_field_values
+    or through the Fields returned by the fields property.
+
+    Instances use __slots__; a field definition dict passed in on instantiation
+    is kept on the record's layout, and record.field_definition_dict returns it.
     """
 
-    field_definition_dict: Dict[str, FieldDefinition] = {}
+    __slots__ = (
+        "record_layout",
+        "validation_level",
+        "change_observer",
+        "_raw_line",
+        "_rendered_line",
+        "_values",
+    )
+
+    field_definition_dict = _FieldDefinitionDictAttribute({})
+    _record_layout: RecordLayout = RecordLayout(
+        field_definition_dict.class_field_definition_dict
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        """Compute the layout of a subclass's field definitions when it is created."""
+        super().__init_subclass__(**kwargs)
+        cls._update_record_layout()
+
+    @classmethod
+    def _update_record_layout(cls) -> RecordLayout:
+        """
+        Compute the layout of the class's field definitions again if they have
+        changed, taking over a field definition dict assigned to the class.
+        """
+        field_definition_dict = cls.field_definition_dict
+        if cls.__dict__.get("field_definition_dict") is field_definition_dict:
+            cls.field_definition_dict = _FieldDefinitionDictAttribute(
+                field_definition_dict
+            )
+        cls._record_layout = get_record_layout(
+            field_definition_dict, keep=True, refresh=True
+        )
+        return cls._record_layout
+
+    @classmethod
+    def _get_record_layout_of(
+        cls, field_definition_dict: Optional[Dict[str, FieldDefinition]]
+    ) -> RecordLayout:
+        """
+        Get the layout of a field definition dict passed in on instantiation,
+        checking it for changes unless it is the class's own dict.
+        """
+        if field_definition_dict and (
+            field_definition_dict is not cls.field_definition_dict
+        ):
+            return get_record_layout(field_definition_dict, refresh=True)
+        return cls.get_record_layout()
 
     def __init__(
         self,
         field_definition_dict: Optional[Dict[str, FieldDefinition]] = None,
         desired_record_size: int = RECORD_SIZE,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
         **kwargs
     ):
-        if field_definition_dict:
-            self.field_definition_dict = field_definition_dict
+        self.record_layout: RecordLayout = self._get_record_layout_of(
+            field_definition_dict
+        )
+        field_definition_dict = self.record_layout.field_definition_dict
+        self.validation_level = validation_level
+        # The layout is computed once per dict, so checking it is only a comparison.
+        if self.record_layout.record_size != desired_record_size:
+            self._validate_field_definition_list(
+                field_definition_dict, desired_record_size
+            )
+        if not self.record_layout.field_name_set.issuperset(kwargs):
+            self._validate_no_unknown_key_arguments(field_definition_dict, kwargs)
+
+        self.change_observer: Optional[Any] = None
+        self._raw_line: Optional[Union[str, bytes]] = None
+        self._rendered_line: Optional[str] = None
+        self._values: List[Optional[str]] = self.generate_values_list(
+            field_definition_dict, kwargs
+        )
+
+    @classmethod
+    def from_raw_line(
+        cls,
+        line: Union[str, bytes],
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ) -> "RecordType":
+        """
+        Create a record that keeps its raw line and cleans and validates
+        each value only when it or all values are first accessed.
+        Until a field is set, render_record_line returns the raw line untouched.
+
+        Lines may be bytes, in which case only the accessed field values
+        are decoded (as ASCII).
 
-        self._validate_field_definition_list(
-            self.field_definition_dict, desired_record_size
+        Lines that are not exactly as long as the record size
+        are processed into values immediately.
+        """
+        record_layout = cls.get_record_layout()
+        if len(line) != record_layout.record_size:
+            return cls._from_split_line(record_layout, line, validation_level)
+        return cls._from_values_list(
+            record_layout,
+            [None] * len(record_layout),
+            raw_line=line,
+            validation_level=validation_level,
         )
-        self._validate_no_unknown_key_arguments(self.field_definition_dict, kwargs)
 
-        self.fields: Dict[str, Field] = self._generate_fields_dict(
-            self.field_definition_dict, kwargs
+    @classmethod
+    def from_record_line(
+        cls,
+        line: Union[str, bytes],
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ) -> "RecordType":
+        """
+        Create a record from a record line, validating all fields at once
+        with a single match of the layout's RecordLinePattern.
+        Only fields whose FieldType has no fixed-width pattern are cleaned one by one.
+
+        Lines that do not match are processed field by field as on instantiation,
+        so their values are corrected or raise the usual per-field errors.
+
+        With ValidationLevel.TRUSTED, full-length lines are only sliced into values.
+        """
+        record_layout = cls.get_record_layout()
+        if isinstance(line, bytes):
+            line = line.decode(RAW_LINE_ENCODING)
+        if (
+            validation_level is ValidationLevel.TRUSTED
+            and len(line) == record_layout.record_size
+        ):
+            return cls._from_values_list(
+                record_layout,
+                record_layout.split_line(line),
+                validation_level=validation_level,
+            )
+        line_pattern = record_layout.get_line_pattern()
+        match = line_pattern.regex.fullmatch(line)
+        if match is None:
+            return cls._from_split_line(record_layout, line, validation_level)
+        values_list = list(match.groups())
+        try:
+            for index in line_pattern.unchecked_indexes:
+                values_list[index] = record_layout.slots[
+                    index
+                ].field_definition.get_cleaned_value(
+                    values_list[index], validation_level
+                )
+        except Exception:
+            return cls._from_split_line(record_layout, line, validation_level)
+        return cls._from_values_list(
+            record_layout, values_list, validation_level=validation_level
         )
 
+    @classmethod
+    def from_cleaned_values(
+        cls,
+        values_list: List[str],
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ) -> "RecordType":
+        """
+        Create a record from a list of already cleaned, fixed-width values
+        in record line order, like those returned by FieldDefinition.get_cleaned_value.
+        Values are used as-is without being checked; the list is not copied.
+        """
+        return cls._from_values_list(
+            cls.get_record_layout(), values_list, validation_level=validation_level
+        )
+
+    @classmethod
+    def _from_split_line(
+        cls,
+        record_layout: RecordLayout,
+        line: Union[str, bytes],
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ) -> "RecordType":
+        return cls(
+            validation_level=validation_level,
+            **dict(zip(record_layout.field_names, record_layout.split_line(line)))
+        )
+
+    @classmethod
+    def _from_values_list(
+        cls,
+        record_layout: RecordLayout,
+        values_list: List[Optional[str]],
+        raw_line: Optional[Union[str, bytes]] = None,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+    ) -> "RecordType":
+        record = cls.__new__(cls)
+        record.record_layout = record_layout
+        record.validation_level = validation_level
+        record.change_observer = None
+        record._raw_line = raw_line
+        record._rendered_line = None
+        record._values = values_list
+        return record
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(getattr(self, "__dict__", {}))
+        for slot_name in RecordType.__slots__[1:]:
+            state[slot_name] = getattr(self, slot_name)
+        field_definition_dict = self.record_layout.field_definition_dict
+        if field_definition_dict is not type(self).field_definition_dict:
+            state["field_definition_dict"] = field_definition_dict
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        state = dict(state)
+        self.record_layout = self._get_record_layout_of(
+            state.pop("field_definition_dict", None)
+        )
+        self.validation_level = ValidationLevel.STRICT
+        for key, value in state.items():
+            setattr(self, key, value)
+
+    @property
+    def fields(self) -> Dict[str, Field]:
+        """
+        Get all field names mapped to Fields bound to this record's values.
+        Setting a returned Field's value sets it on this record.
+        """
+        return {
+            x: RecordField(self, i)
+            for i, x in enumerate(self.record_layout.field_names)
+        }
+
+    @fields.setter
+    def fields(self, fields: Dict[str, Field]) -> None:
+        """Replace all values with the values of Fields."""
+        self._values = [fields[x].value for x in self.record_layout.field_names]
+        self._raw_line = None
+        self._rendered_line = None
+        if self.change_observer is not None:
+            for field_name in self.record_layout.field_names:
+                self.change_observer.on_record_change(self, field_name)
+
     def render_record_line(self) -> str:
-        """Render single record as a line in a valid ACH file."""
-        result = ""
-        for field in self.fields.values():
-            result += field.value
-        return result
+        """
+        Render single record as a line in a valid ACH file.
+        Cached until a field is set.
+        """
+        if self._rendered_line is not None:
+            return self._rendered_line
+        if isinstance(self._raw_line, str):
+            return self._raw_line
+        if self._raw_line is not None:
+            self._rendered_line = self._raw_line.decode(RAW_LINE_ENCODING)
+        else:
+            self._rendered_line = "".join(self._values)
+        return self._rendered_line
+
+    def render_record_into(
+        self, buffer: Union[bytearray, memoryview], offset: int = 0
+    ) -> None:
+        """
+        Render single record as ASCII into a writable buffer starting at offset.
+        A raw bytes line is copied as-is without decoding.
+        """
+        line = self._raw_line
+        if not isinstance(line, bytes):
+            line = self.render_record_line().encode(RAW_LINE_ENCODING)
+        buffer[offset : offset + len(line)] = line
+
+    @classmethod
+    def get_record_layout(cls) -> RecordLayout:
+        """
+        Get precomputed field positions of the class's field definitions.
+        The layout is computed when the class is created and again when
+        a new field definition dict is assigned to the class;
+        to change keys or field lengths, assign a new dict.
+        """
+        record_layout = cls._record_layout
+        if record_layout.field_definition_dict is not cls.field_definition_dict:
+            record_layout = cls._update_record_layout()
+        return record_layout
 
     @classmethod
     def get_required_kwargs(cls) -> Dict[str, FieldDefinition]:
@@ -124,34 +456,49 @@ class RecordType:
 
     def get_field_value(self, field_name: str) -> str:
         """Get cleaned Field value of given field name."""
-        return self.fields[field_name].value
+        index = self.record_layout.field_indexes[field_name]
+        value = self._values[index]
+        if value is None:
+            slot = self.record_layout.slots[index]
+            value = slot.field_definition.get_cleaned_value(
+                slot.read(self._raw_line), self.validation_level
+            )
+            self._values[index] = value
+        return value
 
     def get_field_values(self) -> Dict[str, str]:
         """
         Get all field names (keys) mapped to all cleaned Field values.
         """
-        return {x: y.value for x, y in self.fields.items()}
+        return dict(zip(self.record_layout.field_names, self._get_values_list()))
 
     def set_field_value(
         self,
         key: str,
         value: Any,
         field_def_dict: Optional[Dict] = None,
-        fields_dict: Optional[Dict] = None,
+        values_list: Optional[List[Optional[str]]] = None,
     ) -> None:
         """
         Set a new value on a single field after object creation.
         Raises InvalidRecordTypeParametersError if key does not exist in field definitions.
         """
         if field_def_dict is None:
-            field_def_dict = self.field_definition_dict
-
-        if fields_dict is None:
-            fields_dict = self.fields
-
+            field_def_dict = self.record_layout.field_definition_dict
         if key not in field_def_dict:
             raise InvalidRecordTypeParametersError(type(self).__name__, [key])
-        fields_dict[key] = Field(field_def_dict[key], value)
+
+        notify_change = values_list is None
+        if values_list is None:
+            values_list = self._get_values_list()
+            self._raw_line = None
+
+        values_list[self.record_layout.field_indexes[key]] = field_def_dict[
+            key
+        ].get_cleaned_value(value, self.validation_level)
+        self._rendered_line = None
+        if notify_change and self.change_observer is not None:
+            self.change_observer.on_record_change(self, key)
 
     def set_field_values(self, **kwargs) -> None:
         """
@@ -167,10 +514,40 @@ class RecordType:
                 type(self).__name__, exceptions, failed_keys
             ) from exceptions[0]
 
-    def _generate_fields_dict(
+    def set_cleaned_value(self, index: int, cleaned_value: str) -> None:
+        """
+        Set an already cleaned value by its index in the record's layout,
+        as RecordFields do, and report the change to change_observer.
+        """
+        self._get_values_list()[index] = cleaned_value
+        self._raw_line = None
+        self._rendered_line = None
+        if self.change_observer is not None:
+            self.change_observer.on_record_change(
+                self, self.record_layout.field_names[index]
+            )
+
+    def _get_values_list(self) -> List[Optional[str]]:
+        if self._raw_line is not None and None in self._values:
+            self._values = self.generate_values_list(
+                self.record_layout.field_definition_dict,
+                dict(
+                    zip(
+                        self.record_layout.field_names,
+                        self.record_layout.split_line(self._raw_line),
+                    )
+                ),
+            )
+        return self._values
+
+    def generate_values_list(
         self, field_def_dict: Dict, kwargs: Dict
-    ) -> Dict[str, Field]:
-        fields = {}
+    ) -> List[Optional[str]]:
+        """
+        Clean the values passed in for each field definition into a list
+        in record line order. Overridden by specialized record types.
+        """
+        values_list: List[Optional[str]] = [None] * len(field_def_dict)
         failed_keys, exceptions = [], []
         for key in field_def_dict:
             self._catch_set_value_on_field_errors(
@@ -179,13 +556,13 @@ class RecordType:
                 key,
                 kwargs.get(key),
                 field_def_dict=field_def_dict,
-                fields_dict=fields,
+                values_list=values_list,
             )
         if exceptions:
             raise RecordTypeAggregateFieldCreationError(
                 type(self).__name__, exceptions, failed_keys
             ) from exceptions[0]
-        return fields
+        return values_list
 
     def _catch_set_value_on_field_errors(
         self,
@@ -213,10 +590,7 @@ class RecordType:
         field_definition_dict: Dict[str, FieldDefinition],
         desired_record_size: int = RECORD_SIZE,
     ) -> None:
-        resulting_record_size = 0
-        for field_def in field_definition_dict.values():
-            resulting_record_size += field_def.length
-
+        resulting_record_size = get_record_layout(field_definition_dict).record_size
         if resulting_record_size != desired_record_size:
             raise InvalidRecordSizeError(
                 cls.__name__, resulting_record_size, desired_record_size
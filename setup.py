@@ -18,4 +18,5 @@ setup(
         "Operating System :: OS Independent",
     ],
     python_requires='>=3.6',
+    extras_require={'numpy': ['numpy']},
 )
@@ -1,2 +1,18 @@
+from ach.record_types import BlankPaddedRoutingNumberFieldType, FileHeaderRecordType
+
 with open("tests/sample_test_file.ach", "r") as f:
     test_file = f.read()
+
+
+class BlankPaddedOriginIdTestMixin:
+    """
+    Switches the file header's origin_id field to BlankPaddedRoutingNumberFieldType
+    for the duration of each test, so files with a blank-padded origin ID
+    can be built and parsed; the original FieldType is restored afterwards.
+    """
+
+    def setUp(self) -> None:
+        origin_id_def = FileHeaderRecordType.field_definition_dict["origin_id"]
+        self.addCleanup(setattr, origin_id_def, "field_type", origin_id_def.field_type)
+        origin_id_def.field_type = BlankPaddedRoutingNumberFieldType
+        return super().setUp()
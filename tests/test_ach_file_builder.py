@@ -7,13 +7,15 @@ from ach.record_types import (
     AddendaRecordType,
     BatchHeaderRecordType,
     EntryDetailRecordType,
+    InvalidRecordTypeParametersError,
+    RecordTypeAggregateFieldCreationError,
 )
 from ach.record_types.record_fields import (
     AlphaNumFieldType,
     BlankPaddedRoutingNumberFieldType,
 )
 from ach.constants import AutoDateInput, BatchStandardEntryClassCode, TransactionCode
-from tests import test_file
+from tests import BlankPaddedOriginIdTestMixin, test_file
 
 
 class TestDisplayRequiredKeys(TestCase):
@@ -662,3 +664,130 @@ class TestACHFileBuilder(TestCase):
         self.ach_file_builder_class.file_header_record_type_class.field_definition_dict[
             "origin_id"
         ].field_type = BlankPaddedRoutingNumberFieldType
+
+
+class TestACHFileBuilderColumnar(BlankPaddedOriginIdTestMixin, TestCase):
+    entry_dicts = [
+        {
+            "transaction_code": TransactionCode.CHECKING_CREDIT,
+            "rdfi_routing": "123456789",
+            "rdfi_account_number": "65656565",
+            "amount": "300",
+            "individual_name": "Janey Test",
+        },
+        {
+            "transaction_code": 27,
+            "rdfi_routing": "123456789",
+            "rdfi_account_number": "65656565",
+            "amount": 300,
+            "individual_name": "Janey Test!",
+            "addendas": [
+                {"payment_related_information": "Reversing the last transaction"},
+                {"payment_related_information": "Thanks"},
+            ],
+        },
+        {
+            "transaction_code": 22,
+            "rdfi_routing": "023456789",
+            "rdfi_account_number": "45656565",
+            "amount": "7000",
+            "individual_name": "Mackey Shawnderson",
+            "addendas": [{"payment_related_information": "Where's my money"}],
+        },
+    ]
+
+    def _get_builder(self):
+        b = ACHFileBuilder(
+            destination_routing="012345678",
+            origin_id="102345678",
+            destination_name="YOUR BANK",
+            origin_name="YOUR COMPANY",
+            file_creation_date="220101",
+            file_creation_time="1200",
+        )
+        b.add_batch(
+            company_name="YOUR COMPANY",
+            company_identification="1234567890",
+            company_entry_description="Test",
+            effective_entry_date="220102",
+        )
+        return b
+
+    def _get_columns(self):
+        return {
+            key: [x[key] for x in self.entry_dicts]
+            for key in (
+                "transaction_code",
+                "rdfi_account_number",
+                "amount",
+                "individual_name",
+            )
+        }
+
+    def test_add_entries_columnar_matches_entry_dicts(self):
+        b = self._get_builder()
+        b.add_entries_and_addendas([dict(x) for x in self.entry_dicts] * 2)
+        columnar_b = self._get_builder()
+        columnar_b.add_entries_columnar(
+            rdfi_routing=[x["rdfi_routing"] for x in self.entry_dicts],
+            addendas=[x.get("addendas") for x in self.entry_dicts],
+            **self._get_columns()
+        )
+        columnar_b.add_entries_columnar(
+            rdfi_routing=[x["rdfi_routing"] for x in self.entry_dicts],
+            addendas=[x.get("addendas") for x in self.entry_dicts],
+            **self._get_columns()
+        )
+        self.assertEqual(columnar_b.render(), b.render())
+        self.assertEqual(
+            columnar_b.ach_file_contents.get_control_totals(),
+            b.ach_file_contents.get_control_totals(),
+        )
+
+    def test_add_entries_columnar_single_values(self):
+        b = self._get_builder()
+        b.add_entries_columnar(
+            transaction_code=22,
+            rdfi_routing="123456789",
+            rdfi_account_number=range(3),
+            amount=[1, 2, 3],
+            individual_name="Janey Test",
+        )
+        entries = [x.entry for x in b.ach_file_contents.batches[0].transactions]
+        self.assertEqual(
+            [x.get_field_value("trace_sequence_number") for x in entries],
+            ["0000001", "0000002", "0000003"],
+        )
+        self.assertEqual(
+            {x.get_field_value("rdfi_routing") for x in entries}, {"123456789"}
+        )
+
+    def test_add_entries_columnar_validates_columns(self):
+        b = self._get_builder()
+        with self.assertRaises(RecordTypeAggregateFieldCreationError) as context:
+            b.add_entries_columnar(
+                transaction_code=22,
+                rdfi_routing=["123456789", "12345678a"],
+                rdfi_account_number=["1", "2"],
+                amount=[1, "two"],
+            )
+        self.assertEqual(
+            context.exception.failed_keys,
+            ["rdfi_routing", "amount", "individual_name"],
+        )
+        self.assertEqual(b.ach_file_contents.batches[0].transactions, [])
+
+        with self.assertRaises(InvalidRecordTypeParametersError):
+            b.add_entries_columnar(not_a_field=[1])
+        with self.assertRaises(ValueError):
+            b.add_entries_columnar(amount=[1, 2], individual_name=["Janey Test"])
+
+    def test_add_entries_columnar_before_batch(self):
+        b = ACHFileBuilder(
+            destination_routing="012345678",
+            origin_id="102345678",
+            destination_name="YOUR BANK",
+            origin_name="YOUR COMPANY",
+        )
+        with self.assertRaises(NoBatchForTransactionError):
+            b.add_entries_columnar(amount=[1])
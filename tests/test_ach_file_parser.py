@@ -1,12 +1,20 @@
 """Test file_parser.py"""
 
+import io
+import os
+import tempfile
 from unittest import TestCase
 
-from ach.files import ACHFileContentsParser
-from tests import test_file
+from ach.constants import RECORD_SIZE
+from ach.files import (
+    ACHFileContentsParser,
+    BatchControlWithoutBatchHeaderError,
+    MissingFileRecordError,
+)
+from tests import BlankPaddedOriginIdTestMixin, test_file
 
 
-class TestParser(TestCase):
+class TestParser(BlankPaddedOriginIdTestMixin, TestCase):
     def test_parser(self):
         test_file_lines = test_file.splitlines()
 
@@ -26,3 +34,314 @@ class TestParser(TestCase):
         for i, record_dict in enumerate(record_dicts):
             for key, val in record_dict.items():
                 self.assertEqual(val, records_list[i].get_field_value(key))
+
+    def test_parser_lazy(self):
+        parser = ACHFileContentsParser(test_file, lazy=True)
+        records_list = parser.process_records_list()
+        self.assertEqual(
+            [r.render_record_line() for r in records_list],
+            [line for line in test_file.splitlines() if line != "9" * RECORD_SIZE],
+        )
+        ach_file_contents = parser.process_ach_file_contents(records_list)
+        self.assertEqual(ach_file_contents.render_file_contents(), test_file)
+        self.assertDictEqual(
+            ach_file_contents.render_json_dict(),
+            ACHFileContentsParser(test_file)
+            .process_ach_file_contents()
+            .render_json_dict(),
+        )
+
+    def test_iter_records_text_file_object(self):
+        records_list = ACHFileContentsParser(test_file).process_records_list()
+        records = list(
+            ACHFileContentsParser.iter_records(io.StringIO(test_file), chunk_size=7)
+        )
+        self.assertEqual(
+            [r.render_record_line() for r in records],
+            [r.render_record_line() for r in records_list],
+        )
+
+    def test_iter_records_binary_file_object(self):
+        records_list = ACHFileContentsParser(test_file).process_records_list()
+        records = list(
+            ACHFileContentsParser.iter_records(
+                io.BytesIO(test_file.encode("ascii")), chunk_size=100
+            )
+        )
+        self.assertEqual(
+            [r.render_record_line() for r in records],
+            [r.render_record_line() for r in records_list],
+        )
+
+    def test_iter_records_is_lazy(self):
+        fileobj = io.StringIO(test_file)
+        records = ACHFileContentsParser.iter_records(fileobj, chunk_size=RECORD_SIZE)
+        first_record = next(records)
+        self.assertEqual(first_record.get_field_value("record_type_code"), "1")
+        self.assertLess(fileobj.tell(), len(test_file))
+
+    def test_iter_lines_without_trailing_line_break(self):
+        lines = list(
+            ACHFileContentsParser.iter_lines(io.BytesIO(b"ab\r\ncd"), line_break="\r\n")
+        )
+        self.assertEqual(lines, ["ab", "cd"])
+
+    def test_iter_records_crlf_and_fixed_block(self):
+        expected_lines = [x for x in test_file.splitlines() if x != "9" * RECORD_SIZE]
+        for file_str in (
+            test_file.replace("\n", "\r\n"),
+            test_file.replace("\n", ""),
+        ):
+            for fileobj in (io.StringIO(file_str), io.BytesIO(file_str.encode())):
+                for chunk_size in (7, RECORD_SIZE, 1000):
+                    fileobj.seek(0)
+                    records = ACHFileContentsParser.iter_records(
+                        fileobj, chunk_size=chunk_size
+                    )
+                    self.assertEqual(
+                        [r.render_record_line() for r in records], expected_lines
+                    )
+
+    def test_iter_lines_splits_fixed_block_lines(self):
+        lines = list(
+            ACHFileContentsParser.iter_lines(
+                io.BytesIO(b"1" * RECORD_SIZE * 3 + b"22\r\n\r\n3"),
+                chunk_size=50,
+                encoding=None,
+            )
+        )
+        self.assertEqual(lines, [b"1" * RECORD_SIZE] * 3 + [b"22", b"3"])
+
+
+class TestParserFromPath(BlankPaddedOriginIdTestMixin, TestCase):
+    def setUp(self):
+        self.expected_lines = [
+            line for line in test_file.splitlines() if line != "9" * RECORD_SIZE
+        ]
+        return super().setUp()
+
+    def _write_temp_file(self, contents: bytes) -> str:
+        with tempfile.NamedTemporaryFile(suffix=".ach", delete=False) as temp_file:
+            temp_file.write(contents)
+        self.addCleanup(os.remove, temp_file.name)
+        return temp_file.name
+
+    def _assert_parsed_lines(self, parser: ACHFileContentsParser):
+        records_list = parser.process_records_list()
+        self.assertEqual(
+            [r.render_record_line() for r in records_list], self.expected_lines
+        )
+        self.assertEqual(
+            parser.process_ach_file_contents().render_file_contents(), test_file
+        )
+
+    def test_from_path_chunked(self):
+        path = self._write_temp_file(test_file.encode("ascii"))
+        self._assert_parsed_lines(ACHFileContentsParser.from_path(path))
+
+    def test_from_path_modes_split_lines_alike(self):
+        for contents in (
+            test_file,
+            test_file.replace("\n", "\r\n"),
+            test_file.replace("\n", ""),
+        ):
+            path = self._write_temp_file(contents.encode("ascii"))
+            for use_mmap in (False, True):
+                for encoding in ("ascii", None):
+                    with self.subTest(
+                        contents=contents[94:96], mmap=use_mmap, encoding=encoding
+                    ):
+                        self._assert_parsed_lines(
+                            ACHFileContentsParser.from_path(
+                                path, mmap=use_mmap, encoding=encoding
+                            )
+                        )
+
+    def test_from_path_mmap_newline_delimited(self):
+        path = self._write_temp_file(test_file.encode("ascii"))
+        self._assert_parsed_lines(ACHFileContentsParser.from_path(path, mmap=True))
+
+    def test_from_path_mmap_crlf_delimited(self):
+        path = self._write_temp_file(test_file.replace("\n", "\r\n").encode("ascii"))
+        self._assert_parsed_lines(ACHFileContentsParser.from_path(path, mmap=True))
+
+    def test_from_path_mmap_fixed_block(self):
+        path = self._write_temp_file(test_file.replace("\n", "").encode("ascii"))
+        self._assert_parsed_lines(ACHFileContentsParser.from_path(path, mmap=True))
+
+    def test_from_path_mmap_short_lines(self):
+        path = self._write_temp_file(
+            "\n".join(line.rstrip() for line in test_file.splitlines()).encode("ascii")
+        )
+        self._assert_parsed_lines(ACHFileContentsParser.from_path(path, mmap=True))
+
+    def test_from_path_mmap_lazy(self):
+        path = self._write_temp_file(test_file.encode("ascii"))
+        self._assert_parsed_lines(
+            ACHFileContentsParser.from_path(path, mmap=True, lazy=True)
+        )
+
+    def test_from_path_mmap_empty_file(self):
+        path = self._write_temp_file(b"")
+        parser = ACHFileContentsParser.from_path(path, mmap=True)
+        self.assertEqual(parser.process_records_list(), [])
+
+
+class TestParserParallel(BlankPaddedOriginIdTestMixin, TestCase):
+    def setUp(self):
+        lines = test_file.splitlines()
+        batch_lines = lines[1:7]
+        multi_batch_lines = [lines[0]] + batch_lines * 9 + [lines[7]]
+        self.multi_batch_file = "\n".join(multi_batch_lines) + "\n"
+        with tempfile.NamedTemporaryFile(suffix=".ach", delete=False) as temp_file:
+            temp_file.write(self.multi_batch_file.encode("ascii"))
+        self.addCleanup(os.remove, temp_file.name)
+        self.path = temp_file.name
+        return super().setUp()
+
+    def _assert_matches_sequential_parse(self, ach_file_contents):
+        expected = ACHFileContentsParser(
+            self.multi_batch_file
+        ).process_ach_file_contents()
+        self.assertEqual(len(ach_file_contents.batches), 9)
+        self.assertEqual(
+            ach_file_contents.render_file_contents(), expected.render_file_contents()
+        )
+        self.assertDictEqual(
+            ach_file_contents.render_json_dict(), expected.render_json_dict()
+        )
+
+    def test_parse_parallel(self):
+        self._assert_matches_sequential_parse(
+            ACHFileContentsParser.parse_parallel(self.path, workers=2)
+        )
+
+    def test_parse_parallel_lazy(self):
+        self._assert_matches_sequential_parse(
+            ACHFileContentsParser.parse_parallel(self.path, workers=3, lazy=True)
+        )
+
+    def test_parse_parallel_single_worker(self):
+        self._assert_matches_sequential_parse(
+            ACHFileContentsParser.parse_parallel(self.path, workers=1)
+        )
+
+    def test_parse_parallel_recalc_control_records(self):
+        ach_file_contents = ACHFileContentsParser.parse_parallel(
+            self.path, workers=2, recalc_control_records=True
+        )
+        self.assertEqual(
+            int(ach_file_contents.file_control_record.get_field_value("batch_count")),
+            9,
+        )
+
+    def test_parse_parallel_batch_control_without_batch_header(self):
+        lines = test_file.splitlines()
+        for bad_lines in (
+            [lines[0], lines[6], lines[7]],
+            [lines[0]] + lines[1:7] + [lines[6], lines[7]],
+        ):
+            with tempfile.NamedTemporaryFile(suffix=".ach", delete=False) as temp_file:
+                temp_file.write(("\n".join(bad_lines) + "\n").encode("ascii"))
+            self.addCleanup(os.remove, temp_file.name)
+            with self.assertRaises(BatchControlWithoutBatchHeaderError):
+                ACHFileContentsParser.parse_parallel(temp_file.name, workers=1)
+
+    def _write_temp_file(self, lines):
+        with tempfile.NamedTemporaryFile(suffix=".ach", delete=False) as temp_file:
+            temp_file.write(("\n".join(lines) + "\n").encode("ascii"))
+        self.addCleanup(os.remove, temp_file.name)
+        return temp_file.name
+
+    def test_parse_parallel_missing_file_header(self):
+        path = self._write_temp_file(test_file.splitlines()[1:8])
+        with self.assertRaisesRegex(MissingFileRecordError, "file header"):
+            ACHFileContentsParser.parse_parallel(path, workers=1)
+
+    def test_parse_parallel_missing_file_control(self):
+        path = self._write_temp_file(test_file.splitlines()[:7])
+        with self.assertRaisesRegex(MissingFileRecordError, "file control"):
+            ACHFileContentsParser.parse_parallel(path, workers=1)
+        ach_file_contents = ACHFileContentsParser.parse_parallel(
+            path, workers=1, recalc_control_records=True
+        )
+        self.assertEqual(len(ach_file_contents.batches), 1)
+
+    def test_parse_parallel_empty_file(self):
+        with tempfile.NamedTemporaryFile(suffix=".ach", delete=False) as temp_file:
+            pass
+        self.addCleanup(os.remove, temp_file.name)
+        with self.assertRaisesRegex(MissingFileRecordError, "file header"):
+            ACHFileContentsParser.parse_parallel(temp_file.name, workers=1)
+
+
+class TestParserBytes(BlankPaddedOriginIdTestMixin, TestCase):
+    def setUp(self):
+        self.expected_lines = [
+            line for line in test_file.splitlines() if line != "9" * RECORD_SIZE
+        ]
+        return super().setUp()
+
+    def test_parser_bytes(self):
+        for lazy in (False, True):
+            parser = ACHFileContentsParser(test_file.encode("ascii"), lazy=lazy)
+            records_list = parser.process_records_list()
+            self.assertEqual(
+                [r.render_record_line() for r in records_list], self.expected_lines
+            )
+            self.assertEqual(
+                parser.process_ach_file_contents(records_list).render_file_contents(),
+                test_file,
+            )
+
+    def test_convert_memoryview_to_records_list(self):
+        records_list = ACHFileContentsParser.convert_file_string_to_records_list(
+            memoryview(test_file.encode("ascii")), lazy=True
+        )
+        self.assertEqual(
+            [r.render_record_line() for r in records_list], self.expected_lines
+        )
+
+    def test_split_memoryview_slices_lines(self):
+        file_bytes = bytearray(test_file.replace("\n", "\r\n").encode("ascii"))
+        for view in (memoryview(file_bytes), memoryview(file_bytes)[94:]):
+            self.assertEqual(
+                ACHFileContentsParser.split_file_string(view, "\r\n"),
+                view.tobytes().split(b"\r\n"),
+            )
+
+    def test_lazy_records_keep_bytes_lines(self):
+        records = list(
+            ACHFileContentsParser.iter_records(
+                io.BytesIO(test_file.encode("ascii")), encoding=None, lazy=True
+            )
+        )
+        self.assertIsInstance(records[2]._raw_line, bytes)
+        self.assertEqual(records[2].get_field_value("amount"), "0000001000")
+        self.assertEqual([r.render_record_line() for r in records], self.expected_lines)
+
+    def test_eager_records_from_bytes_lines(self):
+        records = list(
+            ACHFileContentsParser.iter_records(
+                io.BytesIO(test_file.encode("ascii")), encoding=None
+            )
+        )
+        self.assertEqual(records[2].get_field_value("amount"), "0000001000")
+        self.assertEqual([r.render_record_line() for r in records], self.expected_lines)
+
+    def test_mmap_bytes_lines(self):
+        with tempfile.NamedTemporaryFile(suffix=".ach", delete=False) as temp_file:
+            temp_file.write(test_file.encode("ascii"))
+        self.addCleanup(os.remove, temp_file.name)
+        parser = ACHFileContentsParser.from_path(
+            temp_file.name, mmap=True, encoding=None, lazy=True
+        )
+        self.assertEqual(
+            parser.process_ach_file_contents().render_file_contents(), test_file
+        )
+        self.assertEqual(
+            ACHFileContentsParser.parse_parallel(
+                temp_file.name, workers=1, encoding=None, lazy=True
+            ).render_file_contents(),
+            test_file,
+        )
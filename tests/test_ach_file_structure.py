@@ -1,5 +1,9 @@
 """Tests ACH file structure representation."""
 
+import codecs
+import copy
+import pickle
+from io import BytesIO, StringIO
 from unittest import TestCase
 
 from ach.constants import RECORD_SIZE
@@ -9,16 +13,17 @@ from ach.files import (
     ACHTransactionEntry,
     ACHFileContentsParser,
 )
+from ach.files.file_structure import ControlTotals
 from ach.record_types import (
     AddendaRecordType,
     BatchHeaderRecordType,
     EntryDetailRecordType,
     FileHeaderRecordType,
 )
-from tests import test_file
+from tests import BlankPaddedOriginIdTestMixin, test_file
 
 
-class TestACHFileContents(TestCase):
+class TestACHFileContents(BlankPaddedOriginIdTestMixin, TestCase):
     def test_ach_file_contents(self):
         billy = EntryDetailRecordType(
             transaction_code=27,
@@ -149,3 +154,335 @@ class TestACHFileContents(TestCase):
         self.assertEqual(
             int(ach_file_contents.file_control_record.get_field_value("batch_count")), 2
         )
+
+    def test_transaction_count(self):
+        ach_file_contents = ACHFileContentsParser(test_file).process_ach_file_contents()
+        self.assertEqual(ach_file_contents.transaction_count, 3)
+        self.assertEqual(ach_file_contents.batches[0].transaction_count, 3)
+
+        new_batch = ACHBatch(
+            BatchHeaderRecordType(
+                company_name="Test Company",
+                company_identification="0912",
+                company_entry_description="Various",
+                odfi_identification="12345678",
+                batch_number=2,
+            ),
+        )
+        ach_file_contents.add_batch(new_batch)
+        new_batch.add_transaction(
+            ACHTransactionEntry(
+                EntryDetailRecordType(
+                    transaction_code=27,
+                    rdfi_routing="012345678",
+                    rdfi_account_number="0123456",
+                    amount=100,
+                    individual_name="Hello Darling",
+                    trace_odfi_identifier=12345678,
+                    trace_sequence_number=4,
+                    addenda_record_indicator=0,
+                ),
+            )
+        )
+        self.assertEqual(new_batch.transaction_count, 1)
+        self.assertEqual(ach_file_contents.transaction_count, 4)
+
+        ach_file_contents.batches[0].remove_transaction_by_index(0)
+        self.assertEqual(ach_file_contents.transaction_count, 3)
+
+        ach_file_contents.remove_batch_by_index(0)
+        self.assertEqual(ach_file_contents.transaction_count, 1)
+        self.assertEqual(
+            ach_file_contents.transaction_count,
+            len(ach_file_contents.get_all_transactions()),
+        )
+
+    def test_render_to(self):
+        ach_file_contents = ACHFileContentsParser(test_file).process_ach_file_contents()
+        for line_break, end in (("\n", "\n"), ("\r\n", "")):
+            text_stream = StringIO()
+            ach_file_contents.render_to(text_stream, line_break=line_break, end=end)
+            file_contents_str = ach_file_contents.render_file_contents(
+                line_break=line_break, end=end
+            )
+            self.assertEqual(text_stream.getvalue(), file_contents_str)
+
+            bytes_stream = BytesIO()
+            ach_file_contents.render_to(bytes_stream, line_break=line_break, end=end)
+            self.assertEqual(bytes_stream.getvalue(), file_contents_str.encode("ascii"))
+
+        batch = ach_file_contents.batches[0]
+        batch_stream = StringIO()
+        batch.render_to(batch_stream, end="")
+        self.assertEqual(
+            batch_stream.getvalue(), "\n".join(batch.get_rendered_line_list())
+        )
+
+    def test_render_to_other_file_objects(self):
+        ach_file_contents = ACHFileContentsParser(test_file).process_ach_file_contents()
+        file_contents_str = ach_file_contents.render_file_contents()
+
+        bytes_stream = BytesIO()
+        ach_file_contents.render_to(codecs.getwriter("ascii")(bytes_stream))
+        self.assertEqual(bytes_stream.getvalue(), file_contents_str.encode("ascii"))
+
+        class Writer:
+            def __init__(self):
+                self.written = []
+
+            def write(self, data):
+                self.written.append(data)
+
+        text_writer = Writer()
+        ach_file_contents.render_to(text_writer)
+        self.assertEqual("".join(text_writer.written), file_contents_str)
+        bytes_writer = Writer()
+        ach_file_contents.render_to(bytes_writer, binary=True)
+        self.assertEqual(
+            b"".join(bytes_writer.written), file_contents_str.encode("ascii")
+        )
+
+    def test_render_bytes(self):
+        ach_file_contents = ACHFileContentsParser(test_file).process_ach_file_contents()
+        lazy_ach_file_contents = ACHFileContentsParser(
+            test_file.encode("ascii"), lazy=True
+        ).process_ach_file_contents()
+        for line_break, end in (("\n", "\n"), ("\r\n", "")):
+            file_contents_str = ach_file_contents.render_file_contents(
+                line_break=line_break, end=end
+            )
+            file_contents_bytes = ach_file_contents.render_bytes(
+                line_break=line_break, end=end
+            )
+            self.assertIsInstance(file_contents_bytes, memoryview)
+            self.assertEqual(file_contents_bytes, file_contents_str.encode("ascii"))
+            self.assertEqual(
+                lazy_ach_file_contents.render_bytes(line_break=line_break, end=end),
+                file_contents_str.encode("ascii"),
+            )
+
+        batch = ach_file_contents.batches[0]
+        for _ in range(3):
+            batch.add_transaction(batch.transactions[0])
+        self.assertEqual(
+            ach_file_contents.render_bytes().tobytes(),
+            ach_file_contents.render_file_contents().encode("ascii"),
+        )
+
+    def test_batch_rendered_lines_cached_until_change(self):
+        ach_file_contents = ACHFileContentsParser(test_file).process_ach_file_contents()
+        batch = ach_file_contents.batches[0]
+        rendered_line_list = batch.get_rendered_line_list()
+        cached_line_list = batch._rendered_line_list
+        self.assertEqual(batch.get_rendered_line_list(), rendered_line_list)
+        self.assertIs(batch._rendered_line_list, cached_line_list)
+
+        batch.batch_header_record.set_field_value("company_name", "New Name")
+        self.assertTrue(batch.get_rendered_line_list()[0].startswith("5200New Name"))
+        self.assertTrue(batch.get_rendered_line_list()[-1].startswith("8200"))
+
+        addenda = batch.transactions[0].addendas[0]
+        addenda.set_field_value("payment_related_information", "Changed")
+        self.assertTrue(batch.get_rendered_line_list()[2].startswith("705Changed "))
+
+        batch.transactions[1].entry.set_field_value("individual_name", "Renamed")
+        self.assertEqual(
+            batch.get_rendered_line_list()[3][54:61],
+            "Renamed",
+        )
+
+        batch.remove_transaction_by_index(0)
+        self.assertEqual(
+            batch.get_rendered_line_list(),
+            [x.render_record_line() for x in batch.iter_records()],
+        )
+        self.assertEqual(len(batch.get_rendered_line_list()), 4)
+
+    def test_batch_rendered_lines_follow_list_changes(self):
+        ach_file_contents = ACHFileContentsParser(test_file).process_ach_file_contents()
+        batch = ach_file_contents.batches[0]
+        batch.get_rendered_line_list()
+
+        batch.transactions[0].entry.fields["individual_name"].value = "Renamed"
+        self.assertEqual(batch.get_rendered_line_list()[1][54:61], "Renamed")
+
+        batch.transactions.append(batch.transactions.pop(0))
+        self.assertEqual(
+            batch.get_rendered_line_list(),
+            [x.render_record_line() for x in batch.iter_records()],
+        )
+        self.assertEqual(batch.get_rendered_line_list()[-3][54:61], "Renamed")
+
+        del batch.transactions[0]
+        self.assertEqual(len(batch.get_rendered_line_list()), 5)
+        self.assertEqual(ach_file_contents.transaction_count, 2)
+        self.assertEqual(
+            int(
+                ach_file_contents.file_control_record.get_field_value(
+                    "entry_and_addenda_count"
+                )
+            ),
+            3,
+        )
+
+        batch.transactions[-1].addendas.clear()
+        self.assertEqual(len(batch.get_rendered_line_list()), 4)
+        self.assertEqual(
+            batch.get_control_totals(),
+            sum((x.get_control_totals() for x in batch.transactions), ControlTotals()),
+        )
+
+    def test_copies_keep_list_observers(self):
+        ach_file_contents = ACHFileContentsParser(test_file).process_ach_file_contents()
+        for copied in (
+            copy.deepcopy(ach_file_contents),
+            pickle.loads(pickle.dumps(ach_file_contents)),
+        ):
+            self.assertEqual(copied.render_file_contents(), test_file)
+            batch = copied.batches[0]
+            self.assertIs(batch.transactions.observer, batch)
+            batch.transactions.pop()
+            self.assertEqual(len(batch.get_rendered_line_list()), 5)
+            self.assertEqual(copied.transaction_count, 2)
+        self.assertEqual(ach_file_contents.render_file_contents(), test_file)
+
+
+class TestACHBatchControlTotals(BlankPaddedOriginIdTestMixin, TestCase):
+    def _make_entry(self, transaction_code, amount, trace_sequence_number):
+        return ACHTransactionEntry(
+            EntryDetailRecordType(
+                transaction_code=transaction_code,
+                rdfi_routing="012345678",
+                rdfi_account_number="0123456",
+                amount=amount,
+                individual_name="Hello Darling",
+                trace_odfi_identifier=12345678,
+                trace_sequence_number=trace_sequence_number,
+                addenda_record_indicator=0,
+            )
+        )
+
+    def _assert_batch_control(self, batch, count, entry_hash, debit, credit):
+        batch_control = batch.batch_control_record
+        self.assertEqual(
+            int(batch_control.get_field_value("entry_and_addenda_count")), count
+        )
+        self.assertEqual(int(batch_control.get_field_value("entry_hash")), entry_hash)
+        self.assertEqual(
+            int(batch_control.get_field_value("total_debit_amount")), debit
+        )
+        self.assertEqual(
+            int(batch_control.get_field_value("total_credit_amount")), credit
+        )
+
+    def test_batch_control_totals_update_incrementally(self):
+        batch = ACHBatch(
+            BatchHeaderRecordType(
+                company_name="Test Company",
+                company_identification="0912",
+                company_entry_description="Various",
+                odfi_identification="12345678",
+                batch_number=1,
+            ),
+        )
+        batch.add_transaction(self._make_entry(22, 100, 1))
+        self._assert_batch_control(batch, 1, 1234567, 0, 100)
+
+        batch.add_transaction(self._make_entry(27, 250, 2))
+        self._assert_batch_control(batch, 2, 2469134, 250, 100)
+
+        batch.transactions[0].entry.set_field_value("amount", 400)
+        self._assert_batch_control(batch, 2, 2469134, 250, 400)
+
+        batch.transactions[0].entry.set_field_values(
+            transaction_code=27, rdfi_routing="112345678"
+        )
+        self._assert_batch_control(batch, 2, 12469134, 650, 0)
+
+        batch.transactions[1].add_addenda(
+            AddendaRecordType("Info", entry_detail_sequence_number=2)
+        )
+        self._assert_batch_control(batch, 3, 12469134, 650, 0)
+
+        removed = batch.remove_transaction_by_index(0)
+        self._assert_batch_control(batch, 2, 1234567, 250, 0)
+
+        removed.entry.set_field_value("amount", 1)
+        self._assert_batch_control(batch, 2, 1234567, 250, 0)
+        self.assertEqual(
+            batch.get_control_totals(),
+            sum((x.get_control_totals() for x in batch.transactions), ControlTotals()),
+        )
+
+    def test_parsed_batch_control_kept_until_change(self):
+        ach_file_contents = ACHFileContentsParser(test_file).process_ach_file_contents()
+        batch = ach_file_contents.batches[0]
+        parsed_batch_control = batch.batch_control_record
+        self.assertIs(batch.batch_control_record, parsed_batch_control)
+
+        batch.transactions[0].entry.set_field_value("amount", 2000)
+        self.assertIsNot(batch.batch_control_record, parsed_batch_control)
+        self._assert_batch_control(batch, 4, 37014587, 15000, 3213)
+
+    def test_control_records_follow_fields_edits(self):
+        ach_file_contents = ACHFileContentsParser(test_file).process_ach_file_contents()
+        batch = ach_file_contents.batches[0]
+        self._assert_batch_control(batch, 4, 37014587, 15000, 2213)
+        file_debit_amount = int(
+            ach_file_contents.file_control_record.get_field_value("total_debit_amount")
+        )
+
+        entry = batch.transactions[0].entry
+        entry.fields["amount"].value = 2000
+        self._assert_batch_control(batch, 4, 37014587, 15000, 3213)
+        entry.fields["rdfi_routing"].cleaned_value = "112345678"
+        self._assert_batch_control(batch, 4, 35903476, 15000, 3213)
+
+        file_control = ach_file_contents.file_control_record
+        self.assertEqual(int(file_control.get_field_value("entry_hash")), 35903476)
+        self.assertEqual(int(file_control.get_field_value("total_credit_amount")), 3213)
+        self.assertEqual(
+            int(file_control.get_field_value("total_debit_amount")),
+            file_debit_amount,
+        )
+
+    def test_file_control_updates_from_batch_changes(self):
+        ach_file_contents = ACHFileContentsParser(test_file).process_ach_file_contents()
+        parsed_file_control = ach_file_contents.file_control_record
+        self.assertIs(ach_file_contents.file_control_record, parsed_file_control)
+
+        batch = ach_file_contents.batches[0]
+        batch.add_transaction(self._make_entry(22, 100, 9))
+        file_control = ach_file_contents.file_control_record
+        self.assertIsNot(file_control, parsed_file_control)
+        self.assertEqual(
+            int(file_control.get_field_value("entry_and_addenda_count")),
+            int(parsed_file_control.get_field_value("entry_and_addenda_count")) + 1,
+        )
+
+        batch.transactions[-1].entry.set_field_value("amount", 250)
+        file_control = ach_file_contents.file_control_record
+        for field_name in (
+            "entry_and_addenda_count",
+            "entry_hash",
+            "total_debit_amount",
+            "total_credit_amount",
+        ):
+            self.assertEqual(
+                int(file_control.get_field_value(field_name)),
+                sum(
+                    int(x.batch_control_record.get_field_value(field_name))
+                    for x in ach_file_contents.batches
+                ),
+            )
+
+        ach_file_contents.remove_batch_by_index(0)
+        self.assertEqual(ach_file_contents.get_control_totals(), ControlTotals())
+        self.assertEqual(
+            int(
+                ach_file_contents.file_control_record.get_field_value(
+                    "entry_and_addenda_count"
+                )
+            ),
+            0,
+        )
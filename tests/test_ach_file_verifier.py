@@ -0,0 +1,98 @@
+"""Tests file_verifier.py"""
+
+import io
+from unittest import TestCase
+
+from ach.files import ControlTotalMismatch, verify_controls
+from tests import test_file
+
+
+class TestVerifyControls(TestCase):
+    def test_verify_controls_consistent_file(self):
+        self.assertEqual(verify_controls(io.StringIO(test_file)), [])
+        self.assertEqual(verify_controls(io.BytesIO(test_file.encode("ascii"))), [])
+
+    def test_verify_controls_mismatched_entry(self):
+        bad_file = test_file.replace(
+            "622123232318123123123        0000001213",
+            "622123232318123123123        0000001214",
+        )
+        self.assertEqual(
+            verify_controls(io.StringIO(bad_file)),
+            [ControlTotalMismatch(0, "total_credit_amount", 2214, 2213)],
+        )
+
+    def test_verify_controls_mismatched_batch_control(self):
+        lines = test_file.splitlines()
+        lines[6] = lines[6][:4] + "000005" + lines[6][10:]
+        self.assertEqual(
+            verify_controls(io.StringIO("\n".join(lines))),
+            [
+                ControlTotalMismatch(0, "entry_and_addenda_count", 4, 5),
+                ControlTotalMismatch(None, "entry_and_addenda_count", 5, 4),
+            ],
+        )
+
+    def test_verify_controls_mismatched_file_control(self):
+        lines = test_file.splitlines()
+        lines[7] = lines[7][:1] + "000002000002" + lines[7][13:]
+        self.assertEqual(
+            verify_controls(io.StringIO("\n".join(lines))),
+            [
+                ControlTotalMismatch(None, "batch_count", 1, 2),
+                ControlTotalMismatch(None, "block_count", 1, 2),
+            ],
+        )
+
+    def test_verify_controls_reports_each_batch(self):
+        lines = test_file.splitlines()
+        second_batch = list(lines[1:7])
+        second_batch[1] = second_batch[1].replace("1000", "1001", 1)
+        self.assertEqual(
+            verify_controls(
+                io.StringIO(
+                    "\n".join([lines[0]] + lines[1:7] + second_batch + lines[7:])
+                )
+            ),
+            [
+                ControlTotalMismatch(1, "total_credit_amount", 2214, 2213),
+                ControlTotalMismatch(None, "entry_and_addenda_count", 8, 4),
+                ControlTotalMismatch(None, "entry_hash", 74029174, 37014587),
+                ControlTotalMismatch(None, "total_debit_amount", 30000, 15000),
+                ControlTotalMismatch(None, "total_credit_amount", 4426, 2213),
+                ControlTotalMismatch(None, "batch_count", 2, 1),
+                ControlTotalMismatch(None, "block_count", 2, 1),
+            ],
+        )
+
+    def test_verify_controls_missing_control_records(self):
+        lines = test_file.splitlines()
+        missing_totals = [
+            ControlTotalMismatch(0, "entry_and_addenda_count", 4, None),
+            ControlTotalMismatch(0, "entry_hash", 37014587, None),
+            ControlTotalMismatch(0, "total_debit_amount", 15000, None),
+            ControlTotalMismatch(0, "total_credit_amount", 2213, None),
+        ]
+        self.assertEqual(
+            verify_controls(io.StringIO("\n".join(lines[:6] + lines[7:]))),
+            missing_totals
+            + [
+                ControlTotalMismatch(None, "entry_and_addenda_count", 0, 4),
+                ControlTotalMismatch(None, "entry_hash", 0, 37014587),
+                ControlTotalMismatch(None, "total_debit_amount", 0, 15000),
+                ControlTotalMismatch(None, "total_credit_amount", 0, 2213),
+                ControlTotalMismatch(None, "batch_count", 0, 1),
+            ],
+        )
+        self.assertEqual(
+            verify_controls(io.StringIO("\n".join(lines[:1] + lines[2:6]))),
+            missing_totals
+            + [
+                ControlTotalMismatch(None, "entry_and_addenda_count", 0, None),
+                ControlTotalMismatch(None, "entry_hash", 0, None),
+                ControlTotalMismatch(None, "total_debit_amount", 0, None),
+                ControlTotalMismatch(None, "total_credit_amount", 0, None),
+                ControlTotalMismatch(None, "batch_count", 0, None),
+                ControlTotalMismatch(None, "block_count", 1, None),
+            ],
+        )
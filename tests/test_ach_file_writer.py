@@ -0,0 +1,84 @@
+"""Tests ACH stream writer."""
+
+from io import StringIO
+from unittest import TestCase
+
+from ach.files import (
+    ACHFileBuilder,
+    ACHStreamWriter,
+    NoBatchForTransactionError,
+    verify_controls,
+)
+from ach.files.file_writer import ACHStreamWriterClosedError
+from tests import BlankPaddedOriginIdTestMixin
+
+file_settings = {
+    "destination_routing": "012345678",
+    "origin_id": "102345678",
+    "destination_name": "YOUR BANK",
+    "origin_name": "YOUR FINANCIAL INSTITUTION",
+    "file_creation_date": "220101",
+    "file_creation_time": "1200",
+}
+batch_settings = {
+    "company_name": "YOUR COMPANY",
+    "company_identification": "1234567890",
+    "company_entry_description": "Test",
+    "effective_entry_date": "220102",
+}
+entry_dicts = [
+    {
+        "transaction_code": 22,
+        "rdfi_routing": "123456789",
+        "rdfi_account_number": "65656565",
+        "amount": "300",
+        "individual_name": "Janey Test",
+    },
+    {
+        "transaction_code": 27,
+        "rdfi_routing": "023456789",
+        "rdfi_account_number": "45656565",
+        "amount": "7000",
+        "individual_name": "Mackey Shawnderson",
+        "addendas": [{"payment_related_information": "Where's my money"}],
+    },
+]
+
+
+class TestACHStreamWriter(BlankPaddedOriginIdTestMixin, TestCase):
+    def _build(self, batch_count=2):
+        b = ACHFileBuilder(**file_settings)
+        for _ in range(batch_count):
+            b.add_batch(**dict(batch_settings))
+            b.add_entries_and_addendas(
+                [dict(x, addendas=list(x.get("addendas", []))) for x in entry_dicts]
+            )
+        return b.render(line_break="\r\n", end="\r\n")
+
+    def _write(self, batch_count=2):
+        stream = StringIO()
+        with ACHStreamWriter(
+            stream, line_break="\r\n", end="\r\n", **file_settings
+        ) as w:
+            for _ in range(batch_count):
+                w.add_batch(**dict(batch_settings))
+                w.add_entries_and_addendas(
+                    [dict(x, addendas=list(x.get("addendas", []))) for x in entry_dicts]
+                )
+        return stream.getvalue()
+
+    def test_stream_writer_matches_builder(self):
+        for batch_count in (0, 1, 2, 3):
+            self.assertEqual(self._write(batch_count), self._build(batch_count))
+
+    def test_stream_writer_controls_verify(self):
+        stream = StringIO(self._write(3))
+        self.assertEqual(verify_controls(stream, line_break="\r\n"), [])
+
+    def test_stream_writer_errors(self):
+        w = ACHStreamWriter(StringIO(), **file_settings)
+        with self.assertRaises(NoBatchForTransactionError):
+            w.add_entry_and_addenda(**entry_dicts[0])
+        w.close()
+        with self.assertRaises(ACHStreamWriterClosedError):
+            w.add_batch(**dict(batch_settings))
@@ -0,0 +1,173 @@
+"""Tests columnar views of ACH file records."""
+
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+from ach.constants import TransactionCode
+from ach.files import ACHFileBuilder, ACHFileContentsParser, columnar
+from ach.files.columnar import (
+    NumpyNotInstalledError,
+    compute_batch_control_totals,
+    compute_file_control_totals,
+    get_record_dtype,
+    read_entry_integer_columns,
+    read_entry_records,
+    read_records,
+)
+from ach.record_types import EntryDetailRecordType
+from tests import BlankPaddedOriginIdTestMixin, test_file
+
+test_file_bytes = test_file.encode("ascii")
+
+
+def get_parsed_entries():
+    return [
+        x
+        for x in ACHFileContentsParser(test_file, lazy=True).process_records_list()
+        if isinstance(x, EntryDetailRecordType)
+    ]
+
+
+def build_file():
+    b = ACHFileBuilder(
+        destination_routing="012345678",
+        origin_id="102345678",
+        destination_name="YOUR BANK",
+        origin_name="YOUR FINANCIAL INSTITUTION",
+    )
+    for i, transaction_codes in enumerate(
+        [
+            [TransactionCode.CHECKING_CREDIT, TransactionCode.CHECKING_DEBIT] * 3,
+            [],
+            [TransactionCode.SAVINGS_DEBIT, TransactionCode.SAVINGS_CREDIT] * 7,
+        ]
+    ):
+        b.add_batch(
+            company_name="YOUR COMPANY",
+            company_identification="1234567890",
+            company_entry_description="Test",
+        )
+        b.add_entries_and_addendas(
+            [
+                {
+                    "transaction_code": transaction_code,
+                    "rdfi_routing": "{}2345678{}".format(i + 1, j % 10),
+                    "rdfi_account_number": "65656565",
+                    "amount": 100 * j + i,
+                    "individual_name": "Janey Test",
+                    "addendas": [{"payment_related_information": "Thanks"}] * (j % 3),
+                }
+                for j, transaction_code in enumerate(transaction_codes)
+            ]
+        )
+    return b.ach_file_contents
+
+
+class ControlTotalsTestMixin(BlankPaddedOriginIdTestMixin):
+    def test_control_totals_match_object_path(self):
+        ach_file_contents = build_file()
+        for line_break in ("\n", "\r\n"):
+            buffer = ach_file_contents.render_bytes(line_break=line_break)
+            self.assertEqual(
+                compute_batch_control_totals(buffer, line_break),
+                [x.get_control_totals() for x in ach_file_contents.batches],
+            )
+            self.assertEqual(
+                compute_file_control_totals(buffer, line_break),
+                ach_file_contents.get_control_totals(),
+            )
+
+    def test_control_totals_of_parsed_file(self):
+        ach_file_contents = ACHFileContentsParser(
+            test_file, lazy=True
+        ).process_ach_file_contents()
+        self.assertEqual(
+            compute_file_control_totals(test_file_bytes),
+            ach_file_contents.get_control_totals(),
+        )
+
+    def test_control_totals_entries_outside_of_batch(self):
+        lines = test_file.splitlines()
+        buffer = "\n".join([lines[0]] + lines[2:]).encode("ascii")
+        with self.assertRaises(ValueError):
+            compute_batch_control_totals(buffer)
+
+
+@skipUnless(columnar.np is not None, "NumPy is not installed")
+class TestNumpyControlTotals(ControlTotalsTestMixin, TestCase):
+    pass
+
+
+class TestControlTotalsWithoutNumpy(ControlTotalsTestMixin, TestCase):
+    def setUp(self) -> None:
+        patcher = patch.object(columnar, "np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return super().setUp()
+
+
+@skipUnless(columnar.np is not None, "NumPy is not installed")
+class TestNumpyColumns(TestCase):
+    def test_record_dtype_offsets(self):
+        dtype = get_record_dtype()
+        self.assertEqual(dtype.itemsize, 94)
+        self.assertEqual(dtype.fields["amount"][1], 29)
+        self.assertEqual(dtype.fields["amount"][0].itemsize, 10)
+
+    def test_read_records_is_zero_copy(self):
+        buffer = bytearray(test_file_bytes)
+        records = read_records(buffer)
+        self.assertEqual(len(records), len(test_file.splitlines()))
+        buffer[0:1] = b"X"
+        self.assertEqual(records["record_type_code"][0], b"X")
+
+    def test_read_entry_records(self):
+        entries = read_entry_records(test_file_bytes)
+        parsed_entries = get_parsed_entries()
+        self.assertEqual(len(entries), len(parsed_entries))
+        for entry, parsed_entry in zip(entries, parsed_entries):
+            for field_name, value in parsed_entry.get_field_values().items():
+                self.assertEqual(entry[field_name].decode("ascii"), value)
+
+    def test_read_entry_records_line_breaks(self):
+        crlf_file = test_file.replace("\n", "\r\n").encode("ascii")
+        self.assertEqual(
+            len(read_entry_records(crlf_file, "\r\n")),
+            len(read_entry_records(test_file_bytes)),
+        )
+        with self.assertRaises(ValueError):
+            read_entry_records(crlf_file)
+        with self.assertRaises(ValueError):
+            read_entry_records(test_file_bytes[1:])
+
+    def test_read_entry_integer_columns(self):
+        columns = read_entry_integer_columns(test_file_bytes)
+        parsed_entries = get_parsed_entries()
+        for field_name in columnar.ENTRY_INTEGER_FIELD_NAMES:
+            self.assertEqual(
+                columns[field_name].tolist(),
+                [int(x.get_field_value(field_name)) for x in parsed_entries],
+            )
+
+
+class TestColumnsWithoutNumpy(TestCase):
+    def setUp(self) -> None:
+        patcher = patch.object(columnar, "np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return super().setUp()
+
+    def test_structured_arrays_need_numpy(self):
+        with self.assertRaises(NumpyNotInstalledError):
+            read_entry_records(test_file_bytes)
+
+    def test_read_entry_integer_columns_fallback(self):
+        columns = read_entry_integer_columns(test_file_bytes)
+        parsed_entries = get_parsed_entries()
+        for field_name in columnar.ENTRY_INTEGER_FIELD_NAMES:
+            self.assertEqual(
+                columns[field_name].tolist(),
+                [int(x.get_field_value(field_name)) for x in parsed_entries],
+            )
+        with self.assertRaises(ValueError):
+            read_entry_integer_columns(test_file_bytes[1:])
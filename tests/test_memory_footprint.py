@@ -0,0 +1,61 @@
+"""Benchmarks memory footprint of records and transaction entries."""
+
+import tracemalloc
+from unittest import TestCase
+
+from ach.files import ACHTransactionEntry
+from ach.record_types import EntryDetailRecordType, FieldDefinition
+from ach.record_types.record_fields import Field
+
+ENTRY_COUNT = 2000
+# Bytes per transaction entry; was about 2100 with a dict of Fields per record,
+# about 1600 with __slots__ and about 770 with a list of cleaned values.
+MAX_BYTES_PER_ENTRY = 1000
+
+
+def make_transaction(i):
+    return ACHTransactionEntry(
+        EntryDetailRecordType(
+            transaction_code=22,
+            rdfi_routing="123456789",
+            rdfi_account_number="65656565",
+            amount=i,
+            individual_name="Janey Test",
+            trace_odfi_identifier="12345678",
+            trace_sequence_number=i,
+        )
+    )
+
+
+def measure_bytes_per_transaction(entry_count=ENTRY_COUNT):
+    tracemalloc.start()
+    try:
+        start_size = tracemalloc.get_traced_memory()[0]
+        transactions = [make_transaction(i) for i in range(entry_count)]
+        size = tracemalloc.get_traced_memory()[0] - start_size
+    finally:
+        tracemalloc.stop()
+    del transactions
+    return size / entry_count
+
+
+class TestMemoryFootprint(TestCase):
+    def test_instances_have_no_dict(self):
+        transaction = make_transaction(1)
+        field = transaction.entry.fields["amount"]
+        for obj in (transaction, transaction.entry, field, field.field_definition):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+
+    def test_bytes_per_transaction(self):
+        self.assertLess(measure_bytes_per_transaction(), MAX_BYTES_PER_ENTRY)
+
+    def test_field_without_original_value(self):
+        field_def = EntryDetailRecordType.field_definition_dict["amount"]
+        self.assertIsInstance(field_def, FieldDefinition)
+        self.assertEqual(Field(field_def, 100).original_value, 100)
+
+        self.addCleanup(setattr, Field, "retain_original_value", True)
+        Field.retain_original_value = False
+        field = Field(field_def, 100)
+        self.assertIsNone(field.original_value)
+        self.assertEqual(field.value, "0000000100")
@@ -3,10 +3,13 @@
 import datetime
 from unittest import TestCase
 
+from ach.constants import ValidationLevel
+
 from ach.record_types.record_fields import (
     Alignment,
     AlphaNumFieldType,
     BlankPaddedRoutingNumberFieldType,
+    CleanedValueCache,
     DateFieldType,
     EmptyRequiredFieldError,
     Field,
@@ -474,3 +477,130 @@ class TestTimeFieldType(TestCase):
         field_def = FieldDefinition("file_time", TimeFieldType, length=4)
         for case in cases:
             self.assertRaises(ValueMismatchesFieldTypeError, Field, field_def, case)
+
+
+class TestCleanMany(TestCase):
+    field_defs = [
+        FieldDefinition("amount", IntegerFieldType, length=10),
+        FieldDefinition("name", AlphaNumFieldType, length=10),
+        FieldDefinition("routing_num", BlankPaddedRoutingNumberFieldType, length=10),
+        FieldDefinition("file_date", DateFieldType, length=6, required=False),
+        FieldDefinition(
+            "file_time",
+            TimeFieldType,
+            length=4,
+            auto_correct_input=True,
+            default="1200",
+        ),
+    ]
+    values = [
+        ["300", 7000, "12345678901"],
+        ["Janey Test!", "Mackey Shawnderson", "é#", 42],
+        ["123456789", " 123456789", 12345678],
+        ["220101", "2022-01-02", None, "  "],
+        ["0930", None, "2022-01-02T13:45:00"],
+    ]
+
+    def test_clean_many_matches_get_cleaned_value(self):
+        for field_def, values in zip(self.field_defs, self.values):
+            for validation_level in ValidationLevel:
+                self.assertEqual(
+                    field_def.clean_many(values, validation_level),
+                    [field_def.get_cleaned_value(x, validation_level) for x in values],
+                )
+
+    def test_clean_many_invalid_values(self):
+        field_def = FieldDefinition("amount", IntegerFieldType, length=10)
+        with self.assertRaises(ValueMismatchesFieldTypeError) as context:
+            field_def.clean_many(["1", "2a", "3b"])
+        self.assertEqual(context.exception.value, "2a")
+        self.assertEqual(
+            field_def.clean_many(["1", "2a"], ValidationLevel.TRUSTED),
+            ["0000000001", "000000002a"],
+        )
+        with self.assertRaises(EmptyRequiredFieldError):
+            field_def.clean_many(["1", None])
+
+    def test_clean_many_applies_custom_fixed_length(self):
+        class CenteredAlphaNumFieldType(AlphaNumFieldType):
+            @classmethod
+            def apply_fixed_length(cls, input_string, length):
+                return input_string.center(length)[:length]
+
+        field_def = FieldDefinition("name", CenteredAlphaNumFieldType, length=6)
+        for validation_level in ValidationLevel:
+            self.assertEqual(
+                field_def.clean_many(["ab", "abcd"], validation_level),
+                ["  ab  ", " abcd "],
+            )
+
+    def test_alphanum_deletion_table(self):
+        self.assertEqual(
+            AlphaNumFieldType.correct_input("Janey Tést!\t#1"), "Janey Tst\t1"
+        )
+        self.assertEqual(
+            AlphaNumFieldType.correct_many(["#1", "é"], auto_correct_override=False),
+            ["#1", "é"],
+        )
+        self.assertIs(
+            AlphaNumFieldType.get_deletion_table(), DateFieldType.get_deletion_table()
+        )
+        self.assertIsNone(IntegerFieldType.get_deletion_table())
+
+
+class TestCleanedValueCache(TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(setattr, Field, "cleaned_value_cache", None)
+        Field.cleaned_value_cache = CleanedValueCache(maxsize=2)
+        self.cache = Field.cleaned_value_cache
+
+    def test_cache_hits_and_misses(self):
+        field_def = FieldDefinition("name", AlphaNumFieldType, length=10)
+        for _ in range(3):
+            self.assertEqual(Field(field_def, "Janey Test!").value, "Janey Test")
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 1))
+        self.assertEqual(len(self.cache), 1)
+        self.cache.clear()
+        self.assertEqual(
+            (self.cache.hits, self.cache.misses, len(self.cache)), (0, 0, 0)
+        )
+
+    def test_cache_evicts_least_recently_used(self):
+        field_def = FieldDefinition("amount", IntegerFieldType, length=10)
+        for value in ("1", "2", "1", "3", "1", "2"):
+            field_def.get_cleaned_value(value)
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 4))
+        self.assertEqual(len(self.cache), 2)
+        with self.assertRaises(ValueError):
+            CleanedValueCache(maxsize=0)
+
+    def test_cache_keys_on_definition_and_input_type(self):
+        field_def = FieldDefinition("amount", IntegerFieldType, length=10)
+        self.assertEqual(field_def.get_cleaned_value(1), "0000000001")
+        field_def.length = 5
+        self.assertEqual(field_def.get_cleaned_value(1), "00001")
+        self.assertEqual(
+            field_def.get_cleaned_value("1a", ValidationLevel.TRUSTED), "0001a"
+        )
+        with self.assertRaises(ValueMismatchesFieldTypeError):
+            field_def.get_cleaned_value("1a")
+        field_def.field_type = AlphaNumFieldType
+        self.assertEqual(field_def.get_cleaned_value(1), "1    ")
+        self.assertEqual(field_def.get_cleaned_value(1.0), "1.0  ")
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_cache_skips_time_dependent_and_invalid_input(self):
+        field_def = FieldDefinition(
+            "file_time",
+            TimeFieldType,
+            length=4,
+            auto_correct_input=True,
+            default="NOW",
+        )
+        Field(field_def)
+        Field(field_def, "now")
+        Field(field_def, "now")
+        with self.assertRaises(ValueMismatchesFieldTypeError):
+            Field(field_def, "hi")
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 4))
+        self.assertEqual(len(self.cache), 0)
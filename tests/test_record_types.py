@@ -1,7 +1,10 @@
 """Tests record_types.py and other subclasses of RecordType."""
 
 import datetime
-from unittest import TestCase
+import gc
+import pickle
+import weakref
+from unittest import TestCase, mock
 
 from ach.record_types import (
     AddendaRecordType,
@@ -14,7 +17,15 @@ from ach.record_types import (
     FileHeaderRecordType,
     IntegerFieldType,
     InvalidRecordSizeError,
+    InvalidRecordTypeParametersError,
+    RecordField,
+    RecordLayout,
+    RecordLinePattern,
     RecordType,
+    RecordTypeAggregateFieldCreationError,
+    ValueMismatchesFieldTypeError,
+    get_record_layout,
+    make_record_type_class,
 )
 
 
@@ -22,6 +33,20 @@ class TestRecordType(TestCase):
     def test_record_type_field_definitions_empty_length(self):
         RecordType({}, desired_record_size=0)
 
+    def test_record_type_keeps_field_definition_dict(self):
+        field_definition_dict = {
+            "record_code": FieldDefinition("record_code", IntegerFieldType, length=2)
+        }
+        record = RecordType(field_definition_dict, 2, record_code=3)
+        self.assertIs(record.field_definition_dict, field_definition_dict)
+        self.assertEqual(RecordType.field_definition_dict, {})
+        self.assertIs(
+            EntryDetailRecordType.get_record_layout().field_definition_dict,
+            EntryDetailRecordType.field_definition_dict,
+        )
+        with self.assertRaises(AttributeError):
+            record.field_definition_dict = {}
+
     def test_record_type_not_desired_size_empty(self):
         self.assertRaises(InvalidRecordSizeError, RecordType, {}, 1)
 
@@ -86,6 +111,46 @@ class TestRecordType(TestCase):
         )
         self.assertEqual(record_type.render_record_line(), "1he")
 
+    def test_record_type_render_line_cached_until_field_set(self):
+        record_type = RecordType(
+            {
+                "record_code": FieldDefinition(
+                    "record_code", IntegerFieldType, length=1, required=False
+                ),
+                "additional_field": FieldDefinition(
+                    "additional_field", AlphaNumFieldType, length=2, required=False
+                ),
+            },
+            desired_record_size=3,
+        )
+        rendered_line = record_type.render_record_line()
+        self.assertIs(record_type.render_record_line(), rendered_line)
+
+        record_type.set_field_value("record_code", 2)
+        self.assertEqual(record_type.render_record_line(), "2  ")
+        record_type.set_field_values(additional_field="hi")
+        self.assertEqual(record_type.render_record_line(), "2hi")
+        record_type.fields["additional_field"].value = "yo"
+        self.assertEqual(record_type.render_record_line(), "2yo")
+
+    def test_record_type_fields_are_bound_to_values(self):
+        entry_detail = EntryDetailRecordType(
+            22, "123456789", "123456", "100", "Testy Testface", "012345670000001"
+        )
+        amount_field = entry_detail.fields["amount"]
+        self.assertIsInstance(amount_field, RecordField)
+        self.assertIs(
+            amount_field.field_definition,
+            EntryDetailRecordType.field_definition_dict["amount"],
+        )
+        self.assertEqual(amount_field.value, "0000000100")
+
+        amount_field.value = 250
+        self.assertEqual(entry_detail.get_field_value("amount"), "0000000250")
+        with self.assertRaises(ValueMismatchesFieldTypeError):
+            amount_field.value = "2x"
+        self.assertEqual(entry_detail.render_record_line()[29:39], "0000000250")
+
 
 class TestFileHeaderRecordType(TestCase):
     def test_file_header(self):
@@ -140,6 +205,392 @@ class TestFileHeaderRecordType(TestCase):
         )
 
 
+class TestRecordLayout(TestCase):
+    def test_record_layout_offsets(self):
+        record_layout = EntryDetailRecordType.get_record_layout()
+        self.assertIsInstance(record_layout, RecordLayout)
+        self.assertEqual(record_layout.record_size, 94)
+        self.assertEqual(
+            record_layout.field_names,
+            tuple(EntryDetailRecordType.field_definition_dict.keys()),
+        )
+        self.assertEqual(record_layout["amount"].start, 29)
+        self.assertEqual(record_layout["amount"].end, 39)
+        self.assertEqual(record_layout["amount"].field_slice, slice(29, 39))
+        self.assertIs(record_layout["amount"].field_type, IntegerFieldType)
+        self.assertEqual(record_layout.slots[-1].end, 94)
+
+    def test_record_layout_is_cached_per_definition_dict(self):
+        self.assertIs(
+            EntryDetailRecordType.get_record_layout(),
+            get_record_layout(EntryDetailRecordType.field_definition_dict),
+        )
+        entry_detail = EntryDetailRecordType(
+            22, "123456789", "123456", "100", "Testy Testface", "012345670000001"
+        )
+        self.assertIs(
+            entry_detail.record_layout, EntryDetailRecordType.get_record_layout()
+        )
+
+    def test_record_layout_follows_definition_changes(self):
+        field_definition_dict = {
+            "a": FieldDefinition("A", IntegerFieldType, length=1),
+            "b": FieldDefinition("B", AlphaNumFieldType, length=1),
+        }
+        record_layout = get_record_layout(field_definition_dict)
+        self.assertIs(get_record_layout(field_definition_dict), record_layout)
+
+        del field_definition_dict["a"]
+        field_definition_dict["z"] = FieldDefinition("Z", IntegerFieldType, length=1)
+        record = RecordType(field_definition_dict, 2, z=3, b="x")
+        self.assertEqual(record.render_record_line(), "x3")
+
+        field_definition_dict["z"].length = 3
+        self.assertEqual(get_record_layout(field_definition_dict)["z"].end, 2)
+        self.assertEqual(
+            get_record_layout(field_definition_dict, refresh=True)["z"].end, 4
+        )
+        record = RecordType(field_definition_dict, 4, z=3, b="x")
+        self.assertEqual(record.render_record_line(), "x003")
+
+    def test_class_record_layout_checked_on_reassignment(self):
+        class TestRecordType(RecordType):
+            field_definition_dict = {
+                "a": FieldDefinition("A", IntegerFieldType, length=1),
+            }
+
+        class TestRecordSubType(TestRecordType):
+            pass
+
+        record_layout = TestRecordType.get_record_layout()
+        with mock.patch.object(
+            RecordLayout, "_get_signature", side_effect=AssertionError
+        ):
+            self.assertIs(TestRecordType.get_record_layout(), record_layout)
+            self.assertIs(
+                TestRecordType(desired_record_size=1, a=1).record_layout,
+                record_layout,
+            )
+            self.assertIs(
+                TestRecordType.from_raw_line("1").record_layout, record_layout
+            )
+
+        TestRecordType.field_definition_dict = {
+            "a": FieldDefinition("A", IntegerFieldType, length=1),
+            "b": FieldDefinition("B", AlphaNumFieldType, length=2),
+        }
+        self.assertEqual(TestRecordType.get_record_layout().record_size, 3)
+        self.assertEqual(
+            TestRecordType(desired_record_size=3, a=1, b="x").render_record_line(),
+            "1x ",
+        )
+        self.assertIs(
+            TestRecordType.field_definition_dict,
+            TestRecordType.get_record_layout().field_definition_dict,
+        )
+        self.assertEqual(TestRecordSubType.get_record_layout().record_size, 3)
+        self.assertEqual(len(record_layout), 1)
+
+    def test_record_layout_cache_drops_unused_layouts(self):
+        record_layout = get_record_layout(
+            {"a": FieldDefinition("A", IntegerFieldType, length=1)}
+        )
+        record_layout_ref = weakref.ref(record_layout)
+        del record_layout
+        gc.collect()
+        self.assertIsNone(record_layout_ref())
+
+    def test_record_layout_checks_keyword_arguments(self):
+        record_layout = EntryDetailRecordType.get_record_layout()
+        self.assertEqual(
+            record_layout.field_name_set, frozenset(record_layout.field_names)
+        )
+        with self.assertRaises(InvalidRecordTypeParametersError) as context:
+            EntryDetailRecordType(
+                22, "123456789", "123456", "100", "Testy Testface", not_a_field=1
+            )
+        self.assertEqual(context.exception.invalid_kwargs, ["not_a_field"])
+
+    def test_record_layout_split_line(self):
+        entry_detail = EntryDetailRecordType(
+            22, "123456789", "123456", "100", "Testy Testface", "012345670000001"
+        )
+        values = entry_detail.record_layout.split_line(
+            entry_detail.render_record_line()
+        )
+        self.assertEqual(values, list(entry_detail.get_field_values().values()))
+
+
+class TestRecordLinePattern(TestCase):
+    raw_line = (
+        "622123456789123456           0000000100               "
+        "Testy Testface          1012345670000001"
+    )
+
+    def test_line_pattern_groups(self):
+        line_pattern = EntryDetailRecordType.get_record_layout().get_line_pattern()
+        self.assertIsInstance(line_pattern, RecordLinePattern)
+        self.assertIs(
+            EntryDetailRecordType.get_record_layout().get_line_pattern(), line_pattern
+        )
+        match = line_pattern.regex.fullmatch(self.raw_line)
+        self.assertEqual(match.group("amount"), "0000000100")
+        self.assertEqual(match.span("amount"), (29, 39))
+        self.assertEqual(line_pattern.unchecked_indexes, ())
+
+        file_header_pattern = (
+            FileHeaderRecordType.get_record_layout().get_line_pattern()
+        )
+        self.assertIn("record_size", file_header_pattern.group_names)
+
+    def test_from_record_line_matches_instantiation(self):
+        entry_detail = EntryDetailRecordType.from_record_line(self.raw_line)
+        self.assertEqual(entry_detail.render_record_line(), self.raw_line)
+        self.assertEqual(
+            entry_detail.get_field_values(),
+            EntryDetailRecordType(
+                **dict(
+                    zip(
+                        entry_detail.record_layout.field_names,
+                        entry_detail.record_layout.split_line(self.raw_line),
+                    )
+                )
+            ).get_field_values(),
+        )
+        self.assertEqual(
+            EntryDetailRecordType.from_record_line(
+                self.raw_line.encode("ascii")
+            ).get_field_values(),
+            entry_detail.get_field_values(),
+        )
+
+    def test_from_record_line_falls_back_to_fields(self):
+        entry_detail = EntryDetailRecordType.from_record_line(
+            self.raw_line.replace("Testy Testface  ", "Testy Testface #")
+        )
+        self.assertEqual(entry_detail.render_record_line(), self.raw_line)
+        with self.assertRaises(RecordTypeAggregateFieldCreationError):
+            EntryDetailRecordType.from_record_line(
+                self.raw_line.replace("0000000100", "00000001X0")
+            )
+
+    def test_from_record_line_checks_fields_without_pattern(self):
+        batch_header_line = BatchHeaderRecordType(
+            company_name="Teeniest Fintech",
+            company_identification="1234567890",
+            company_entry_description="Payday",
+            effective_entry_date="221023",
+            odfi_identification="12345678",
+            batch_number=2,
+        ).render_record_line()
+        batch_header = BatchHeaderRecordType.from_record_line(batch_header_line)
+        self.assertNotEqual(
+            BatchHeaderRecordType.get_record_layout()
+            .get_line_pattern()
+            .unchecked_indexes,
+            (),
+        )
+        self.assertEqual(batch_header.render_record_line(), batch_header_line)
+        with self.assertRaises(RecordTypeAggregateFieldCreationError):
+            BatchHeaderRecordType.from_record_line(
+                batch_header_line.replace("221023", "221399")
+            )
+
+    def test_line_pattern_follows_field_type_changes(self):
+        field_def = FieldDefinition("Code", IntegerFieldType, length=2)
+        record_layout = get_record_layout({"code": field_def})
+        self.assertIsNone(record_layout.get_line_pattern().regex.fullmatch("ab"))
+        self.addCleanup(setattr, field_def, "field_type", IntegerFieldType)
+        field_def.field_type = AlphaNumFieldType
+        self.assertIsNotNone(record_layout.get_line_pattern().regex.fullmatch("ab"))
+
+    def test_line_pattern_skips_overridden_corrections(self):
+        class UpperAlphaNumFieldType(AlphaNumFieldType):
+            @classmethod
+            def correct_input(cls, input_string, auto_correct_override=None):
+                return (
+                    super().correct_input(input_string, auto_correct_override).upper()
+                )
+
+        class UpperRecordType(RecordType):
+            field_definition_dict = {
+                "name": FieldDefinition("Name", UpperAlphaNumFieldType, length=5)
+            }
+
+        self.assertIsNone(UpperAlphaNumFieldType.get_fixed_width_pattern(5))
+        record = UpperRecordType.from_record_line("abc  ")
+        self.assertEqual(record.render_record_line(), "ABC  ")
+
+
+class TestLazyRecordType(TestCase):
+    raw_line = (
+        "622123456789123456           0000000100               "
+        "Testy Testface #        1012345670000001"
+    )
+
+    def test_from_raw_line_renders_raw_line_untouched(self):
+        entry_detail = EntryDetailRecordType.from_raw_line(self.raw_line)
+        self.assertIsInstance(entry_detail, EntryDetailRecordType)
+        self.assertEqual(entry_detail.render_record_line(), self.raw_line)
+
+    def test_from_raw_line_creates_fields_on_access(self):
+        entry_detail = EntryDetailRecordType.from_raw_line(self.raw_line)
+        self.assertEqual(entry_detail._values, [None] * 11)
+        self.assertEqual(entry_detail.get_field_value("amount"), "0000000100")
+        self.assertEqual(entry_detail._values.count(None), 10)
+        self.assertEqual(entry_detail.render_record_line(), self.raw_line)
+
+        values = entry_detail.get_field_values()
+        self.assertEqual(
+            list(values), list(EntryDetailRecordType.field_definition_dict)
+        )
+        self.assertEqual(values["individual_name"], "Testy Testface        ")
+        self.assertEqual(entry_detail.render_record_line(), self.raw_line)
+
+    def test_from_raw_line_set_field_value_renders_fields(self):
+        entry_detail = EntryDetailRecordType.from_raw_line(self.raw_line)
+        entry_detail.set_field_value("amount", 200)
+        self.assertEqual(
+            entry_detail.render_record_line(),
+            "622123456789123456           0000000200               "
+            "Testy Testface          1012345670000001",
+        )
+
+    def test_from_raw_line_fields_access_renders_fields(self):
+        entry_detail = EntryDetailRecordType.from_raw_line(self.raw_line)
+        entry_detail.fields["amount"].cleaned_value = "0000000300"
+        self.assertEqual(
+            entry_detail.render_record_line(),
+            "622123456789123456           0000000300               "
+            "Testy Testface          1012345670000001",
+        )
+
+    def test_fields_writes_notify_change_observer(self):
+        changes = []
+
+        class Observer:
+            def on_record_change(self, record, field_name):
+                changes.append((record, field_name))
+
+        entry_detail = EntryDetailRecordType.from_raw_line(self.raw_line)
+        entry_detail.change_observer = Observer()
+        entry_detail.fields["amount"].cleaned_value = "0000000300"
+        entry_detail.fields["individual_name"].value = "Renamed"
+        self.assertEqual(
+            changes, [(entry_detail, "amount"), (entry_detail, "individual_name")]
+        )
+
+        changes.clear()
+        entry_detail.fields = entry_detail.fields
+        self.assertEqual(
+            [x[1] for x in changes], list(EntryDetailRecordType.field_definition_dict)
+        )
+
+    def test_from_raw_line_validates_on_access(self):
+        entry_detail = EntryDetailRecordType.from_raw_line(
+            self.raw_line.replace("0000000100", "00000001X0")
+        )
+        self.assertEqual(entry_detail.get_field_value("transaction_code"), "22")
+        with self.assertRaises(ValueMismatchesFieldTypeError):
+            entry_detail.get_field_value("amount")
+        with self.assertRaises(RecordTypeAggregateFieldCreationError):
+            entry_detail.get_field_values()
+
+    def test_from_raw_line_short_line_is_processed_immediately(self):
+        entry_detail = EntryDetailRecordType.from_raw_line(self.raw_line[:-10])
+        self.assertNotIn(None, entry_detail._values)
+        self.assertEqual(len(entry_detail.render_record_line()), 94)
+
+
+class TestRecordTypeCodegen(TestCase):
+    field_definition_dict = {
+        "record_code": FieldDefinition("record_code", IntegerFieldType, length=1),
+        "bank-note": FieldDefinition(
+            "bank note", AlphaNumFieldType, length=5, required=False
+        ),
+        "amount": FieldDefinition("amount", IntegerFieldType, length=4, default=0),
+    }
+
+    def test_generated_class_matches_generic_record_type(self):
+        record_type_class = make_record_type_class(
+            self.field_definition_dict, class_name="BankRecordType"
+        )
+        self.assertEqual(record_type_class.__name__, "BankRecordType")
+        record = record_type_class(desired_record_size=10, record_code=7, amount=12)
+        generic_record = RecordType(
+            self.field_definition_dict, 10, record_code=7, amount=12
+        )
+        self.assertEqual(record.render_record_line(), "7     0012")
+        self.assertEqual(
+            record.render_record_line(), generic_record.render_record_line()
+        )
+
+    def test_generated_field_properties(self):
+        record_type_class = make_record_type_class(self.field_definition_dict)
+        record = record_type_class(desired_record_size=10, record_code=7)
+        self.assertEqual(record.amount, "0000")
+        record.amount = 300
+        self.assertEqual(record.amount, "0300")
+        self.assertEqual(record.render_record_line(), "7     0300")
+        self.assertFalse(hasattr(record_type_class, "bank-note"))
+
+    def test_generated_class_follows_replaced_field_definitions(self):
+        field_definition_dict = dict(self.field_definition_dict)
+        field_definition_dict["amount"] = FieldDefinition(
+            "amount", AlphaNumFieldType, length=4
+        )
+        record_type_class = make_record_type_class(field_definition_dict)
+        record_type_class(desired_record_size=10, record_code=7, amount="ab")
+
+        field_definition_dict["amount"] = FieldDefinition(
+            "amount", IntegerFieldType, length=4, default=0
+        )
+        field_definition_dict["bank-note"] = FieldDefinition(
+            "bank note", AlphaNumFieldType, length=5
+        )
+        with self.assertRaises(RecordTypeAggregateFieldCreationError) as context:
+            record_type_class(desired_record_size=10, record_code=7, amount="ab")
+        self.assertEqual(context.exception.failed_keys, ["bank-note", "amount"])
+
+        single_field_dict = {"a": FieldDefinition("A", IntegerFieldType, length=1)}
+        single_field_class = make_record_type_class(single_field_dict)
+        single_field_dict["a"] = FieldDefinition("A", AlphaNumFieldType, length=1)
+        self.assertEqual(
+            single_field_class(desired_record_size=1, a="x").render_record_line(),
+            "x",
+        )
+
+    def test_generated_class_aggregates_errors(self):
+        record_type_class = make_record_type_class(self.field_definition_dict)
+        with self.assertRaises(RecordTypeAggregateFieldCreationError) as context:
+            record_type_class(desired_record_size=10, amount="abc")
+        self.assertEqual(context.exception.failed_keys, ["record_code", "amount"])
+
+    def test_generated_class_other_definition_dict(self):
+        record_type_class = make_record_type_class(self.field_definition_dict)
+        record = record_type_class(
+            {"a": FieldDefinition("a", IntegerFieldType, length=2)}, 2, a=3
+        )
+        self.assertEqual(record.render_record_line(), "03")
+
+    def test_concrete_record_types_are_specialized(self):
+        entry_detail = EntryDetailRecordType(
+            transaction_code=22,
+            rdfi_routing="123456789",
+            rdfi_account_number="65656565",
+            amount=300,
+            individual_name="Janey Test",
+            trace_number="123456780000001",
+        )
+        self.assertIn("generate_values_list", EntryDetailRecordType.__dict__)
+        self.assertEqual(entry_detail.amount, "0000000300")
+        unpickled = pickle.loads(pickle.dumps(entry_detail))
+        self.assertIs(type(unpickled), EntryDetailRecordType)
+        self.assertEqual(
+            unpickled.render_record_line(), entry_detail.render_record_line()
+        )
+
+
 class TestBatchHeaderRecordType(TestCase):
     def test_batch_header(self):
         batch_header = BatchHeaderRecordType(
@@ -0,0 +1,237 @@
+"""Tests strict, fast and trusted validation levels."""
+
+import datetime
+import os
+import time
+from unittest import TestCase, mock, skipUnless
+
+from ach.constants import RECORD_SIZE, ValidationLevel
+from ach.files import ACHFileBuilder, ACHFileContentsParser
+from ach.record_types import EntryDetailRecordType, FieldDefinition
+from ach.record_types.record_fields import (
+    AlphaNumFieldType,
+    DateFieldType,
+    IntegerFieldType,
+    ValueMismatchesFieldTypeError,
+)
+from ach.record_types.record_layout import RecordLayout
+from tests import BlankPaddedOriginIdTestMixin, test_file
+
+# Benchmarks only run with ACH_BENCHMARKS=1 set, for example:
+# ACH_BENCHMARKS=1 python -m unittest tests.test_validation_levels -v
+run_benchmarks = bool(os.environ.get("ACH_BENCHMARKS"))
+BENCHMARK_ENTRY_COUNT = 20000
+
+file_settings = {
+    "destination_routing": "012345678",
+    "origin_id": "102345678",
+    "destination_name": "YOUR BANK",
+    "origin_name": "YOUR FINANCIAL INSTITUTION",
+    "file_creation_date": "220101",
+    "file_creation_time": "1200",
+}
+batch_settings = {
+    "company_name": "YOUR COMPANY",
+    "company_identification": "1234567890",
+    "company_entry_description": "Test",
+    "effective_entry_date": "220102",
+}
+
+
+def make_entry_dict(i):
+    return {
+        "transaction_code": 22,
+        "rdfi_routing": "123456789",
+        "rdfi_account_number": "65656565",
+        "amount": i,
+        "individual_name": "Janey Test",
+    }
+
+
+def build(validation_level, entry_count=20):
+    b = ACHFileBuilder(validation_level=validation_level, **file_settings)
+    b.add_batch(**dict(batch_settings))
+    b.add_entries_and_addendas([make_entry_dict(i) for i in range(entry_count)])
+    return b.render()
+
+
+def count_is_valid_calls(function, *args, field_definitions=None):
+    with mock.patch.object(
+        FieldDefinition, "is_valid", autospec=True, side_effect=FieldDefinition.is_valid
+    ) as is_valid:
+        function(*args)
+    if field_definitions is None:
+        return is_valid.call_count
+    return sum(x.args[0] in field_definitions for x in is_valid.call_args_list)
+
+
+class TestFieldValidationLevels(TestCase):
+    def test_fast_matches_strict(self):
+        field_def = FieldDefinition("name", AlphaNumFieldType, 10)
+        for value in ("Janey Test", "J@ney", "x" * 12, 12):
+            self.assertEqual(
+                field_def.get_cleaned_value(value, ValidationLevel.FAST),
+                field_def.get_cleaned_value(value),
+            )
+
+    def test_fast_falls_back_to_strict(self):
+        field_def = FieldDefinition("amount", IntegerFieldType, 10)
+        with self.assertRaises(ValueMismatchesFieldTypeError):
+            field_def.get_cleaned_value("12a", ValidationLevel.FAST)
+
+    def test_trusted_skips_validation(self):
+        field_def = FieldDefinition("amount", IntegerFieldType, 10)
+        self.assertEqual(
+            field_def.get_cleaned_value("12a", ValidationLevel.TRUSTED), "000000012a"
+        )
+
+    def test_validation_calls_per_level(self):
+        field_def = FieldDefinition("amount", IntegerFieldType, 10)
+        calls = {
+            x: count_is_valid_calls(field_def.get_cleaned_value, "12", x)
+            for x in ValidationLevel
+        }
+        self.assertEqual(
+            calls,
+            {
+                ValidationLevel.STRICT: 1,
+                ValidationLevel.FAST: 0,
+                ValidationLevel.TRUSTED: 0,
+            },
+        )
+
+    def test_trusted_converts_auto_date_input(self):
+        field_def = FieldDefinition("date", DateFieldType, 6)
+        self.assertEqual(
+            field_def.get_cleaned_value("NOW", ValidationLevel.TRUSTED),
+            datetime.date.today().strftime("%y%m%d"),
+        )
+
+    def test_fast_applies_custom_corrections(self):
+        class UpperAlphaNumFieldType(AlphaNumFieldType):
+            @classmethod
+            def correct_input(cls, input_string, auto_correct_override=None):
+                return (
+                    super().correct_input(input_string, auto_correct_override).upper()
+                )
+
+        field_def = FieldDefinition("name", UpperAlphaNumFieldType, 5)
+        for validation_level in (ValidationLevel.STRICT, ValidationLevel.FAST):
+            self.assertEqual(
+                field_def.get_cleaned_value("abc", validation_level), "ABC  "
+            )
+
+    def test_is_character_class_match(self):
+        self.assertTrue(IntegerFieldType.is_character_class_match("0123"))
+        self.assertTrue(IntegerFieldType.is_character_class_match(""))
+        self.assertFalse(IntegerFieldType.is_character_class_match("01 3"))
+        self.assertFalse(DateFieldType.is_character_class_match("220101"))
+
+
+class TestRecordValidationLevels(BlankPaddedOriginIdTestMixin, TestCase):
+    def test_record_uses_validation_level_on_set(self):
+        record = EntryDetailRecordType(
+            validation_level=ValidationLevel.TRUSTED,
+            trace_number="123456780000001",
+            **make_entry_dict(300),
+        )
+        self.assertIs(record.validation_level, ValidationLevel.TRUSTED)
+        record.set_field_value("amount", "12a")
+        self.assertEqual(record.get_field_value("amount"), "000000012a")
+
+        with self.assertRaises(ValueMismatchesFieldTypeError):
+            EntryDetailRecordType(
+                trace_number="123456780000001", **make_entry_dict(300)
+            ).set_field_value("amount", "12a")
+
+    def test_parser_validation_levels(self):
+        expected_lines = [x for x in test_file.splitlines() if x != "9" * RECORD_SIZE]
+        for validation_level in ValidationLevel:
+            for lazy in (False, True):
+                records_list = ACHFileContentsParser(
+                    test_file, lazy=lazy, validation_level=validation_level
+                ).process_records_list()
+                self.assertEqual(
+                    [x.render_record_line() for x in records_list], expected_lines
+                )
+                self.assertEqual(
+                    {x.validation_level for x in records_list}, {validation_level}
+                )
+
+    def test_trusted_parser_skips_validation(self):
+        def parse(validation_level):
+            ACHFileContentsParser(
+                test_file, validation_level=validation_level
+            ).process_records_list()
+
+        with mock.patch.object(
+            RecordLayout,
+            "get_line_pattern",
+            autospec=True,
+            side_effect=RecordLayout.get_line_pattern,
+        ) as get_line_pattern:
+            self.assertEqual(count_is_valid_calls(parse, ValidationLevel.TRUSTED), 0)
+            self.assertEqual(get_line_pattern.call_count, 0)
+            parse(ValidationLevel.STRICT)
+            self.assertGreater(get_line_pattern.call_count, 0)
+
+    def test_trusted_parser_keeps_invalid_values(self):
+        line = test_file.splitlines()[2]
+        line = line[:29] + "00000abcde" + line[39:]
+        record = ACHFileContentsParser.convert_line_to_record_type(
+            line, EntryDetailRecordType, validation_level=ValidationLevel.TRUSTED
+        )
+        self.assertEqual(record.get_field_value("amount"), "00000abcde")
+        with self.assertRaises(Exception):
+            ACHFileContentsParser.convert_line_to_record_type(
+                line, EntryDetailRecordType
+            ).get_field_value("amount")
+
+
+class TestBuilderValidationLevels(BlankPaddedOriginIdTestMixin, TestCase):
+    def test_builder_validation_levels_render_same_file(self):
+        rendered = {build(x) for x in ValidationLevel}
+        self.assertEqual(len(rendered), 1)
+
+    def test_builder_validation_calls_per_level(self):
+        # Control records are computed by the builder and always checked.
+        entry_field_definitions = list(
+            EntryDetailRecordType.field_definition_dict.values()
+        )
+        calls = {
+            x: count_is_valid_calls(build, x, field_definitions=entry_field_definitions)
+            for x in ValidationLevel
+        }
+        self.assertGreater(calls[ValidationLevel.STRICT], 20)
+        self.assertLess(calls[ValidationLevel.FAST], calls[ValidationLevel.STRICT])
+        self.assertEqual(calls[ValidationLevel.TRUSTED], 0)
+
+
+@skipUnless(run_benchmarks, "set ACH_BENCHMARKS=1 to run benchmarks")
+class TestValidationLevelBenchmark(BlankPaddedOriginIdTestMixin, TestCase):
+    def time(self, function, *args):
+        start = time.perf_counter()
+        function(*args)
+        return time.perf_counter() - start
+
+    def test_builder_benchmark(self):
+        for validation_level in ValidationLevel:
+            print(
+                "build {} entries, {}: {:.3f}s".format(
+                    BENCHMARK_ENTRY_COUNT,
+                    validation_level.value,
+                    self.time(build, validation_level, BENCHMARK_ENTRY_COUNT),
+                )
+            )
+
+    def test_parser_benchmark(self):
+        file_str = build(ValidationLevel.TRUSTED, BENCHMARK_ENTRY_COUNT)
+        for validation_level in ValidationLevel:
+            parser = ACHFileContentsParser(file_str, validation_level=validation_level)
+            print(
+                "parse {} entries, {}: {:.3f}s".format(
+                    BENCHMARK_ENTRY_COUNT,
+                    validation_level.value,
+                    self.time(parser.process_records_list),
+                )
+            )